@@ -0,0 +1,335 @@
+"""Registro central de assets (imágenes, sonidos, música).
+
+- Indexa una sola vez los directorios de assets (nombre de archivo -> ruta, el primer
+  directorio de SEARCH_DIRS gana), en vez de que cada módulo pruebe sus propias rutas.
+- Carga cada archivo una sola vez con el convert()/convert_alpha() adecuado; si se cargó
+  antes de existir la ventana, se convierte la primera vez que se pide con ventana.
+- Comparte las fuentes por tamaño entre todas las pantallas.
+- Memoriza variantes escaladas por (asset, tamaño) con desalojo LRU, para no llamar a
+  pygame.transform.scale en cada frame.
+- Si existe el atlas horneado (core.atlas), las imágenes y sus máscaras salen de él
+  (memory map) en vez de decodificar cada archivo; una imagen modificada después del
+  bake se carga del archivo (con un aviso) hasta volver a hornear.
+- prefetch() decodifica por adelantado, en un pool de hilos, lo que usarán las escenas
+  siguientes; collect() pasa al hilo principal lo ya decodificado para el convert(), y
+  load()/sound() esperan lo que todavía no terminó en vez de volver a cargarlo.
+"""
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pygame
+
+from core.settings import PROJECT_ROOT, ASSETS_DIR, ASSETS_IMG_DIR, PREFETCH_WORKERS
+
+# Orden de búsqueda: primero images/ (carpeta actual del proyecto), luego ubicaciones heredadas
+SEARCH_DIRS = [
+    os.path.join(PROJECT_ROOT, 'images'),
+    os.path.join(PROJECT_ROOT, 'images', 'img'),
+    ASSETS_IMG_DIR,
+    os.path.join(ASSETS_DIR, 'sounds'),
+    os.path.join(PROJECT_ROOT, 'sounds'),
+    PROJECT_ROOT,
+]
+
+# Máximo de variantes escaladas/transformadas en memoria
+MAX_VARIANTS = 64
+
+
+def _display_ready() -> bool:
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+
+class AssetManager:
+    def __init__(self, search_dirs: list[str] | None = None, max_variants: int = MAX_VARIANTS,
+                 use_atlas: bool = True) -> None:
+        self.search_dirs = list(search_dirs or SEARCH_DIRS)
+        self.max_variants = max_variants
+        self.use_atlas = use_atlas
+        self._atlas = None
+        self._index: dict[str, str] | None = None
+        self._images: dict[tuple[str, bool], pygame.Surface] = {}
+        self._unconverted: set[tuple[str, bool]] = set()
+        # Máscaras de colisión por superficie (y el nombre en el atlas de las que salen de él)
+        self._masks: dict[pygame.Surface, pygame.mask.Mask] = {}
+        self._atlas_names: dict[pygame.Surface, str] = {}
+        # Imágenes del atlas que cambiaron desde el bake (ya avisadas)
+        self._stale: set[str] = set()
+        self._sounds: dict[str, pygame.mixer.Sound | None] = {}
+        self._fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self._variants: OrderedDict = OrderedDict()
+        # Precarga en curso: ruta -> (tipo, alpha, future) y el pool que la decodifica
+        self._pending: dict[str, tuple[str, bool, Future]] = {}
+        self._pool: ThreadPoolExecutor | None = None
+        self.mask_builds = 0  # máscaras calculadas con from_surface (ni cacheadas ni del atlas), para core.profiler
+
+    # -------- Índice de rutas ---------
+    def _build_index(self) -> dict[str, str]:
+        index: dict[str, str] = {}
+        for d in self.search_dirs:
+            try:
+                with os.scandir(d) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            index.setdefault(entry.name, entry.path)
+            except OSError:
+                continue
+        if self.use_atlas and self._atlas is None:
+            from core.atlas import open_atlas
+            self._atlas = open_atlas()
+        return index
+
+    def files(self, *extensions: str) -> dict[str, str]:
+        """Archivos indexados {nombre: ruta}, opcionalmente filtrados por extensión."""
+        if self._index is None:
+            self._index = self._build_index()
+        exts = tuple(e.lower() for e in extensions)
+        return {n: p for n, p in self._index.items() if not exts or n.lower().endswith(exts)}
+
+    def register(self, path: str) -> None:
+        """Agrega al índice un archivo creado después de indexar (p.ej. un WAV generado)."""
+        if self._index is None:
+            self._index = self._build_index()
+        self._index.setdefault(os.path.basename(path), path)
+
+    def path(self, *names: str) -> str | None:
+        """Ruta del primer nombre que exista en el índice (o None)."""
+        if self._index is None:
+            self._index = self._build_index()
+        for name in names:
+            p = self._index.get(name)
+            if p:
+                return p
+        return None
+
+    # -------- Imágenes ---------
+    def load(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """Carga una imagen por ruta una sola vez (convertida si ya hay ventana)."""
+        key = (path, alpha)
+        img = self._images.get(key)
+        if img is not None and key not in self._unconverted:
+            return img
+        if self._index is None:
+            self._index = self._build_index()
+        name = os.path.basename(path)
+        if self._from_atlas(path):
+            # Desde el atlas horneado: formato de píxel elegido en el bake, sin decodificar
+            img = self._atlas.image(name)
+            self._atlas_names[img] = name
+        else:
+            if img is None:
+                img = self._take_prefetched(path, 'image')
+            if img is None:
+                img = pygame.image.load(path)
+            if _display_ready():
+                img = img.convert_alpha() if alpha else img.convert()
+        if _display_ready():
+            self._unconverted.discard(key)
+        else:
+            self._unconverted.add(key)
+        self._images[key] = img
+        return img
+
+    def mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Máscara de colisión de una superficie, calculada (o tomada del atlas) una sola vez."""
+        mask = self._masks.get(surface)
+        if mask is None:
+            name = self._atlas_names.get(surface)
+            if name is not None:
+                mask = self._atlas.mask(name)
+            else:
+                mask = pygame.mask.from_surface(surface)
+                self.mask_builds += 1
+            self._masks[surface] = mask
+        return mask
+
+    def image(self, *names: str, alpha: bool = True, placeholder: tuple | None = None) -> pygame.Surface | None:
+        """Imagen del primer nombre disponible.
+
+        `placeholder=((w, h), color)` devuelve un rectángulo de ese color si no hay archivo.
+        """
+        p = self.path(*names)
+        if p:
+            try:
+                return self.load(p, alpha)
+            except pygame.error as e:
+                print(f"[Assets] No se pudo cargar '{p}': {e}")
+        if placeholder is None:
+            return None
+        size, color = placeholder
+        surf = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        surf.fill(color)
+        return surf
+
+    def scaled(self, source: str | pygame.Surface, size: tuple[int, int], smooth: bool = False,
+               alpha: bool = True) -> pygame.Surface | None:
+        """Variante escalada memorizada de un asset (por nombre) o de una superficie ya cargada."""
+        size = (int(size[0]), int(size[1]))
+        key = (source, size, smooth)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self._variants.move_to_end(key)
+            return variant
+        surf = self.image(source, alpha=alpha) if isinstance(source, str) else source
+        if surf is None:
+            return None
+        if surf.get_size() == size:
+            variant = surf
+        elif smooth and surf.get_bitsize() >= 24:
+            variant = pygame.transform.smoothscale(surf, size)
+        else:
+            variant = pygame.transform.scale(surf, size)
+        self._variants[key] = variant
+        if len(self._variants) > self.max_variants:
+            self._variants.popitem(last=False)
+        return variant
+
+    def scaled_to_width(self, source: str | pygame.Surface, width: int, smooth: bool = True,
+                        alpha: bool = True) -> pygame.Surface | None:
+        """Variante escalada a un ancho dado conservando la proporción."""
+        surf = self.image(source, alpha=alpha) if isinstance(source, str) else source
+        if surf is None or surf.get_width() == 0:
+            return surf
+        height = int(surf.get_height() * width / surf.get_width())
+        return self.scaled(surf, (width, height), smooth=smooth, alpha=alpha)
+
+    # -------- Fuentes ---------
+    def font(self, size: int, name: str | None = None) -> pygame.font.Font:
+        """Fuente (la por defecto de pygame si no hay `name`) creada una sola vez por tamaño."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self._fonts[key] = pygame.font.Font(self.path(name) if name else None, size)
+        return font
+
+    # -------- Audio ---------
+    def sound(self, *names: str) -> pygame.mixer.Sound | None:
+        """Efecto de sonido cargado una sola vez (None si no hay mixer o archivo)."""
+        if not pygame.mixer.get_init():
+            return None
+        p = self.path(*names)
+        if not p:
+            return None
+        if p not in self._sounds:
+            snd = self._take_prefetched(p, 'sound')
+            if snd is not None:
+                self._sounds[p] = snd
+                return snd
+            try:
+                self._sounds[p] = pygame.mixer.Sound(p)
+            except Exception as e:
+                print(f"[Assets] No se pudo cargar sonido '{p}': {e}")
+                self._sounds[p] = None
+        return self._sounds[p]
+
+    # -------- Precarga en segundo plano ---------
+    def prefetch(self, images=(), opaque=(), sounds=(), stream=()) -> int:
+        """Empieza a decodificar en el pool de hilos lo que se usará más adelante.
+
+        Cada entrada es un nombre o una tupla de nombres alternativos (como en image()):
+        `images` con transparencia, `opaque` sin ella (fondos), `sounds` efectos (si el
+        mixer ya está iniciado) y `stream` archivos que se reproducen en streaming (la
+        música): de esos solo se leen los bytes para que el sistema los tenga en caché.
+        Lo que ya está cargado, en el atlas o en curso se omite. Retorna cuántos se encolaron.
+        """
+        if self._index is None:
+            self._index = self._build_index()
+        grupos = [('image', True, images), ('image', False, opaque), ('stream', False, stream)]
+        if pygame.mixer.get_init():
+            grupos.append(('sound', False, sounds))
+        encolados = 0
+        for kind, alpha, entries in grupos:
+            for entry in entries:
+                p = self.path(*((entry,) if isinstance(entry, str) else entry))
+                if p is None or p in self._pending or self._loaded(p, kind, alpha):
+                    continue
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix='assets')
+                self._pending[p] = (kind, alpha, self._pool.submit(_DECODERS[kind], p))
+                encolados += 1
+        return encolados
+
+    def _loaded(self, path: str, kind: str, alpha: bool) -> bool:
+        if kind == 'sound':
+            return path in self._sounds
+        if kind == 'image':
+            return (path, alpha) in self._images or self._from_atlas(path)
+        return False
+
+    def _from_atlas(self, path: str) -> bool:
+        """True si la imagen sale del atlas: es la que indexó el bake y no cambió desde entonces."""
+        if self._atlas is None:
+            return False
+        name = os.path.basename(path)
+        if name not in self._atlas or self._index.get(name) != path:
+            return False
+        if not self._atlas.fresh(name, path):
+            if name not in self._stale:
+                self._stale.add(name)
+                print(f"[Atlas] '{name}' cambió desde el bake; se carga del archivo (make bake para actualizar)")
+            return False
+        return True
+
+    def _take_prefetched(self, path: str, kind: str):
+        """Resultado de la precarga de `path` (espera si sigue en curso) o None si no hay/falló."""
+        pending = self._pending.get(path)
+        if pending is None or pending[0] != kind:
+            return None
+        del self._pending[path]
+        try:
+            return pending[2].result()
+        except Exception as e:
+            print(f"[Assets] Falló la precarga de '{path}': {e}")
+            return None
+
+    def collect(self) -> int:
+        """En el hilo principal: convierte y guarda lo que la precarga ya terminó. Retorna cuántos."""
+        listos = [p for p, (_, _, future) in self._pending.items() if future.done()]
+        for p in listos:
+            kind, alpha, _ = self._pending[p]
+            if kind == 'image':
+                try:
+                    self.load(p, alpha)
+                except pygame.error as e:
+                    print(f"[Assets] No se pudo cargar '{p}': {e}")
+            elif kind == 'sound':
+                self.sound(os.path.basename(p))
+            else:
+                self._take_prefetched(p, kind)
+        return len(listos)
+
+    def prefetching(self) -> bool:
+        """Si queda precarga sin recoger."""
+        return bool(self._pending)
+
+    def clear(self) -> None:
+        """Libera cachés (las rutas indexadas se conservan)."""
+        for _, _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._images.clear()
+        self._unconverted.clear()
+        self._sounds.clear()
+        self._fonts.clear()
+        self._variants.clear()
+        self._masks.clear()
+        self._atlas_names.clear()
+
+
+def _read_bytes(path: str) -> int:
+    with open(path, 'rb') as f:
+        return len(f.read())
+
+
+# Decodificación en los hilos del pool (sin tocar la ventana: el convert() va en el principal)
+_DECODERS = {
+    'image': pygame.image.load,
+    'sound': pygame.mixer.Sound,
+    'stream': _read_bytes,
+}
+
+
+# Instancia compartida; el índice se construye en el primer uso, no al importar
+assets = AssetManager()
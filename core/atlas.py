@@ -0,0 +1,301 @@
+"""Atlas de sprites horneado (bake offline) y su carga por memory map.
+
+`python -m core.atlas` empaqueta las imágenes del proyecto en un único buffer RGBA sin
+comprimir y escribe, en el mismo archivo binario, el rect de cada sprite, el formato de
+píxel elegido para él y su máscara de colisión precomputada. En tiempo de ejecución el
+archivo se abre con mmap y las superficies se crean directamente sobre ese buffer
+(pygame.image.frombuffer), sin decodificar PNG/JPG/GIF.
+
+Sin comprimir, cada sprite ocupa ancho*alto*4 bytes. Para los sprites chicos (unos KB) eso
+vale la pena: no hay que decodificarlos ni calcular sus máscaras. Un fondo opaco de
+pantalla completa, en cambio, pesa 1.9 MB crudo contra unos 170 KB de PNG, y en un
+almacenamiento lento leerlo cuesta más que decodificarlo; tampoco necesita máscara. Las
+imágenes opacas de más de MAX_OPAQUE_PIXELS píxeles quedan fuera del atlas y se cargan
+del archivo con el cargador normal. El ancho del atlas es el que deja menos área vacía.
+
+Cada entrada recuerda la fecha de modificación y el tamaño del archivo original al
+hornear: si la imagen cambió después, fresh() da False y el registro de assets la carga
+del archivo (los píxeles y la máscara horneados quedarían viejos) hasta volver a hornear.
+
+Formatos por asset:
+    opaco     -> convert()                       (sin canal alfa)
+    colorkey  -> convert() + set_colorkey(RLE)   (alfa solo 0/255: blit RLE rápido)
+    alfa      -> convert_alpha()                 (alfa parcial, p.ej. bordes suavizados)
+
+Disposición del archivo (little endian):
+    cabecera  <4sHHHHI: MAGIC, versión, ancho, alto, cantidad de sprites, offset de píxeles
+    entradas  por sprite: <H largo del nombre, nombre utf-8, <HHHHB3BIIQQ x, y, w, h, formato,
+              colorkey RGB, cantidad de tramos de máscara, offset de los tramos,
+              mtime (ns) y tamaño en bytes del archivo original
+    máscaras  tramos <HHH (y, x, largo) de píxeles con alfa > 127, por fila
+    píxeles   RGBA ancho*alto*4, alineado a 16 bytes
+"""
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+from core.settings import BAKED_ATLAS_PATH
+
+MAGIC = b"SIAT"
+VERSION = 2
+FORMAT_OPAQUE = 0
+FORMAT_COLORKEY = 1
+FORMAT_ALPHA = 2
+FORMAT_NAMES = {FORMAT_OPAQUE: "opaco", FORMAT_COLORKEY: "colorkey", FORMAT_ALPHA: "alfa"}
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp")
+COLORKEY = (255, 0, 255)
+MASK_THRESHOLD = 127  # mismo umbral que pygame.mask.from_surface
+PADDING = 1
+MAX_OPAQUE_PIXELS = 128 * 128  # opacas más grandes (fondos): fuera del atlas
+MAX_ATLAS_WIDTH = 4096
+
+_HEADER = struct.Struct("<4sHHHHI")
+_ENTRY = struct.Struct("<HHHHB3BIIQQ")
+_RUN = struct.Struct("<HHH")
+# bytes de alfa -> 1 si supera el umbral de máscara, 0 si no
+_MASK_TABLE = bytes(1 if a > MASK_THRESHOLD else 0 for a in range(256))
+
+
+# -------- Bake ---------
+def _source_stamp(path: str) -> tuple[int, int]:
+    """(mtime en ns, tamaño) del archivo original; (0, 0) si no se puede leer."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+def _rgba(surf: pygame.Surface) -> pygame.Surface:
+    """Copia RGBA de la imagen (respeta colorkey de GIF/BMP como transparencia)."""
+    out = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+    out.fill((0, 0, 0, 0))
+    out.blit(surf, (0, 0))
+    return out
+
+
+def _classify(pixels: bytes) -> int:
+    alpha = pixels[3::4]
+    if alpha.count(255) == len(alpha):
+        return FORMAT_OPAQUE
+    if alpha.count(255) + alpha.count(0) == len(alpha):
+        # Solo alfa total/nulo: colorkey, si el color clave no aparece en píxeles visibles
+        key = bytes(COLORKEY) + b"\xff"
+        if all(pixels[i:i + 4] != key for i in range(0, len(pixels), 4)):
+            return FORMAT_COLORKEY
+    return FORMAT_ALPHA
+
+
+def _mask_runs(pixels: bytes, width: int, height: int, fmt: int) -> list[tuple[int, int, int]]:
+    """Tramos horizontales (y, x, largo) de píxeles sólidos, fila por fila."""
+    if fmt == FORMAT_OPAQUE:
+        return [(y, 0, width) for y in range(height)]
+    solid = pixels[3::4].translate(_MASK_TABLE)
+    runs = []
+    for y in range(height):
+        row = solid[y * width:(y + 1) * width]
+        x = row.find(1)
+        while x != -1:
+            end = row.find(0, x)
+            if end == -1:
+                end = width
+            runs.append((y, x, end - x))
+            x = row.find(1, end)
+    return runs
+
+
+def _pack(sizes: dict[str, tuple[int, int]]) -> tuple[int, int, dict[str, tuple[int, int]]]:
+    """Empaquetado por estantes con el ancho (potencia de 2 o el sprite más ancho) de menor área."""
+    widest = max([w + PADDING for w, _ in sizes.values()], default=1)
+    widths = [widest] + [1 << n for n in range(widest.bit_length(), MAX_ATLAS_WIDTH.bit_length())]
+    return min((_pack_shelves(sizes, width) for width in widths), key=lambda p: (p[0] * p[1], p[0]))
+
+
+def _pack_shelves(sizes: dict[str, tuple[int, int]], width: int) -> tuple[int, int, dict[str, tuple[int, int]]]:
+    """De más alto a más bajo, llenando filas de `width` de izquierda a derecha."""
+    positions: dict[str, tuple[int, int]] = {}
+    x = y = shelf_h = 0
+    for name in sorted(sizes, key=lambda n: (-sizes[n][1], n)):
+        w, h = sizes[name]
+        if x + w > width:
+            x, y, shelf_h = 0, y + shelf_h + PADDING, 0
+        positions[name] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return width, y + shelf_h, positions
+
+
+def bake(sources: dict[str, str], out_path: str = BAKED_ATLAS_PATH) -> dict[str, int]:
+    """Hornea las imágenes {nombre: ruta} en un atlas binario; retorna {nombre: formato} de las horneadas."""
+    images: dict[str, pygame.Surface] = {}
+    decoded: dict[str, tuple[bytes, int]] = {}
+    stamps: dict[str, tuple[int, int]] = {}
+    for name, path in sources.items():
+        try:
+            stamp = _source_stamp(path)
+            surf = _rgba(pygame.image.load(path))
+        except pygame.error as e:
+            print(f"[Atlas] Se omite '{path}': {e}")
+            continue
+        w, h = surf.get_size()
+        pixels = pygame.image.tobytes(surf, "RGBA")
+        fmt = _classify(pixels)
+        if fmt == FORMAT_OPAQUE and w * h > MAX_OPAQUE_PIXELS:
+            print(f"[Atlas] Se deja fuera '{name}' ({w}x{h} opaca: se carga del archivo)")
+            continue
+        images[name], decoded[name], stamps[name] = surf, (pixels, fmt), stamp
+    sizes = {name: surf.get_size() for name, surf in images.items()}
+    width, height, positions = _pack(sizes)
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+
+    entries = []
+    runs_blob = bytearray()
+    formats: dict[str, int] = {}
+    for name in sorted(images):
+        surf = images[name]
+        w, h = surf.get_size()
+        pixels, fmt = decoded[name]
+        if fmt == FORMAT_COLORKEY:
+            # Los píxeles transparentes toman el color clave (se ven así tras convert())
+            keyed = bytearray(pixels)
+            for i in range(3, len(keyed), 4):
+                if keyed[i] == 0:
+                    keyed[i - 3:i] = bytes(COLORKEY)
+            surf = pygame.image.frombuffer(bytes(keyed), (w, h), "RGBA")
+        atlas.blit(surf, positions[name], special_flags=pygame.BLEND_RGBA_MAX)
+        runs = _mask_runs(pixels, w, h, fmt)
+        entries.append((name, positions[name], (w, h), fmt, len(runs), len(runs_blob), stamps[name]))
+        for run in runs:
+            runs_blob += _RUN.pack(*run)
+        formats[name] = fmt
+
+    table = bytearray()
+    for name, (x, y), (w, h), fmt, n_runs, runs_offset, (mtime, size) in entries:
+        encoded = name.encode("utf-8")
+        table += struct.pack("<H", len(encoded)) + encoded
+        table += _ENTRY.pack(x, y, w, h, fmt, *COLORKEY, n_runs, runs_offset, mtime, size)
+    runs_start = _HEADER.size + len(table)
+    # Los offsets de máscara se guardan relativos al bloque de tramos; el de píxeles, absoluto
+    pixels_offset = (runs_start + len(runs_blob) + 15) // 16 * 16
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, width, height, len(entries), pixels_offset))
+        f.write(table)
+        f.write(runs_blob)
+        f.write(b"\0" * (pixels_offset - runs_start - len(runs_blob)))
+        f.write(pygame.image.tobytes(atlas, "RGBA"))
+    os.replace(tmp_path, out_path)
+    return formats
+
+
+# -------- Runtime ---------
+class SpriteAtlas:
+    """Atlas horneado abierto por mmap: superficies y máscaras sin decodificar imágenes."""
+
+    def __init__(self, path: str = BAKED_ATLAS_PATH) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        magic, version, width, height, count, pixels_offset = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"'{path}' no es un atlas horneado válido (versión {VERSION})")
+        self.entries: dict[str, tuple[pygame.Rect, int, tuple, int, int]] = {}
+        self.stamps: dict[str, tuple[int, int]] = {}
+        offset = _HEADER.size
+        for _ in range(count):
+            (name_len,) = struct.unpack_from("<H", self._mm, offset)
+            offset += 2
+            name = bytes(self._mm[offset:offset + name_len]).decode("utf-8")
+            offset += name_len
+            x, y, w, h, fmt, kr, kg, kb, n_runs, runs_offset, mtime, size = _ENTRY.unpack_from(self._mm, offset)
+            offset += _ENTRY.size
+            self.entries[name] = (pygame.Rect(x, y, w, h), fmt, (kr, kg, kb), n_runs, runs_offset)
+            self.stamps[name] = (mtime, size)
+        self._runs_start = offset
+        # Superficie que apunta directamente a las páginas mapeadas (sin copia ni decodificación)
+        self._pixels = pygame.image.frombuffer(
+            memoryview(self._mm)[pixels_offset:pixels_offset + width * height * 4], (width, height), "RGBA")
+        self._run_masks: dict[int, pygame.mask.Mask] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def fresh(self, name: str, path: str) -> bool:
+        """True si el sprite está en el atlas y `path` no cambió (mtime y tamaño) desde el bake."""
+        stamp = self.stamps.get(name)
+        return stamp is not None and stamp == _source_stamp(path)
+
+    def image(self, name: str) -> pygame.Surface:
+        """Sprite con el formato horneado (convertido si ya existe la ventana)."""
+        rect, fmt, key, _, _ = self.entries[name]
+        sub = self._pixels.subsurface(rect)
+        if not (pygame.display.get_init() and pygame.display.get_surface() is not None):
+            return sub
+        if fmt == FORMAT_OPAQUE:
+            return sub.convert()
+        if fmt == FORMAT_COLORKEY:
+            surf = sub.convert()
+            surf.set_colorkey(key, pygame.RLEACCEL)
+            return surf
+        return sub.convert_alpha()
+
+    def mask(self, name: str) -> pygame.mask.Mask:
+        """Máscara precomputada en el bake, armada a partir de sus tramos por fila."""
+        rect, _, _, n_runs, runs_offset = self.entries[name]
+        mask = pygame.mask.Mask(rect.size)
+        start = self._runs_start + runs_offset
+        for y, x, length in _RUN.iter_unpack(self._mm[start:start + n_runs * _RUN.size]):
+            run = self._run_masks.get(length)
+            if run is None:
+                run = self._run_masks[length] = pygame.mask.Mask((length, 1), fill=True)
+            mask.draw(run, (x, y))
+        return mask
+
+    def close(self) -> None:
+        self._pixels = None
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # aún hay superficies usando el buffer; se libera al cerrar el proceso
+        self._file.close()
+
+
+def open_atlas(path: str = BAKED_ATLAS_PATH) -> SpriteAtlas | None:
+    """Abre el atlas horneado si existe y es válido (None si no, para caer a las imágenes sueltas)."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return SpriteAtlas(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[Atlas] Ignorando '{path}': {e}")
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    from core.assets import AssetManager
+
+    args = sys.argv[1:] if argv is None else argv
+    out_path = args[0] if args else BAKED_ATLAS_PATH
+    # Índice sin atlas: hornear siempre desde las imágenes originales
+    sources = AssetManager(use_atlas=False).files(*IMAGE_EXTENSIONS)
+    formats = bake(sources, out_path)
+    for name in sorted(formats):
+        print(f"  {name:<28} {FORMAT_NAMES[formats[name]]}")
+    print(f"[Atlas] {len(formats)} sprites -> {out_path} ({os.path.getsize(out_path) // 1024} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Detección de colisiones por lotes.
+
+- Fase amplia: barrido en x sobre arreglos (`aabb_pairs`); solo las cajas cuyo rango
+  horizontal puede tocarse pasan a la prueba AABB completa, sin comparar todos contra todos.
+- Fase estrecha: overlap de máscaras cacheadas por superficie (assets.mask), nunca
+  recalculadas por llamada, y solo en los pares que sobreviven a la fase amplia.
+
+ProjectileManager.contacts usa `aabb_pairs` para resolver todos los impactos de un tick
+en un lote; `collide_any` cubre un solo objeto contra un grupo (el jugador y los enemigos).
+"""
+import numpy as np
+import pygame
+
+from core.assets import assets
+
+# Hasta este producto de tamaños conviene la prueba densa (todos contra todos, vectorizada):
+# ordenar y buscar cuesta más que comparar pocas cajas
+DENSE_PAIRS = 2048
+
+
+def mask_of(obj) -> pygame.mask.Mask | None:
+    """Máscara de un objeto: la suya si la tiene, si no la cacheada de su imagen."""
+    mask = getattr(obj, 'mask', None)
+    if mask is not None:
+        return mask
+    image = getattr(obj, 'image', None)
+    return assets.mask(image) if image is not None else None
+
+
+def _overlaps(a, a_mask, b, b_mask) -> bool:
+    """Prueba exacta entre dos objetos cuyos rects ya se tocan (rects si falta alguna máscara)."""
+    if a_mask is None or b_mask is None:
+        return True
+    return a_mask.overlap(b_mask, (b.rect.x - a.rect.x, b.rect.y - a.rect.y)) is not None
+
+
+def aabb_pairs(a_boxes: np.ndarray, b_boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pares (i, j) de cajas (x, y, w, h) de `a_boxes` y `b_boxes` cuyos AABB se tocan.
+
+    Barrido en x: `b` se ordena por borde izquierdo y, para cada caja de `a`, searchsorted
+    acota las de `b` cuyo borde izquierdo cae en (izquierda - ancho máximo de b, derecha).
+    Solo esos candidatos pasan la prueba AABB completa. Con pocos pares posibles
+    (DENSE_PAIRS) se prueban todos directamente. Los pares salen ordenados por i.
+    """
+    ax, ay, aw, ah = (a_boxes[:, k] for k in range(4))
+    bx, by, bw, bh = (b_boxes[:, k] for k in range(4))
+    if len(a_boxes) * len(b_boxes) <= DENSE_PAIRS:
+        hit = ((bx < (ax + aw)[:, None]) & (bx + bw > ax[:, None])
+               & (by < (ay + ah)[:, None]) & (by + bh > ay[:, None]))
+        return np.nonzero(hit)
+    order = np.argsort(bx, kind="stable")
+    left = bx[order]
+    lo = np.searchsorted(left, ax - bw.max(), side="right")
+    hi = np.searchsorted(left, ax + aw, side="left")
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if not total:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    # Rango [lo, hi) de cada i desplegado en un solo arreglo de candidatos
+    i = np.repeat(np.arange(len(a_boxes)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    j = order[np.repeat(lo, counts) + offsets]
+    keep = (bx[j] + bw[j] > ax[i]) & (by[j] < ay[i] + ah[i]) & (by[j] + bh[j] > ay[i])
+    return i[keep], j[keep]
+
+
+def collide_any(obj, group: list) -> int:
+    """Índice del primer objeto de `group` que toca a `obj` (-1 si ninguno).
+
+    Para un solo objeto contra un grupo no vale la pena el barrido: basta la poda por AABB
+    con collidelistall antes de comparar máscaras.
+    """
+    if not group:
+        return -1
+    obj_mask = mask_of(obj)
+    for j in obj.rect.collidelistall([o.rect for o in group]):
+        other = group[j]
+        if _overlaps(obj, obj_mask, other, mask_of(other)):
+            return j
+    return -1
@@ -1,7 +1,6 @@
-import os
 import pygame
 
-from core.settings import PROJECT_ROOT, ASSETS_IMG_DIR
+from core.assets import assets
 
 # Fallback color if no background image
 FALLBACK_BG_COLOR = (10, 10, 25)
@@ -14,13 +13,9 @@ class Drawing:
         self.background = self._load_background()
 
     def _load_background(self) -> pygame.Surface:
-        images_dir = os.path.join(PROJECT_ROOT, 'images')
-        root_bg = os.path.join(images_dir, 'background.png')
-        legacy_bg = os.path.join(images_dir, 'img', 'background.png')
-        assets_bg = os.path.join(ASSETS_IMG_DIR, 'background.png')
-        for path in (root_bg, legacy_bg, assets_bg):
-            if os.path.exists(path):
-                return pygame.image.load(path).convert()
+        bg = assets.image('background.png', alpha=False)
+        if bg is not None:
+            return bg
         # Crear fondo placeholder
         surf = pygame.Surface(self.window.get_size())
         surf.fill(FALLBACK_BG_COLOR)
@@ -28,12 +23,8 @@ class Drawing:
 
     def draw_scene(self, game, player, enemies):
         """Dibuja la escena completa excepto display.update()."""
-        # Fondo
-        if self.background.get_size() != self.window.get_size():
-            bg_scaled = pygame.transform.scale(self.background, self.window.get_size())
-            self.window.blit(bg_scaled, (0, 0))
-        else:
-            self.window.blit(self.background, (0, 0))
+        # Fondo (variante escalada memorizada)
+        self.window.blit(assets.scaled(self.background, self.window.get_size()), (0, 0))
 
         # Enemigos
         for enemy in enemies:
@@ -48,3 +39,65 @@ class Drawing:
 
     def present(self):
         pygame.display.update()
+
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Une los rects que se solapan para pasarle a display.update() la lista mínima."""
+    merged: list[pygame.Rect] = []
+    for r in rects:
+        if r.width <= 0 or r.height <= 0:
+            continue
+        r = r.copy()
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(r):
+                r.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(r)
+    return merged
+
+
+class DirtyRectRenderer:
+    """Render por rectángulos sucios para el frame del juego.
+
+    En vez de blitear el fondo completo y presentar toda la ventana, restaura desde el
+    fondo cacheado solo las zonas ocupadas en el frame anterior y presenta la unión de
+    los rects viejos (lo que se borró) y nuevos (lo que se dibujó).
+
+    Uso por frame: begin() -> dibujar entidades recolectando sus rects -> present(rects).
+    """
+
+    def __init__(self, window: pygame.Surface, background: pygame.Surface | None) -> None:
+        self.window = window
+        if background is None:
+            background = pygame.Surface(window.get_size())
+            background.fill(FALLBACK_BG_COLOR)
+        else:
+            background = assets.scaled(background, window.get_size())
+        self.background = background
+        self._prev_rects: list[pygame.Rect] = []
+        self._full_redraw = True
+
+    def invalidate(self) -> None:
+        """Fuerza un redibujado completo (p.ej. tras una pantalla que tapó todo el juego)."""
+        self._full_redraw = True
+
+    def begin(self) -> None:
+        """Borra lo dibujado en el frame anterior restaurando el fondo solo en esas zonas."""
+        if self._full_redraw:
+            self.window.blit(self.background, (0, 0))
+            return
+        for r in self._prev_rects:
+            self.window.blit(self.background, r, r)
+
+    def present(self, rects: list[pygame.Rect]) -> None:
+        """Presenta solo lo que cambió: rects del frame anterior + rects dibujados ahora."""
+        if self._full_redraw:
+            pygame.display.update()
+            self._full_redraw = False
+        else:
+            pygame.display.update(merge_rects(self._prev_rects + rects))
+        self._prev_rects = rects
+
@@ -0,0 +1,101 @@
+import pygame
+
+# Colores del HUD
+BLANCO = (255, 255, 255)
+AMARILLO = (255, 255, 0)
+CIAN = (0, 200, 255)
+
+DIGITS = "0123456789/"
+
+
+class GlyphAtlas:
+    """Glifos pre-renderizados una sola vez con una fuente y color.
+
+    Las etiquetas fijas ("Lives: ", ...) se rasterizan completas y los números se
+    componen blitteando glifos de dígitos, así font.render no se llama en cada frame.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: tuple, chars: str = DIGITS) -> None:
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs = {ch: font.render(ch, True, color) for ch in chars}
+        self._words: dict[str, pygame.Surface] = {}
+
+    def word(self, text: str) -> pygame.Surface:
+        """Texto fijo rasterizado una vez y reutilizado."""
+        surf = self._words.get(text)
+        if surf is None:
+            surf = self.font.render(text, True, self.color)
+            self._words[text] = surf
+        return surf
+
+    def compose(self, prefix: str, value: str) -> pygame.Surface:
+        """Superficie con la etiqueta fija seguida del valor compuesto por glifos."""
+        head = self.word(prefix)
+        glyphs = [self.glyphs[ch] if ch in self.glyphs else self.word(ch) for ch in value]
+        width = head.get_width() + sum(g.get_width() for g in glyphs)
+        surf = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        surf.blit(head, (0, 0))
+        x = head.get_width()
+        for g in glyphs:
+            surf.blit(g, (x, 0))
+            x += g.get_width()
+        return surf
+
+
+class HUD:
+    """HUD del juego cacheado en una sola superficie.
+
+    Cada etiqueta se recompone solo cuando cambia su valor y la superficie completa del
+    HUD solo se reconstruye si algo en ella cambió; mientras tanto draw() vuelve a blitear
+    únicamente las regiones ocupadas de la superficie cacheada.
+    """
+
+    def __init__(self, font: pygame.font.Font, width: int, height: int, bullet_img: pygame.Surface) -> None:
+        self.width = width
+        self.height = height
+        self.bullet_img = bullet_img
+        self._atlases = {color: GlyphAtlas(font, color) for color in (BLANCO, AMARILLO, CIAN)}
+        self._surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._labels: dict[str, tuple[str, pygame.Surface]] = {}
+        self._values: tuple | None = None
+        self.regions: list[pygame.Rect] = []
+
+    def _label(self, key: str, color: tuple, prefix: str, value: str) -> pygame.Surface:
+        cached = self._labels.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        surf = self._atlases[color].compose(prefix, value)
+        self._labels[key] = (value, surf)
+        return surf
+
+    def _rebuild(self, lives: int, level: int, score: int, kills: int, target_kills: int, ready_bullets: int) -> None:
+        lives_label = self._label("lives", BLANCO, "Lives: ", str(lives))
+        level_label = self._label("level", BLANCO, "Level: ", str(level))
+        score_label = self._label("score", AMARILLO, "Score: ", str(score))
+        kills_label = self._label("kills", CIAN, "Kills: ", f"{kills}/{target_kills}")
+        self._surface.fill((0, 0, 0, 0))
+        self.regions = [
+            self._surface.blit(lives_label, (10, 10)),
+            self._surface.blit(level_label, (self.width - level_label.get_width() - 10, 10)),
+            self._surface.blit(score_label, (10, 34)),
+            self._surface.blit(kills_label, (10, 58)),
+        ]
+        # Balas disponibles del jugador (en la "recámara"), de derecha a izquierda
+        bullet_w = self.bullet_img.get_width()
+        for i in range(1, ready_bullets + 1):
+            self._surface.blit(self.bullet_img, (self.width - i * bullet_w, self.height - 50))
+        if ready_bullets:
+            row = pygame.Rect(self.width - ready_bullets * bullet_w, self.height - 50,
+                              ready_bullets * bullet_w, self.bullet_img.get_height())
+            self.regions.append(row.clip(self._surface.get_rect()))
+
+    def draw(self, window: pygame.Surface, lives: int, level: int, score: int, kills: int,
+             target_kills: int, ready_bullets: int) -> list[pygame.Rect]:
+        """Blitea el HUD cacheado (reconstruyéndolo solo si cambió) y retorna los rects dibujados."""
+        values = (lives, level, score, kills, target_kills, ready_bullets)
+        if values != self._values:
+            self._rebuild(*values)
+            self._values = values
+        return [window.blit(self._surface, r, r) for r in self.regions]
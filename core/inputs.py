@@ -0,0 +1,26 @@
+import pygame
+
+# Bits de entrada por frame: un entero compacto describe todo lo que el jugador
+# presiona en un tick (fácil de grabar, comparar y reproducir).
+INPUT_UP = 1
+INPUT_DOWN = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+INPUT_FIRE = 16
+
+
+def read_keyboard() -> int:
+    """Convierte el estado actual del teclado en bits de entrada."""
+    keys = pygame.key.get_pressed()
+    inputs = 0
+    if keys[pygame.K_UP] or keys[pygame.K_w]:
+        inputs |= INPUT_UP
+    if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        inputs |= INPUT_DOWN
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        inputs |= INPUT_LEFT
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        inputs |= INPUT_RIGHT
+    if keys[pygame.K_SPACE]:
+        inputs |= INPUT_FIRE
+    return inputs
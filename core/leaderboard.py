@@ -0,0 +1,135 @@
+"""Índice de posiciones de la tabla de puntajes.
+
+Arreglo ordenado (de mayor a menor puntaje, desempate por nombre como en la base) con los
+puntajes negados en un array('q') y los nombres en una lista paralela:
+
+- filas k..k+n son un slice, sin OFFSET en SQL ni ordenar en cada apertura;
+- la posición de un jugador (o de un puntaje) es una búsqueda binaria, O(log n).
+
+Se llena recorriendo el índice por puntaje de la base en un hilo de fondo (con un millón
+de filas toma segundos) y se recarga solo si la base cambió (mtime de sus archivos);
+mientras tanto se sigue mostrando la versión anterior. Lo que haya que hacer antes de
+mirar si cambió (vaciar la cola del escritor, sembrar datos) va en `prepare`, que corre
+en ese mismo hilo: abrir la tabla nunca toca la base desde el hilo principal. Un `prepare`
+pedido mientras otra carga sigue en curso queda pendiente y ese mismo hilo lo corre (y
+vuelve a mirar la base) antes de terminar.
+"""
+import array
+import bisect
+import sqlite3
+import threading
+from typing import Callable
+
+from core import scores
+
+
+class Leaderboard:
+    """Tabla de puntajes en memoria con consulta de filas por posición y de posición por jugador."""
+
+    def __init__(self, repo: scores.ScoreRepository) -> None:
+        self.repo = repo
+        # (puntajes negados, nombres): se reemplaza entera al recargar, nunca se modifica
+        self._data: tuple[array.array, list[str]] = (array.array('q'), [])
+        self._stamp: tuple | None = None
+        self._thread: threading.Thread | None = None
+        self._prepares: list[Callable[[], None]] = []  # pendientes para el hilo de carga
+        self._lock = threading.Lock()
+        self.version = 0  # sube con cada recarga; la vista la usa para invalidar lo dibujado
+
+    def __len__(self) -> int:
+        return len(self._data[1])
+
+    @property
+    def loading(self) -> bool:
+        return self._thread is not None
+
+    def refresh(self, wait: bool = False, prepare: Callable[[], None] | None = None) -> None:
+        """Recarga en segundo plano si la base cambió; con `wait` espera a que termine.
+
+        `prepare` corre primero en el hilo de carga (el cambio se mira después, así incluye
+        lo que escriba); con `prepare` el hilo arranca siempre, aunque la base no haya cambiado.
+        Si ya hay una carga en curso, `prepare` queda pendiente y la misma carga lo corre.
+        """
+        with self._lock:
+            if prepare is not None:
+                self._prepares.append(prepare)
+            if self._thread is None and (self._prepares or self.repo.stamp() != self._stamp):
+                self._thread = threading.Thread(target=self._load, name="Leaderboard", daemon=True)
+                self._thread.start()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _load(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    prepares, self._prepares = self._prepares, []
+                self._load_once(prepares)
+                # Terminar solo si nadie pidió otro prepare mientras tanto (refresh lo ve con el lock)
+                with self._lock:
+                    if not self._prepares:
+                        self._thread = None
+                        return
+        finally:
+            with self._lock:
+                if self._thread is threading.current_thread():  # salió por una excepción
+                    self._thread = None
+            # La conexión es de este hilo, que termina aquí
+            self.repo.close()
+
+    def _load_once(self, prepares: list[Callable[[], None]]) -> None:
+        data = stamp = None
+        try:
+            for prepare in prepares:
+                prepare()
+            stamp = self.repo.stamp()
+            if stamp != self._stamp:
+                neg_scores = array.array('q')
+                names: list[str] = []
+                for rows in self.repo.ranked():
+                    batch_names, batch_scores = zip(*rows)
+                    names.extend(batch_names)
+                    neg_scores.extend(-p for p in batch_scores)
+                data = (neg_scores, names)
+        except sqlite3.Error as e:
+            print(f"[Scores] Error cargando la tabla de puntajes: {e}")
+        if data is not None:
+            with self._lock:
+                self._data = data
+                self._stamp = stamp
+                self.version += 1
+
+    def rows(self, start: int, count: int) -> list[tuple[int, str, int]]:
+        """(posición, nombre, puntaje) de las filas start..start+count (posición desde 1)."""
+        neg_scores, names = self._data
+        start = max(0, start)
+        return [(start + i + 1, n, -p) for i, (n, p) in
+                enumerate(zip(names[start:start + count], neg_scores[start:start + count]))]
+
+    def rank_for_score(self, score: int) -> int:
+        """Posición que tendría un puntaje nuevo (1 = primero)."""
+        return bisect.bisect_left(self._data[0], -score) + 1
+
+    def rank(self, name: str, score: int) -> int | None:
+        """Posición del jugador `name` con su mejor puntaje `score` (None si no está en el índice)."""
+        neg_scores, names = self._data
+        lo = bisect.bisect_left(neg_scores, -score)
+        hi = bisect.bisect_right(neg_scores, -score, lo)
+        key = name.strip().lower()
+        # Entre puntajes iguales el orden es por nombre en minúsculas (name_key)
+        i = bisect.bisect_left(names, key, lo, hi, key=str.lower)
+        return i + 1 if i < hi and names[i].lower() == key else None
+
+
+_boards: dict[str, Leaderboard] = {}
+
+
+def leaderboard(archivo: str | None = None, prepare: Callable[[], None] | None = None) -> Leaderboard:
+    """Índice compartido para el repositorio de `archivo`; pide recargarlo si la base cambió."""
+    repo = scores.repository(archivo)
+    board = _boards.get(repo.path)
+    if board is None:
+        board = _boards[repo.path] = Leaderboard(repo)
+    board.refresh(prepare=prepare)
+    return board
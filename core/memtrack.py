@@ -0,0 +1,193 @@
+"""Contabilidad de memoria y detección de fugas en sesiones largas (tracemalloc).
+
+Cada `interval` ticks de juego, sample() toma una snapshot de tracemalloc y guarda:
+
+- bytes vivos por subsistema (entidades, simulación, render, audio, puntajes, otros): cada
+  bloque se atribuye al frame más interno de su traceback que sea código del proyecto, así
+  lo que asigna la biblioteca estándar a pedido del juego cuenta para quien lo pidió;
+- instancias vivas de Enemy, Bullet y pygame.Surface (las Surface no las sigue el GC: se
+  cuentan entre lo que referencian los objetos que sí sigue);
+- las líneas que más crecieron desde la muestra anterior.
+
+trend() ajusta una recta a las muestras (descartando las primeras, mientras se llenan
+cachés y pools) y da el crecimiento en KB por minuto de juego, total y por subsistema;
+check() falla si el total supera el umbral. Pensado para `main.py --headless --memtrack`
+(sale con código 1 si falla) y para partidas con `--memtrack` (un solo tracker para toda la
+sesión: cada Game le suma sus ticks con advance() y el reporte se imprime al salir).
+
+Trazar cuesta: con tracemalloc activo la simulación corre varias veces más lenta, y cada
+muestra toma decenas de ms. Es un modo de diagnóstico, no para jugar normalmente.
+"""
+import gc
+import os
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from core.settings import (PROJECT_ROOT, TICK_RATE, MEMTRACK_INTERVAL, MEMTRACK_MAX_GROWTH_KB_MIN,
+                           MEMTRACK_TRACE_FRAMES, MEMTRACK_WARMUP)
+
+# Subsistema de cada archivo del proyecto (ruta relativa; el primer prefijo que coincide gana)
+SUBSYSTEMS = (
+    ('entities', ('entities/', 'ShipClass.py')),
+    ('simulation', ('core/simulation.py', 'core/projectiles.py', 'core/collision.py', 'core/pool.py',
+                    'core/replay.py', 'core/inputs.py')),
+    ('rendering', ('core/drawing.py', 'core/hud.py', 'core/assets.py', 'core/atlas.py', 'core/ui.py',
+                   'core/scenes.py', 'core/menu_', 'core/profiler.py', 'game.py')),
+    ('audio', ('core/soundbank.py', 'core/synth.py')),
+    ('scores', ('core/scores.py', 'core/leaderboard.py', 'core/name_index.py', 'core/score_merge.py')),
+)
+OTHER = 'other'
+NAMES = tuple(name for name, _ in SUBSYSTEMS) + (OTHER,)
+
+_ROOT = PROJECT_ROOT + os.sep
+
+
+def subsystem_of(filename: str) -> str | None:
+    """Subsistema de un archivo del proyecto (None si no es del proyecto)."""
+    if not filename.startswith(_ROOT) or f"{os.sep}.venv{os.sep}" in filename:
+        return None
+    rel = filename[len(_ROOT):].replace(os.sep, '/')
+    for name, prefixes in SUBSYSTEMS:
+        if rel.startswith(prefixes):
+            return name
+    return OTHER
+
+
+def live_objects() -> dict[str, int]:
+    """Instancias vivas de Enemy, Bullet y pygame.Surface.
+
+    Lo congelado con gc.freeze() (la carga de cada Game) no aparece en gc.get_objects(): en
+    partida los conteos son lo creado después de cargar, que es justo lo que puede crecer.
+    """
+    from entities.bullet import Bullet
+    from entities.enemy import Enemy
+
+    objects = gc.get_objects()
+    counts = {'Enemy': 0, 'Bullet': 0}
+    for obj in objects:
+        if isinstance(obj, Enemy):
+            counts['Enemy'] += 1
+        elif isinstance(obj, Bullet):
+            counts['Bullet'] += 1
+    surfaces = {id(o) for o in gc.get_referents(*objects) if isinstance(o, pygame.Surface)}
+    counts['Surface'] = len(surfaces)
+    return counts
+
+
+class Sample:
+    __slots__ = ('tick', 'total', 'by_subsystem', 'objects', 'top')
+
+    def __init__(self, tick: int, total: int, by_subsystem: dict[str, int], objects: dict[str, int],
+                 top: list[tracemalloc.StatisticDiff]) -> None:
+        self.tick = tick
+        self.total = total
+        self.by_subsystem = by_subsystem
+        self.objects = objects
+        self.top = top
+
+
+class MemoryTracker:
+    def __init__(self, interval: int = MEMTRACK_INTERVAL, warmup: int = MEMTRACK_WARMUP,
+                 max_growth_kb_min: float = MEMTRACK_MAX_GROWTH_KB_MIN, frames: int = MEMTRACK_TRACE_FRAMES) -> None:
+        self.interval = interval
+        self.warmup = warmup
+        self.max_growth_kb_min = max_growth_kb_min
+        self.frames = frames
+        self.samples: list[Sample] = []
+        self.ticks = 0  # ticks de juego de toda la sesión (advance)
+        self._next = 0
+        self._previous: tracemalloc.Snapshot | None = None
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                         tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                         tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+                         tracemalloc.Filter(False, __file__)]
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._previous = None
+
+    def finish(self) -> bool:
+        """Última muestra, deja de trazar e imprime el reporte. Retorna check()."""
+        if tracemalloc.is_tracing():
+            self.sample(self.ticks, force=True)
+            self.stop()
+        print(self.report())
+        return self.check()
+
+    def advance(self, ticks: int = 1) -> Sample | None:
+        """Suma ticks de juego a la sesión (varias partidas seguidas) y muestrea si corresponde."""
+        self.ticks += ticks
+        return self.sample(self.ticks)
+
+    def sample(self, tick: int, force: bool = False) -> Sample | None:
+        """Toma una muestra si pasaron `interval` ticks desde la anterior (o si `force`)."""
+        if not force and tick < self._next:
+            return None
+        self._next = tick + self.interval
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+        by_subsystem = dict.fromkeys(NAMES, 0)
+        for stat in snapshot.statistics('traceback'):
+            # El frame más interno que sea del proyecto (el traceback va del más antiguo al más reciente)
+            for frame in reversed(stat.traceback):
+                name = subsystem_of(frame.filename)
+                if name is not None:
+                    by_subsystem[name] += stat.size
+                    break
+        top = snapshot.compare_to(self._previous, 'lineno')[:10] if self._previous is not None else []
+        self._previous = snapshot
+        sample = Sample(tick, sum(by_subsystem.values()), by_subsystem, live_objects(), top)
+        self.samples.append(sample)
+        return sample
+
+    # -------- Tendencia ---------
+    def trend(self) -> dict | None:
+        """Pendientes (KB por minuto de juego) de bytes por subsistema y objetos por minuto."""
+        usable = self.samples[self.warmup:]
+        if len(usable) < 3:
+            return None
+        minutes = np.array([s.tick for s in usable]) / TICK_RATE / 60.0
+        if minutes[-1] - minutes[0] <= 0:
+            return None
+
+        def slope(values) -> float:
+            return float(np.polyfit(minutes, np.asarray(values, dtype=float), 1)[0])
+
+        return {
+            'minutes': float(minutes[-1] - minutes[0]),
+            'total_kb_min': slope([s.total for s in usable]) / 1024,
+            'subsystems_kb_min': {n: slope([s.by_subsystem[n] for s in usable]) / 1024 for n in NAMES},
+            'objects_per_min': {k: slope([s.objects[k] for s in usable]) for k in usable[0].objects},
+        }
+
+    def check(self) -> bool:
+        """True si el crecimiento total está bajo el umbral (o si todavía no hay tendencia)."""
+        trend = self.trend()
+        return trend is None or trend['total_kb_min'] <= self.max_growth_kb_min
+
+    def report(self) -> str:
+        if not self.samples:
+            return "[Memoria] Sin muestras"
+        last = self.samples[-1]
+        lines = [f"[Memoria] {len(self.samples)} muestras, {last.total / 1024:.0f} KB trazados en el tick {last.tick}"]
+        lines.append("  por subsistema: " + ', '.join(f"{n} {last.by_subsystem[n] / 1024:.0f} KB" for n in NAMES))
+        lines.append("  objetos vivos: " + ', '.join(f"{k} {v}" for k, v in last.objects.items()))
+        trend = self.trend()
+        if trend is None:
+            lines.append("  tendencia: faltan muestras")
+        else:
+            estado = "OK" if self.check() else f"FALLA (umbral {self.max_growth_kb_min:g} KB/min)"
+            lines.append(f"  tendencia en {trend['minutes']:.1f} min de juego: {trend['total_kb_min']:+.1f} KB/min {estado}")
+            lines.append("    " + ', '.join(f"{n} {v:+.1f}" for n, v in trend['subsystems_kb_min'].items()))
+            lines.append("    objetos/min: " + ', '.join(f"{k} {v:+.1f}" for k, v in trend['objects_per_min'].items()))
+        if last.top:
+            lines.append("  líneas que más crecieron en la última muestra:")
+            for stat in last.top[:5]:
+                frame = stat.traceback[0]
+                lines.append(f"    {stat.size_diff / 1024:+8.1f} KB  {frame.filename}:{frame.lineno}")
+        return '\n'.join(lines)
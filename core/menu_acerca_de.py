@@ -1,23 +1,11 @@
-import os
 import pygame
-from pygame import mixer
-from core.settings import PROJECT_ROOT
-
-if not pygame.get_init():
-    pygame.init()
-try:
-    if not pygame.font.get_init():
-        pygame.font.init()
-except Exception:
-    pass
-
-try:
-    if not mixer.get_init():
-        mixer.init()
-except Exception:
-    pass
-
-class MenuAcercaDe:
+from core import ui
+from core.assets import assets
+from core.scenes import Scene, SceneManager
+from core.settings import MENU_POLL_MS
+
+
+class MenuAcercaDe(Scene):
     BLANCO = (255, 255, 255)
     NEGRO = (0, 0, 0)
     GRIS = (180, 180, 180)
@@ -25,33 +13,34 @@ class MenuAcercaDe:
 
     ANCHO = 800
     ALTO = 600
-    ventana = pygame.display.set_mode((ANCHO, ALTO))
-    pygame.display.set_caption("Acerca de - Space Invaders")
-
-    def __init__(self) -> None:
-        self.fuente_titulo = pygame.font.Font(None, 54)
-        self.fuente_texto = pygame.font.Font(None, 30)
-        self.fuente_pequena = pygame.font.Font(None, 24)
-        self.clock = pygame.time.Clock()
-        # Fondo opcional reutiliza menu_fondo si existe
-        fondo_path = os.path.join(PROJECT_ROOT, 'images', 'menu_fondo.jpg')
-        self.background = None
-        if os.path.exists(fondo_path):
-            try:
-                img = pygame.image.load(fondo_path).convert()
-                self.background = pygame.transform.scale(img, (self.ANCHO, self.ALTO))
-            except Exception:
-                self.background = None
+    titulo = "Acerca de - Space Invaders"
+
+    ACERCA_LINEAS = [
+        "Space Invaders (versión prototipo)",
+        "Proyecto educativo en Python + Pygame",
+        "Objetivo: Practicar POO, manejo de eventos y assets.",
+        "Autor: Danylopgali",
+        "Música y recursos: placeholders / usuario",
+        "Hybridge demo logo en esquina.",
+    ]
+
+    def __init__(self, precargar=()) -> None:
+        # Escenas (clases) cuyos assets se decodifican en segundo plano mientras esta está arriba
+        self.precargar = tuple(precargar)
+        self.fuente_titulo = assets.font(54)
+        self.fuente_texto = assets.font(30)
+        self.fuente_pequena = assets.font(24)
+        # Fondo opcional reutiliza menu_fondo si existe (variante escalada memorizada)
+        self.background = assets.scaled('menu_fondo.jpg', (self.ANCHO, self.ALTO), alpha=False)
         # Logo hybridge opcional
-        logo_path = os.path.join(PROJECT_ROOT, 'images', 'hybridge.gif')
-        self.logo = None
-        if os.path.exists(logo_path):
-            try:
-                lg = pygame.image.load(logo_path).convert_alpha()
-                ratio = 100 / lg.get_width()
-                self.logo = pygame.transform.smoothscale(lg, (100, int(lg.get_height() * ratio)))
-            except Exception:
-                self.logo = None
+        self.logo = assets.scaled_to_width('hybridge.gif', 100)
+        self.boton_volver = pygame.Rect(30, 20, 140, 50)
+        self._capa: pygame.Surface | None = None
+        self._dibujado = False
+
+    @property
+    def ventana(self) -> pygame.Surface:
+        return ui.ventana((self.ANCHO, self.ALTO))
 
     def mostrar_texto(self, texto, font, color, superficie, x, y):
         surf = font.render(texto, True, color)
@@ -65,50 +54,68 @@ class MenuAcercaDe:
         self.mostrar_texto(texto, self.fuente_texto, self.NEGRO, self.ventana, x + ancho/2, y + alto/2)
         return rect
 
+    def componer(self, acerca_lineas: list[str], boton_volver: pygame.Rect) -> pygame.Surface:
+        """Pantalla completa (es estática) compuesta una sola vez en una superficie."""
+        capa = ui.capa(self.ventana)
+        # Fondo
+        if self.background:
+            capa.blit(self.background, (0, 0))
+        else:
+            capa.fill(self.NEGRO)
+
+        # Titulo
+        self.mostrar_texto("Acerca de", self.fuente_titulo, self.BLANCO, capa, self.ANCHO/2, 90)
+
+        # Texto central
+        y_base = 170
+        for i, linea in enumerate(acerca_lineas):
+            self.mostrar_texto(linea, self.fuente_texto, self.GRIS, capa, self.ANCHO/2, y_base + i * 42)
+
+        # Logo
+        if self.logo:
+            capa.blit(self.logo, (self.ANCHO - self.logo.get_width() - 20, self.ALTO - self.logo.get_height() - 20))
+
+        # Botón volver
+        pygame.draw.rect(capa, self.ROJO, boton_volver, border_radius=8)
+        self.mostrar_texto("Volver", self.fuente_texto, self.NEGRO, capa, boton_volver.x + boton_volver.width/2, boton_volver.y + boton_volver.height/2)
+        return capa
+
+    # -------- Escena ---------
+    def enter(self) -> None:
+        self._dibujado = False
+        # El tiempo que se lee esta pantalla oculta la carga de las siguientes
+        for escena in self.precargar:
+            assets.prefetch(**escena.PRECARGA)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in ui.EVENTOS_EXPOSICION:
+            self._dibujado = False
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.boton_volver.collidepoint(event.pos):
+                self.manager.pop()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+
+    def update(self, dt: float) -> None:
+        # Lo ya decodificado se convierte aquí, en el hilo principal
+        assets.collect()
+
+    def draw(self, window: pygame.Surface) -> None:
+        # Nada se mueve: se presenta una vez y se duerme hasta el próximo evento
+        if self._dibujado:
+            return
+        if self._capa is None:
+            self._capa = self.componer(self.ACERCA_LINEAS, self.boton_volver)
+        window.blit(self._capa, (0, 0))
+        pygame.display.flip()
+        self._dibujado = True
+
+    def timeout(self) -> int | None:
+        # Mientras haya precarga en curso, despertar para recogerla
+        return MENU_POLL_MS if assets.prefetching() else None
+
     def ejecutar(self):
-        acerca_lineas = [
-            "Space Invaders (versión prototipo)",
-            "Proyecto educativo en Python + Pygame", 
-            "Objetivo: Practicar POO, manejo de eventos y assets.",
-            "Autor: Danylopgali", 
-            "Música y recursos: placeholders / usuario", 
-            "Hybridge demo logo en esquina." ,
-        ]
-        boton_volver = pygame.Rect(30, 20, 140, 50)
-        running = True
-        while running:
-            self.clock.tick(60)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if boton_volver.collidepoint(event.pos):
-                        running = False
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    running = False
-
-            # Fondo
-            if self.background:
-                self.ventana.blit(self.background, (0, 0))
-            else:
-                self.ventana.fill(self.NEGRO)
-
-            # Titulo
-            self.mostrar_texto("Acerca de", self.fuente_titulo, self.BLANCO, self.ventana, self.ANCHO/2, 90)
-
-            # Texto central
-            y_base = 170
-            for i, linea in enumerate(acerca_lineas):
-                self.mostrar_texto(linea, self.fuente_texto, self.GRIS, self.ventana, self.ANCHO/2, y_base + i * 42)
-
-            # Logo
-            if self.logo:
-                self.ventana.blit(self.logo, (self.ANCHO - self.logo.get_width() - 20, self.ALTO - self.logo.get_height() - 20))
-
-            # Botón volver
-            pygame.draw.rect(self.ventana, self.ROJO, boton_volver, border_radius=8)
-            self.mostrar_texto("Volver", self.fuente_texto, self.NEGRO, self.ventana, boton_volver.x + boton_volver.width/2, boton_volver.y + boton_volver.height/2)
-
-            pygame.display.flip()
+        """Muestra la pantalla sola (fuera del bucle de escenas) hasta volver o cerrar."""
+        SceneManager(self.ventana).run(self)
 
         # No hacemos quit aquí; se regresa al llamador
@@ -1,119 +1,69 @@
-import os
+import sqlite3
+
 import pygame
-from pygame import mixer
-from core.settings import PROJECT_ROOT
+from core import scores, ui
+from core.assets import assets
+from core.name_index import NameIndex, name_index
 from core.menu_puntajes import MenuPuntajes
-
-# Inicialización segura de Pygame (display, fonts, audio)
-if not pygame.get_init():
-    pygame.init()
-try:
-    if not pygame.font.get_init():
-        pygame.font.init()
-except Exception:
-    pass
-
-try:
-    if not mixer.get_init():
-        mixer.init()
-except Exception:
-    # En entornos sin audio (p.ej., WSL), ignorar
-    pass
+from core.scenes import Scene, SceneManager
 
 
-class MenuPrincipal:
+class MenuPrincipal(Scene):
     # Colores
     BLANCO = (255, 255, 255)
     NEGRO = (0, 0, 0)
     ROJO = (255, 0, 0)
+    VERDE = (50, 200, 50)
 
     # Ventana
     ANCHO = 800
     ALTO = 600
-    ventana = pygame.display.set_mode((ANCHO, ALTO))
-    pygame.display.set_caption("Space Invaders")
-
-    # Música de fondo (opcional, ignorando errores)
-    try:
-        # Intentar en assets/sounds y luego en sounds/ relativo
-        CANDIDATOS = [
-            os.path.join(PROJECT_ROOT, 'assets', 'sounds', 'background_song.mp3'),
-            os.path.join(PROJECT_ROOT, 'sounds', 'background_song.mp3'),
-            'sounds/background_song.mp3',
+    titulo = "Space Invaders"
+
+    # Música de fondo (opcional; suena mientras el menú está en pantalla)
+    MUSICA = 'background_song.mp3'
+    PRECARGA = {'opaque': ('menu_fondo.jpg',), 'images': ('hybridge.gif',), 'stream': (MUSICA,)}
+
+    def __init__(self, iniciar_juego=None, archivo_scores: str = "scores.txt") -> None:
+        # Con `iniciar_juego(nombre) -> Scene` el nombre elegido arranca esa escena; sin él,
+        # run() termina y retorna el nombre (uso fuera del bucle de escenas)
+        self.iniciar_juego = iniciar_juego
+        self.archivo_scores = archivo_scores
+        self.resultado: str | None = None
+        # Último nombre ingresado (para marcar su posición en la tabla de puntajes)
+        self.ultimo_jugador: str | None = None
+        btn_w, btn_h = 280, 60
+        self.botones = [
+            ("Nuevo Juego", pygame.Rect(self.ANCHO//2 - btn_w//2, 220, btn_w, btn_h), (90, 200, 90)),
+            ("Tabla de Puntajes", pygame.Rect(self.ANCHO//2 - btn_w//2, 300, btn_w, btn_h), (90, 150, 220)),
         ]
-        _music_path = next((p for p in CANDIDATOS if os.path.exists(p)), None)
-        if _music_path:
-            mixer.music.load(_music_path)
-            try:
-                mixer.music.play(-1)
-            except Exception:
-                pass
-    except Exception:
-        # No se pudo cargar el sonido; continuar sin música
-        pass
-
-    # Ruta de imágenes (usar images/img si existe, si no images)
-    _img_dir_candidates = [
-        os.path.join(PROJECT_ROOT, 'images', 'img'),
-        os.path.join(PROJECT_ROOT, 'images'),
-        'img',
-    ]
-    DIR_IMAGENES = next((p for p in _img_dir_candidates if os.path.exists(p)), _img_dir_candidates[0])
-
-    def __init__(self) -> None:
+        self.hover: int | None = None
+        self.redibujar = True
         # Preparar fuentes por si luego se usan en textos
         try:
-            self.fuente_titulo = pygame.font.Font(None, 56)
-            self.fuente_item = pygame.font.Font(None, 36)
-            self.fuente_input = pygame.font.Font(None, 32)
+            self.fuente_titulo = assets.font(56)
+            self.fuente_item = assets.font(36)
+            self.fuente_input = assets.font(32)
         except Exception:
             self.fuente_titulo = None
             self.fuente_item = None
             self.fuente_input = None
 
-        # Cargar imágenes: fondo del menú y logo hybridge
-        # Fondo: preferir ruta absoluta dada; fallback a images/menu_fondo.jpg en el proyecto
-        bg_abs = r"C:\\Users\\danie\\Desktop\\escuela\\space_ivaders\\images\\menu_fondo.jpg"
-        bg_rel = os.path.join(PROJECT_ROOT, 'images', 'menu_fondo.jpg')
-        self.menu_bg_img = None
-        for p in (bg_abs, bg_rel):
-            if os.path.exists(p):
-                try:
-                    self.menu_bg_img = pygame.image.load(p).convert()
-                    break
-                except Exception:
-                    self.menu_bg_img = None
-        # Pre-escalar una sola vez
-        self.menu_bg_scaled = None
-        if self.menu_bg_img is not None:
-            try:
-                self.menu_bg_scaled = pygame.transform.scale(self.menu_bg_img, (self.ANCHO, self.ALTO))
-            except Exception:
-                self.menu_bg_scaled = None
+        # Cargar imágenes desde el registro central: fondo del menú y logo hybridge
+        self.menu_bg_img = assets.image('menu_fondo.jpg', alpha=False)
+        # Pre-escalar una sola vez (variante memorizada)
+        self.menu_bg_scaled = assets.scaled('menu_fondo.jpg', (self.ANCHO, self.ALTO), alpha=False)
 
         # Logo hybridge en esquina
-        logo_candidates = [
-            os.path.join(PROJECT_ROOT, 'images', 'hybridge.gif'),
-            os.path.join('images', 'hybridge.gif'),
-        ]
-        self.logo_img = None
-        for p in logo_candidates:
-            if os.path.exists(p):
-                try:
-                    self.logo_img = pygame.image.load(p).convert_alpha()
-                    break
-                except Exception:
-                    self.logo_img = None
-        self.logo_scaled = None
-        if self.logo_img is not None:
-            try:
-                max_w = 90
-                ratio = max_w / self.logo_img.get_width() if self.logo_img.get_width() else 1.0
-                new_w = max_w
-                new_h = int(self.logo_img.get_height() * ratio) if ratio > 0 else self.logo_img.get_height()
-                self.logo_scaled = pygame.transform.smoothscale(self.logo_img, (new_w, new_h))
-            except Exception:
-                self.logo_scaled = None
+        self.logo_img = assets.image('hybridge.gif')
+        self.logo_scaled = assets.scaled_to_width('hybridge.gif', 90) if self.logo_img is not None else None
+        # Capas estáticas ya compuestas (fondo + logo, y fondo + título por pantalla)
+        self._fondo: pygame.Surface | None = None
+        self._capas: dict[str, pygame.Surface] = {}
+
+    @property
+    def ventana(self) -> pygame.Surface:
+        return ui.ventana((self.ANCHO, self.ALTO))
 
     def mostrar_texto(self, texto, font, color, superficie, x, y):
         """Renderiza texto centrado en (x, y) y devuelve su rectángulo."""
@@ -123,22 +73,38 @@ class MenuPrincipal:
         superficie.blit(texto_objeto, rectangulo_texto)
         return rectangulo_texto
 
+    def _capa_fondo(self) -> pygame.Surface:
+        """Fondo del menú con el logo en una esquina, compuesto una sola vez."""
+        if self._fondo is None:
+            fondo = ui.capa(self.ventana)
+            # Fondo (ya escalado)
+            if self.menu_bg_scaled is not None:
+                fondo.blit(self.menu_bg_scaled, (0, 0))
+            else:
+                fondo.fill(self.NEGRO)
+            # Logo en esquina inferior derecha ya escalado
+            if self.logo_scaled is not None:
+                padding = 10
+                pos_x = self.ANCHO - self.logo_scaled.get_width() - padding
+                pos_y = self.ALTO - self.logo_scaled.get_height() - padding
+                fondo.blit(self.logo_scaled, (pos_x, pos_y))
+            self._fondo = fondo
+        return self._fondo
+
+    def _capa(self, titulo: str, y: float) -> pygame.Surface:
+        """Fondo + logo + título centrado en `y`, compuesto una sola vez por título."""
+        capa = self._capas.get(titulo)
+        if capa is None:
+            capa = self._capas[titulo] = self._capa_fondo().copy()
+            if self.fuente_titulo:
+                self.mostrar_texto(titulo, self.fuente_titulo, self.BLANCO, capa, self.ANCHO / 2, y)
+        return capa
+
     def dibujar(self) -> None:
         """Dibuja el fondo del menú y el logo en una esquina."""
-        # Fondo (ya escalado)
-        if self.menu_bg_scaled is not None:
-            self.ventana.blit(self.menu_bg_scaled, (0, 0))
-        else:
-            self.ventana.fill(self.NEGRO)
-
-        # Logo en esquina inferior derecha ya escalado
-        if self.logo_scaled is not None:
-            padding = 10
-            pos_x = self.ANCHO - self.logo_scaled.get_width() - padding
-            pos_y = self.ALTO - self.logo_scaled.get_height() - padding
-            self.ventana.blit(self.logo_scaled, (pos_x, pos_y))
+        self.ventana.blit(self._capa_fondo(), (0, 0))
 
-    # Nota: no hacemos flip aquí; el present se hace al final del frame en run()
+    # Nota: no hacemos flip aquí; el present lo hace quien redibuja
 
     def dibujar_boton(self, texto: str, x: int, y: int, ancho: int, alto: int, color_fondo: tuple | None = None) -> pygame.Rect:
         if color_fondo is None:
@@ -149,96 +115,183 @@ class MenuPrincipal:
             self.mostrar_texto(texto, self.fuente_item, self.NEGRO, self.ventana, x + ancho / 2, y + alto / 2)
         return rect
 
-    def _leer_nombres_existentes(self, archivo: str) -> set[str]:
-        nombres: set[str] = set()
+    def _leer_nombres_existentes(self, archivo: str) -> NameIndex | None:
+        """Índice de nombres ya registrados (se recarga solo si cambió la base)."""
         try:
-            with open(archivo, 'r', encoding='utf-8') as f:
-                for linea in f:
-                    linea = linea.strip()
-                    if not linea:
-                        continue
-                    sep = ',' if ',' in linea else (';' if ';' in linea else None)
-                    partes = linea.split(sep) if sep else linea.split()
-                    if len(partes) < 1:
-                        continue
-                    nombre = partes[0].strip().lower()
-                    if nombre:
-                        nombres.add(nombre)
-        except FileNotFoundError:
-            return set()
-        except Exception:
-            return nombres
-        return nombres
+            return name_index(archivo)
+        except sqlite3.Error:
+            return None
+
+    def _estado_nombre(self, nombre: str, indice: NameIndex | None) -> tuple[str, tuple, str]:
+        """(mensaje de disponibilidad, color, sugerencias) para el texto escrito, sin tocar disco."""
+        n = nombre.strip()
+        if not n or indice is None:
+            return "", self.BLANCO, ""
+        if n in indice:
+            alternativa = indice.suggest(n)
+            return "Ese nombre ya existe", self.ROJO, (f"Prueba: {alternativa}" if alternativa else "")
+        parecidos = indice.with_prefix(n, limit=4)
+        return "Disponible", self.VERDE, ("Registrados: " + ", ".join(parecidos) if parecidos else "")
+
+    # -------- Escena ---------
+    def enter(self) -> None:
+        ui.reproducir_musica(self.MUSICA)
+        self.hover = ui.boton_bajo(pygame.mouse.get_pos(), [rect for _, rect, _ in self.botones])
+        self.redibujar = True
+
+    def resume(self) -> None:
+        # Al volver de otra pantalla (o de una partida, con su propia música)
+        self.enter()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        rects = [rect for _, rect, _ in self.botones]
+        if event.type in ui.EVENTOS_EXPOSICION:
+            self.redibujar = True
+        elif event.type == pygame.MOUSEMOTION:
+            hover = ui.boton_bajo(event.pos, rects)
+            if hover != self.hover:
+                self.hover, self.redibujar = hover, True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            boton = ui.boton_bajo(event.pos, rects)
+            if boton == 0:
+                self.manager.push(EntradaNombre(self, self.archivo_scores, self._nombre_elegido))
+            elif boton == 1:
+                # Mostrar tabla de puntajes; al cerrar vuelve al menú
+                self.manager.push(MenuPuntajes(self.ultimo_jugador, self.archivo_scores))
+
+    def draw(self, window: pygame.Surface) -> None:
+        """Solo redibuja al cambiar el botón bajo el mouse o al volver de otra pantalla."""
+        if not self.redibujar:
+            return
+        window.blit(self._capa("Space Invaders", 110), (0, 0))
+        for i, (texto, rect, color) in enumerate(self.botones):
+            self.dibujar_boton(texto, rect.x, rect.y, rect.width, rect.height,
+                               ui.resaltar(color) if i == self.hover else color)
+        pygame.display.flip()
+        self.redibujar = False
+
+    def timeout(self) -> int | None:
+        return None
+
+    def _nombre_elegido(self, nombre: str) -> None:
+        """La entrada de nombre aceptó `nombre` (la escena de entrada está arriba del menú)."""
+        self.ultimo_jugador = nombre
+        if self.iniciar_juego is not None:
+            # La partida toma el lugar de la entrada; al terminar se vuelve al menú
+            self.manager.replace(self.iniciar_juego(nombre))
+        else:
+            self.resultado = nombre
+            self.manager.pop()  # entrada
+            self.manager.pop()  # menú: termina run()
 
     def solicitar_nombre(self, archivo_scores: str = "scores.txt") -> str | None:
-        """Pantalla de entrada de nombre; valida no duplicado en archivo.
+        """Pantalla de entrada de nombre sola; valida no duplicado en archivo.
         Retorna el nombre válido o None si se cancela con ESC o cierre de ventana."""
-        clock = pygame.time.Clock()
-        nombre = ""
-        mensaje_error = ""
-        input_rect = pygame.Rect(self.ANCHO // 2 - 200, self.ALTO // 2 - 24, 400, 48)
-        while True:
-            clock.tick(60)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return None
-                    elif event.key == pygame.K_BACKSPACE:
-                        nombre = nombre[:-1]
-                    elif event.key == pygame.K_RETURN:
-                        n = nombre.strip()
-                        if not n:
-                            mensaje_error = "Ingresa un nombre"
-                        else:
-                            existentes = self._leer_nombres_existentes(archivo_scores)
-                            if n.lower() in existentes:
-                                mensaje_error = "Ese nombre ya existe"
-                            else:
-                                return n
-                    else:
-                        # Agregar caracteres de texto
-                        ch = event.unicode
-                        if ch and 32 <= ord(ch) < 127 and len(nombre) < 20:
-                            nombre += ch
-
-            # Dibujar fondo
-            self.dibujar()
-            # Caja y etiquetas
-            self.mostrar_texto("Ingresa tu nombre de jugador", self.fuente_titulo, self.BLANCO, self.ventana, self.ANCHO/2, self.ALTO/2 - 80)
-            pygame.draw.rect(self.ventana, self.BLANCO, input_rect, width=2, border_radius=6)
-            # Texto dentro de input
-            texto_input = (nombre + ("_" if (pygame.time.get_ticks() // 500) % 2 == 0 else "")) if self.fuente_input else nombre
-            if self.fuente_input:
-                self.mostrar_texto(texto_input, self.fuente_input, self.BLANCO, self.ventana, self.ANCHO/2, self.ALTO/2)
-            # Error
-            if mensaje_error and self.fuente_item:
-                self.mostrar_texto(mensaje_error, self.fuente_item, self.ROJO, self.ventana, self.ANCHO/2, self.ALTO/2 + 70)
-            pygame.display.flip()
+        entrada = EntradaNombre(self, archivo_scores)
+        SceneManager(self.ventana).run(entrada)
+        return entrada.resultado
 
     def run(self, archivo_scores: str = "scores.txt") -> str | None:
         """Muestra menú principal; devuelve nombre del jugador si elige Nuevo Juego, o None si cierra."""
-        clock = pygame.time.Clock()
-        while True:
-            clock.tick(60)
-            # Preparar botones antes de manejar eventos (evita acceso antes de creación)
-            self.dibujar()
-            if self.fuente_titulo:
-                self.mostrar_texto("Space Invaders", self.fuente_titulo, self.BLANCO, self.ventana, self.ANCHO/2, 110)
-            btn_w, btn_h = 280, 60
-            nuevo_rect = self.dibujar_boton("Nuevo Juego", self.ANCHO//2 - btn_w//2, 220, btn_w, btn_h, (90, 200, 90))
-            tabla_rect = self.dibujar_boton("Tabla de Puntajes", self.ANCHO//2 - btn_w//2, 300, btn_w, btn_h, (90, 150, 220))
+        self.archivo_scores = archivo_scores
+        self.resultado = None
+        SceneManager(self.ventana).run(self)
+        return self.resultado
+
+
+class EntradaNombre(Scene):
+    """Pantalla de entrada de nombre; valida no duplicado en archivo.
+
+    Los nombres registrados se cargan una vez al entrar; la disponibilidad y las
+    sugerencias se actualizan en cada tecla consultando solo el índice en memoria. Entre
+    teclas la pantalla duerme hasta el próximo parpadeo del cursor, que solo vuelve a
+    presentar la caja de texto. ESC vuelve sin nombre; un nombre válido llama a
+    `al_confirmar(nombre)` (o, sin él, cierra la escena con `resultado`).
+    """
+
+    titulo = "Space Invaders"
+
+    def __init__(self, menu: MenuPrincipal, archivo_scores: str = "scores.txt", al_confirmar=None) -> None:
+        self.menu = menu
+        self.archivo_scores = archivo_scores
+        self.al_confirmar = al_confirmar
+        self.resultado: str | None = None
+        self.input_rect = pygame.Rect(menu.ANCHO // 2 - 200, menu.ALTO // 2 - 24, 400, 48)
+
+    def enter(self) -> None:
+        self.indice = self.menu._leer_nombres_existentes(self.archivo_scores)
+        self.nombre = ""
+        self.mensaje_error = ""
+        self.estado, self.color_estado, self.sugerencias = self.menu._estado_nombre(self.nombre, self.indice)
+        self.cursor = ui.cursor_visible()
+        self.redibujar, self.solo_cursor = True, False
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        anterior = (self.nombre, self.mensaje_error)
+        if event.type in ui.EVENTOS_EXPOSICION:
+            self.redibujar = True
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()
+                return
+            elif event.key == pygame.K_BACKSPACE:
+                self.nombre = self.nombre[:-1]
+            elif event.key == pygame.K_RETURN:
+                n = self.nombre.strip()
+                if not n:
+                    self.mensaje_error = "Ingresa un nombre"
+                elif self.indice is not None and n in self.indice:
+                    self.mensaje_error = "Ese nombre ya existe"
+                else:
+                    self.resultado = n
+                    if self.indice is not None:
+                        # Tomado desde ya: el índice compartido no espera a recargar la base
+                        self.indice.add(n)
+                    if self.al_confirmar is not None:
+                        self.al_confirmar(n)
+                    else:
+                        self.manager.pop()
+                    return
+            else:
+                # Agregar caracteres de texto
+                ch = event.unicode
+                if ch and 32 <= ord(ch) < 127 and len(self.nombre) < 20:
+                    self.nombre += ch
+        if self.nombre != anterior[0]:
+            self.mensaje_error = ""
+            self.estado, self.color_estado, self.sugerencias = self.menu._estado_nombre(self.nombre, self.indice)
+        if (self.nombre, self.mensaje_error) != anterior:
+            self.redibujar = True
+
+    def update(self, dt: float) -> None:
+        if ui.cursor_visible() != self.cursor:
+            self.cursor = not self.cursor
+            self.solo_cursor = not self.redibujar
+            self.redibujar = True
+
+    def draw(self, window: pygame.Surface) -> None:
+        if not self.redibujar:
+            return
+        menu = self.menu
+        ancho, alto = menu.ANCHO, menu.ALTO
+        window.blit(menu._capa("Ingresa tu nombre de jugador", alto / 2 - 80), (0, 0))
+        pygame.draw.rect(window, self.color_estado, self.input_rect, width=2, border_radius=6)
+        # Texto dentro de input
+        if menu.fuente_input:
+            menu.mostrar_texto(self.nombre + ("_" if self.cursor else ""), menu.fuente_input, menu.BLANCO, window, ancho/2, alto/2)
+        # Error o disponibilidad del nombre escrito
+        if menu.fuente_item:
+            if self.mensaje_error:
+                menu.mostrar_texto(self.mensaje_error, menu.fuente_item, menu.ROJO, window, ancho/2, alto/2 + 70)
+            elif self.estado:
+                menu.mostrar_texto(self.estado, menu.fuente_item, self.color_estado, window, ancho/2, alto/2 + 70)
+        if self.sugerencias and menu.fuente_input:
+            menu.mostrar_texto(self.sugerencias, menu.fuente_input, menu.BLANCO, window, ancho/2, alto/2 + 110)
+        if self.solo_cursor:
+            pygame.display.update(self.input_rect)
+        else:
             pygame.display.flip()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    pos = event.pos
-                    if nuevo_rect.collidepoint(pos):
-                        nombre = self.solicitar_nombre(archivo_scores)
-                        if nombre:
-                            return nombre
-                    elif tabla_rect.collidepoint(pos):
-                        # Mostrar tabla de puntajes; al cerrar vuelve al menú
-                        MenuPuntajes().ejecutar(archivo_scores)
+        self.redibujar, self.solo_cursor = False, False
+
+    def timeout(self) -> int | None:
+        return ui.hasta_parpadeo()
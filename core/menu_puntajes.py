@@ -1,44 +1,69 @@
-import os
+import sqlite3
 import sys
 import pygame
 from typing import List, Tuple
 
-# Asegurar inicialización básica de Pygame antes de crear ventana
-if not pygame.get_init():
-    pygame.init()
-    try:
-        pygame.font.init()
-    except Exception:
-        pass
+from core import scores, ui
+from core.assets import assets
+from core.leaderboard import Leaderboard, leaderboard
+from core.scenes import Scene, SceneManager
+from core.settings import MENU_POLL_MS
 
+# Se guardan la primera vez que se abre la tabla sin registros
+PUNTAJES_EJEMPLO: List[Tuple[str, int]] = [
+    ("AAA", 5000),
+    ("BBB", 3500),
+    ("CCC", 2000),
+    ("DDD", 1500),
+    ("EEE", 1000),
+]
 
-class MenuPuntajes:
+
+class MenuPuntajes(Scene):
     # Colores en RGB
     BLANCO = (255, 255, 255)
     NEGRO = (0, 0, 0)
     GRIS = (200, 200, 200)
     ROJO = (255, 0, 0)
+    AMARILLO = (255, 220, 80)
 
     # Dimensiones de la ventana
     ANCHO = 800
     ALTO = 600
 
-    # Configurar ventana y título (siguiendo el esquema solicitado)
-    ventana = pygame.display.set_mode((ANCHO, ALTO))
-    pygame.display.set_caption("Mejores Puntajes")
-
-    def __init__(self) -> None:
-        self.fuente_titulo = pygame.font.Font(None, 48)
-        self.fuente_item = pygame.font.Font(None, 36)
-        self.fuente_subtitulo = pygame.font.Font(None, 28)
-        # Ruta de fondo opcional
-        self.background_path = os.path.join(os.path.dirname(__file__), '..', 'images', 'background.png')
-        self.background_img = None
-        if os.path.exists(self.background_path):
-            try:
-                self.background_img = pygame.image.load(self.background_path).convert()
-            except Exception:
-                self.background_img = None
+    # Tabla desplazable: solo se dibujan las filas visibles
+    FILAS_VISIBLES = 8
+    ALTO_FILA = 44
+    INICIO_Y = 140
+
+    titulo = "Mejores Puntajes"
+    PRECARGA = {'opaque': ('background.png',)}
+
+    def __init__(self, jugador: str | None = None, archivo: str = "scores.txt") -> None:
+        # Jugador cuya posición se muestra y resalta (opcional)
+        self.jugador = jugador
+        self.archivo = archivo
+        self.salir_con_esc = True
+        self.desplazamiento = 0
+        self.tabla: Leaderboard | None = None
+        self._mejor: int | None = None  # mejor puntaje del jugador (lo lee el hilo de carga)
+        self._version = None
+        self._posicion_jugador: int | None = None
+        self._pie = ""
+        self._dibujado = None
+        self._filas: dict[tuple, pygame.Surface] = {}
+        self.fuente_titulo = assets.font(48)
+        self.fuente_item = assets.font(36)
+        self.fuente_subtitulo = assets.font(28)
+        # Fondo opcional desde el registro central
+        self.background_path = assets.path('background.png')
+        self.background_img = assets.image('background.png', alpha=False)
+        # Fondo, títulos, ayuda y botón volver compuestos una sola vez
+        self._capa: pygame.Surface | None = None
+
+    @property
+    def ventana(self) -> pygame.Surface:
+        return ui.ventana((self.ANCHO, self.ALTO))
 
     def mostrar_texto(self, texto: str, font: pygame.font.Font, color: tuple, superficie: pygame.Surface, x: float, y: float) -> None:
         """Renderiza y centra texto en (x, y) sobre la superficie dada."""
@@ -54,117 +79,182 @@ class MenuPuntajes:
         self.mostrar_texto(texto, font, self.NEGRO, superficie, x + ancho / 2, y + alto / 2)
         return boton_rect
 
-    def mostrar_puntajes(self, lista_puntajes):
-        # Fondo
-        if self.background_img:
-            bg_scaled = pygame.transform.scale(self.background_img, (self.ANCHO, self.ALTO))
-            self.ventana.blit(bg_scaled, (0, 0))
-        else:
-            self.ventana.fill(self.NEGRO)
-        # Título y subtítulo
-        self.mostrar_texto("Mejores Puntajes", self.fuente_titulo, self.BLANCO, self.ventana, self.ANCHO / 2, 50)
-        self.mostrar_texto("Space Invaders", self.fuente_subtitulo, self.GRIS, self.ventana, self.ANCHO / 2, 85)
+    def mostrar_puntajes(self, lista_puntajes, inicio: int = 1, pie: str = "", resaltado: int | None = None,
+                         total: int = 0, mensaje_vacio: str = "No hay registros") -> None:
+        """Dibuja las filas dadas numeradas desde `inicio` (y `pie` con la posición del jugador)."""
+        self.ventana.blit(self._capa_estatica(), (0, 0))
         # Lista de puntajes o mensaje vacío
-        inicio_y = 140
+        inicio_y = self.INICIO_Y
         if not lista_puntajes:
-            self.mostrar_texto("No hay registros", self.fuente_item, self.GRIS, self.ventana, self.ANCHO / 2, inicio_y)
+            self.mostrar_texto(mensaje_vacio, self.fuente_item, self.GRIS, self.ventana, self.ANCHO / 2, inicio_y)
         else:
-            for i, (nombre, puntaje) in enumerate(lista_puntajes, start=1):
-                linea = f"{i}. {nombre} - {puntaje}"
-                self.mostrar_texto(linea, self.fuente_item, self.BLANCO, self.ventana, self.ANCHO / 2, inicio_y + (i - 1) * 44)
-        # Botón volver
-        self.boton_volver = self.dibujar_boton("<", self.fuente_item, self.ROJO, self.ventana, 20, 20, 50, 40)
+            for i, (nombre, puntaje) in enumerate(lista_puntajes):
+                posicion = inicio + i
+                fila = self._fila(posicion, nombre, puntaje, posicion == resaltado)
+                self.ventana.blit(fila, fila.get_rect(center=(self.ANCHO // 2, inicio_y + i * self.ALTO_FILA)))
+        if total > self.FILAS_VISIBLES:
+            self._dibujar_barra(inicio - 1, total)
+        if pie:
+            self.mostrar_texto(pie, self.fuente_subtitulo, self.AMARILLO, self.ventana, self.ANCHO / 2, self.ALTO - 70)
         pygame.display.update()
 
-    def cargar_puntajes(self, archivo: str) -> List[Tuple[str, int]]:
-        """Carga puntajes desde un archivo de texto.
-        Formato esperado por línea: nombre,puntaje
-        - Ignora líneas vacías o con formato inválido
-        - Si no existe, retorna lista vacía
-        - Devuelve el top 5 ordenado descendentemente por puntaje
-        """
-        puntajes: List[Tuple[str, int]] = []
+    def _capa_estatica(self) -> pygame.Surface:
+        """Fondo escalado, título, subtítulo, ayuda y botón volver en una sola superficie."""
+        if self._capa is None:
+            capa = ui.capa(self.ventana)
+            if self.background_img:
+                capa.blit(assets.scaled('background.png', (self.ANCHO, self.ALTO), alpha=False), (0, 0))
+            else:
+                capa.fill(self.NEGRO)
+            # Título y subtítulo
+            self.mostrar_texto("Mejores Puntajes", self.fuente_titulo, self.BLANCO, capa, self.ANCHO / 2, 50)
+            self.mostrar_texto("Space Invaders", self.fuente_subtitulo, self.GRIS, capa, self.ANCHO / 2, 85)
+            self.mostrar_texto("Flechas/Rueda: desplazar   Inicio/Fin   P: tu posición", self.fuente_subtitulo,
+                               self.GRIS, capa, self.ANCHO / 2, self.ALTO - 35)
+            # Botón volver
+            self.boton_volver = self.dibujar_boton("<", self.fuente_item, self.ROJO, capa, 20, 20, 50, 40)
+            self._capa = capa
+        return self._capa
+
+    def _fila(self, posicion: int, nombre: str, puntaje: int, resaltada: bool) -> pygame.Surface:
+        """Texto renderizado de una fila; memorizado mientras la fila siga cerca de la vista."""
+        clave = (posicion, nombre, puntaje, resaltada)
+        superficie = self._filas.get(clave)
+        if superficie is None:
+            if len(self._filas) > 4 * self.FILAS_VISIBLES:
+                self._filas.clear()
+            color = self.AMARILLO if resaltada else self.BLANCO
+            superficie = self._filas[clave] = self.fuente_item.render(f"{posicion}. {nombre} - {puntaje}", True, color)
+        return superficie
+
+    def _dibujar_barra(self, desplazamiento: int, total: int) -> None:
+        """Barra de desplazamiento proporcional a la parte visible de la tabla."""
+        alto_zona = self.FILAS_VISIBLES * self.ALTO_FILA
+        zona = pygame.Rect(self.ANCHO - 40, self.INICIO_Y - self.ALTO_FILA // 2, 8, alto_zona)
+        alto = max(12, alto_zona * self.FILAS_VISIBLES // total)
+        y = zona.y + (alto_zona - alto) * desplazamiento // max(1, total - self.FILAS_VISIBLES)
+        pygame.draw.rect(self.ventana, self.GRIS, zona, width=1, border_radius=4)
+        pygame.draw.rect(self.ventana, self.BLANCO, (zona.x, y, zona.width, alto), border_radius=4)
+
+    def cargar_puntajes(self, archivo: str) -> Leaderboard | None:
+        """Índice de posiciones de la tabla; la base se lee en segundo plano (ver _preparar)."""
+        self._mejor = None
         try:
-            with open(archivo, 'r', encoding='utf-8') as f:
-                for linea in f:
-                    linea = linea.strip()
-                    if not linea:
-                        continue
-                    # Separador por coma o por punto y coma o tabulación
-                    sep = ',' if ',' in linea else (';' if ';' in linea else None)
-                    partes = linea.split(sep) if sep else linea.split()
-                    if len(partes) < 2:
-                        continue
-                    nombre = partes[0].strip()
-                    try:
-                        puntaje = int(partes[1])
-                    except ValueError:
-                        continue
-                    puntajes.append((nombre, puntaje))
-        except FileNotFoundError:
-            # Crear archivo con puntajes de ejemplo y devolverlos
-            ejemplo: List[Tuple[str, int]] = [
-                ("AAA", 5000),
-                ("BBB", 3500),
-                ("CCC", 2000),
-                ("DDD", 1500),
-                ("EEE", 1000),
-            ]
-            try:
-                with open(archivo, 'w', encoding='utf-8') as fw:
-                    for n, p in ejemplo:
-                        fw.write(f"{n},{p}\n")
-            except Exception:
-                pass
-            return ejemplo
-        except Exception:
-            # Cualquier otro error, ser resiliente y retornar lo que tengamos
-            pass
-        # Ordenar por puntaje descendente y devolver top 5
-        puntajes.sort(key=lambda t: t[1], reverse=True)
-        return puntajes[:5]
+            return leaderboard(archivo, prepare=lambda: self._preparar(archivo))
+        except sqlite3.Error as e:
+            print(f"[Scores] Error leyendo puntajes: {e}")
+            return None
+
+    def _preparar(self, archivo: str) -> None:
+        """En el hilo de carga, antes de ver si la base cambió: sin esperas en la pantalla.
+
+        Guarda los de ejemplo si todavía no hay registros, vacía la cola del escritor (para
+        que la recarga incluya esos puntajes) y lee el mejor puntaje del jugador.
+        """
+        repo = scores.repository(archivo)
+        if not repo.count():
+            repo.save_many(PUNTAJES_EJEMPLO)
+        scores.writer(archivo).flush(timeout=scores.BUSY_TIMEOUT)
+        if self.jugador:
+            self._mejor = repo.best(self.jugador)
+
+    def _desplazar(self, event: pygame.event.Event, total: int, posicion_jugador: int | None) -> None:
+        """Mueve la vista con rueda, flechas, RePág/AvPág, Inicio/Fin o P (ir a la fila del jugador)."""
+        paso = None
+        if event.type == pygame.MOUSEWHEEL:
+            paso = -3 * event.y
+        elif event.type == pygame.KEYDOWN:
+            pagina = self.FILAS_VISIBLES
+            pasos = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -pagina, pygame.K_PAGEDOWN: pagina}
+            if event.key in pasos:
+                paso = pasos[event.key]
+            elif event.key == pygame.K_HOME:
+                self.desplazamiento = 0
+            elif event.key == pygame.K_END:
+                self.desplazamiento = total
+            elif event.key == pygame.K_p and posicion_jugador:
+                self.desplazamiento = posicion_jugador - 1 - self.FILAS_VISIBLES // 2
+        if paso:
+            self.desplazamiento += paso
+        self.desplazamiento = max(0, min(self.desplazamiento, total - self.FILAS_VISIBLES))
+
+    # -------- Escena ---------
+    def enter(self) -> None:
+        self.tabla = self.cargar_puntajes(self.archivo)
+        self._capa_estatica()
+        self.desplazamiento = 0
+        self._version = None
+        self._posicion_jugador = None
+        self._pie = ""
+        self._dibujado = None
+
+    def _cargando(self) -> bool:
+        return self.tabla is not None and self.tabla.loading
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in ui.EVENTOS_EXPOSICION:
+            self._dibujado = None
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and self.salir_con_esc:
+            self.manager.pop()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.boton_volver.collidepoint(event.pos):
+                if not self.salir_con_esc:
+                    print("acción atrás")
+                self.manager.pop()
+        else:
+            total = len(self.tabla) if self.tabla is not None else 0
+            self._desplazar(event, total, self._posicion_jugador)
+
+    def update(self, dt: float) -> None:
+        tabla = self.tabla
+        if tabla is not None and not tabla.loading and tabla.version != self._version:
+            # Carga terminada (con datos nuevos o no): recalcular la posición del jugador una vez
+            self._version = tabla.version
+            mejor = self._mejor
+            self._posicion_jugador = tabla.rank(self.jugador, mejor) if mejor is not None else None
+            if self._posicion_jugador:
+                self._pie = f"{self.jugador}: posición {self._posicion_jugador} de {len(tabla)}"
+            elif self.jugador:
+                self._pie = f"{self.jugador}: sin puntaje registrado"
+
+    def draw(self, window: pygame.Surface) -> None:
+        """Redibuja solo si cambió el desplazamiento o llegaron datos nuevos."""
+        cargando = self._cargando()
+        estado = (self.desplazamiento, self._version, cargando)
+        if estado == self._dibujado:
+            return
+        tabla = self.tabla
+        filas = tabla.rows(self.desplazamiento, self.FILAS_VISIBLES) if tabla is not None else []
+        vacio = "Cargando puntajes..." if cargando else "No hay registros"
+        self.mostrar_puntajes([(n, p) for _, n, p in filas], self.desplazamiento + 1, self._pie,
+                              self._posicion_jugador, len(tabla) if tabla is not None else 0, vacio)
+        self._dibujado = estado
+
+    def timeout(self) -> int | None:
+        # Mientras la tabla se carga en segundo plano, despertar para mostrarla al terminar
+        return MENU_POLL_MS if self._cargando() else None
 
     def dibujar(self, lista_puntajes: List[Tuple[str, int]]) -> None:
         # Mantener compatibilidad; delegar en mostrar_puntajes
         self.mostrar_puntajes(lista_puntajes)
 
     def run(self, archivo: str) -> None:
-        lista = self.cargar_puntajes(archivo)
-        clock = pygame.time.Clock()
-        corriendo = True
-        while corriendo:
-            clock.tick(60)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    corriendo = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        corriendo = False
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if hasattr(self, 'boton_volver') and self.boton_volver.collidepoint(event.pos):
-                        corriendo = False
-            self.mostrar_puntajes(lista)
+        self.archivo = archivo
+        SceneManager(self.ventana).run(self)
 
     def ejecutar(self, archivo: str) -> None:
-        """Muestra la pantalla de puntajes y maneja eventos.
-        - Carga y dibuja puntajes.
+        """Muestra la pantalla de puntajes sola (fuera del bucle de escenas) y maneja eventos.
+        - Carga la tabla y dibuja solo las filas visibles (desplazable con rueda y teclado).
         - Si se cierra la ventana: cierra Pygame y termina el programa.
         - Si se hace clic izquierdo dentro del botón de retroceso: imprime confirmación y retorna.
         """
-        lista = self.cargar_puntajes(archivo)
-        clock = pygame.time.Clock()
-        while True:
-            clock.tick(60)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit(0)
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    # Asegurar que el botón exista en este frame
-                    if hasattr(self, 'boton_volver') and self.boton_volver.collidepoint(event.pos):
-                        print("acción atrás")
-                        return
-            self.mostrar_puntajes(lista)
+        self.archivo = archivo
+        self.salir_con_esc = False
+        manager = SceneManager(self.ventana)
+        manager.run(self)
+        if manager.quit_requested:
+            pygame.quit()
+            sys.exit(0)
 
         # No cerramos pygame.quit() aquí por si el menú se llama desde el juego principal
         # El llamador decide cuándo terminar Pygame.
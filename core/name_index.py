@@ -0,0 +1,88 @@
+"""Índice en memoria de nombres de jugador ya registrados.
+
+Lista ordenada de nombres en minúsculas con búsqueda por bisect: saber si un nombre está
+tomado y listar los que empiezan con un prefijo no toca el disco. El índice se carga una
+vez desde el repositorio de puntajes y se recarga solo si cambió la base (mtime de sus
+archivos), lo que se revisa al abrir la pantalla de nombre, no en cada tecla.
+"""
+import bisect
+
+from core import scores
+
+
+class NameIndex:
+    """Nombres registrados (minúsculas, ordenados) con consulta de disponibilidad y prefijos."""
+
+    def __init__(self, repo: scores.ScoreRepository) -> None:
+        self.repo = repo
+        self._names: list[str] = []
+        self._stamp: tuple | None = None
+        # Agregados con add() que la base todavía no tenía en la última carga
+        self._added: set[str] = set()
+
+    def refresh(self) -> bool:
+        """Recarga los nombres si la base cambió desde la última carga; retorna True si recargó."""
+        stamp = self.repo.stamp()
+        if self._stamp is not None and stamp == self._stamp:
+            return False
+        # Leer primero y firmar después: la consulta puede crear la base o importar el texto
+        self._names = self.repo.names()
+        self._stamp = self.repo.stamp()
+        # Un nombre recién aceptado sigue tomado aunque su puntaje aún no llegue a la base
+        self._added = {key for key in self._added if key not in self}
+        for key in self._added:
+            bisect.insort(self._names, key)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        key = name.strip().lower()
+        i = bisect.bisect_left(self._names, key)
+        return i < len(self._names) and self._names[i] == key
+
+    def add(self, name: str) -> None:
+        """Agrega un nombre recién registrado sin recargar todo."""
+        key = name.strip().lower()
+        if key and key not in self:
+            bisect.insort(self._names, key)
+            self._added.add(key)
+
+    def with_prefix(self, prefix: str, limit: int = 5) -> list[str]:
+        """Hasta `limit` nombres registrados que empiezan con `prefix`."""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        names = self._names
+        i = bisect.bisect_left(names, prefix)
+        found = []
+        while i < len(names) and len(found) < limit and names[i].startswith(prefix):
+            found.append(names[i])
+            i += 1
+        return found
+
+    def suggest(self, name: str, max_len: int = 20) -> str | None:
+        """Variante libre de un nombre tomado (nombre2, nombre3, ...)."""
+        base = name.strip()
+        if not base:
+            return None
+        for n in range(2, 1000):
+            suffix = str(n)
+            candidate = base[:max_len - len(suffix)] + suffix
+            if candidate not in self:
+                return candidate
+        return None
+
+
+_indexes: dict[str, NameIndex] = {}
+
+
+def name_index(archivo: str | None = None) -> NameIndex:
+    """Índice compartido (y actualizado si cambió la base) para el repositorio de `archivo`."""
+    repo = scores.repository(archivo)
+    index = _indexes.get(repo.path)
+    if index is None:
+        index = _indexes[repo.path] = NameIndex(repo)
+    index.refresh()
+    return index
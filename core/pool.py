@@ -0,0 +1,64 @@
+"""Pools de objetos reutilizables.
+
+Las clases que se reciclan implementan `reset(...)` con los mismos argumentos que su
+__init__: acquire() reutiliza una instancia liberada (o crea una si no hay) y la reinicia;
+release() la devuelve al pool. Así las oleadas y recargas reciclan instancias en vez de
+asignar nuevas, y el recolector de basura no tiene pilas de objetos muertos que recorrer
+en plena transición de nivel.
+"""
+
+
+class ObjectPool:
+    """Pool de instancias de `cls` con adquisición y liberación explícitas."""
+
+    def __init__(self, cls: type, max_size: int = 1024) -> None:
+        self.cls = cls
+        self.max_size = max_size
+        self._free: list = []
+        self.created = 0
+
+    def __len__(self) -> int:
+        """Instancias libres disponibles para reutilizar."""
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs):
+        """Instancia reiniciada con `reset(*args, **kwargs)` (nueva solo si el pool está vacío)."""
+        if self._free:
+            obj = self._free.pop()
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.created += 1
+        obj.reset(*args, **kwargs)
+        return obj
+
+    def release(self, obj) -> None:
+        """Devuelve una instancia al pool (se descarta si el pool ya está lleno)."""
+        if __debug__:
+            self._check_not_free((obj,))
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def release_all(self, objs) -> None:
+        free = self._free
+        if __debug__:
+            objs = objs if isinstance(objs, list) else list(objs)
+            self._check_not_free(objs)
+        room = self.max_size - len(free)
+        if room > 0:
+            free.extend(objs[:room] if isinstance(objs, list) else list(objs)[:room])
+
+    def _check_not_free(self, objs) -> None:
+        # Liberar dos veces dejaría la misma instancia dos veces en _free: dos entidades vivas
+        # terminarían compartiéndola
+        seen = {id(o) for o in self._free}
+        for obj in objs:
+            assert id(obj) not in seen, f"{type(obj).__name__} liberado dos veces al pool"
+            seen.add(id(obj))
+
+    def prefill(self, count: int, *args, **kwargs) -> None:
+        """Crea por adelantado hasta `count` instancias libres (p.ej. durante la carga)."""
+        while len(self._free) < min(count, self.max_size):
+            obj = self.cls.__new__(self.cls)
+            obj.reset(*args, **kwargs)
+            self.created += 1
+            self._free.append(obj)
@@ -0,0 +1,207 @@
+"""Perfil de tiempos por fase de cada frame del juego.
+
+- Cada fase (entrada, jugador, enemigos, colisiones, spawn, nivel, render, HUD, present) suma
+  su tiempo del frame con lap(); al empezar el frame siguiente la fila se guarda en un ring
+  buffer de tamaño fijo (arreglos NumPy), junto con contadores: ticks de lógica, blits,
+  máscaras construidas y bloques de memoria asignados (neto) en el frame.
+- stats() da p50/p95/p99 por fase sobre la ventana; overlay() lo dibuja (F3 en el juego).
+- export() escribe la ventana como CSV (una fila por frame) y un resumen JSON.
+- capture(n) envuelve los próximos n frames en cProfile y guarda un .pstats (F4 en el juego,
+  o SPACE_PROFILE_CAPTURE=n al arrancar).
+
+Desactivado no cuesta nada: la simulación solo mide si su GameState tiene un profiler.
+"""
+import cProfile
+import csv
+import json
+import os
+import pstats
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from core.assets import assets
+from core.settings import PROFILE_CAPTURE_FRAMES, PROFILE_DIR, PROFILE_FRAMES, PROFILE_OVERLAY_EVERY
+
+PHASES = ('input', 'player', 'enemies', 'collisions', 'spawn', 'level', 'render', 'hud', 'present', 'frame')
+COUNTERS = ('ticks', 'blits', 'masks', 'alloc')
+_PHASE = {name: i for i, name in enumerate(PHASES)}
+_COUNTER = {name: i for i, name in enumerate(COUNTERS)}
+_FRAME = _PHASE['frame']
+
+
+def env_frames(name: str) -> int:
+    """Entero de una variable de entorno (0 si no está o no es un número)."""
+    try:
+        return int(os.environ.get(name, '0'))
+    except ValueError:
+        return 0
+
+
+class FrameProfiler:
+    def __init__(self, capacity: int = PROFILE_FRAMES, out_dir: str = PROFILE_DIR) -> None:
+        self.capacity = capacity
+        self.out_dir = out_dir
+        self.times = np.zeros((capacity, len(PHASES)))
+        self.counts = np.zeros((capacity, len(COUNTERS)), dtype=np.int64)
+        self.frames = 0  # frames cerrados en total (el ring buffer guarda los últimos `capacity`)
+        self.show_overlay = False
+        self._row = [0.0] * len(PHASES)
+        self._count = [0] * len(COUNTERS)
+        self._start: float | None = None
+        self._masks = 0
+        self._blocks = 0
+        self._overlay: pygame.Surface | None = None
+        self._overlay_frame = -1
+        self._profile: cProfile.Profile | None = None
+        self._capture_left = 0
+
+    # -------- Medición ---------
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def lap(self, phase: str, start: float) -> float:
+        """Suma a `phase` el tiempo desde `start` y retorna el instante actual (inicio de la siguiente)."""
+        now = time.perf_counter()
+        self._row[_PHASE[phase]] += now - start
+        return now
+
+    def count(self, counter: str, n: int = 1) -> None:
+        self._count[_COUNTER[counter]] += n
+
+    def begin_frame(self) -> None:
+        """Cierra el frame anterior (su duración total va a 'frame') y empieza uno nuevo."""
+        now = time.perf_counter()
+        # Una sola lectura (~10 µs) sirve de fin de este frame y de inicio del siguiente
+        blocks = sys.getallocatedblocks()
+        if self._start is not None:
+            self._row[_FRAME] = now - self._start
+            self._count[_COUNTER['masks']] = assets.mask_builds - self._masks
+            self._count[_COUNTER['alloc']] = blocks - self._blocks
+            i = self.frames % self.capacity
+            self.times[i] = self._row
+            self.counts[i] = self._count
+            self.frames += 1
+            if self._capture_left:
+                self._capture_left -= 1
+                if not self._capture_left:
+                    self._finish_capture()
+            self._row = [0.0] * len(PHASES)
+            self._count = [0] * len(COUNTERS)
+        self._start = now
+        self._masks = assets.mask_builds
+        self._blocks = blocks
+
+    def _window(self) -> tuple[np.ndarray, np.ndarray]:
+        """Filas guardadas en orden cronológico (tiempos en ms)."""
+        n = min(self.frames, self.capacity)
+        if self.frames <= self.capacity:
+            return self.times[:n] * 1000.0, self.counts[:n]
+        first = self.frames % self.capacity
+        return (np.roll(self.times, -first, axis=0) * 1000.0, np.roll(self.counts, -first, axis=0))
+
+    def stats(self) -> dict:
+        """p50/p95/p99 y media (ms) por fase, y media/máximo de cada contador, sobre la ventana."""
+        times, counts = self._window()
+        if not len(times):
+            return {'frames': 0, 'phases': {}, 'counters': {}}
+        pct = np.percentile(times, (50, 95, 99), axis=0)
+        mean = times.mean(axis=0)
+        return {
+            'frames': len(times),
+            'phases': {name: {'p50': float(pct[0, i]), 'p95': float(pct[1, i]), 'p99': float(pct[2, i]),
+                              'mean': float(mean[i])} for i, name in enumerate(PHASES)},
+            'counters': {name: {'mean': float(counts[:, i].mean()), 'max': int(counts[:, i].max())}
+                         for i, name in enumerate(COUNTERS)},
+        }
+
+    # -------- Overlay ---------
+    def overlay(self) -> pygame.Surface:
+        """Tabla de percentiles semitransparente (se recompone cada PROFILE_OVERLAY_EVERY frames)."""
+        if self._overlay is None or self.frames - self._overlay_frame >= PROFILE_OVERLAY_EVERY:
+            self._overlay = self._render_overlay(self.stats())
+            self._overlay_frame = self.frames
+        return self._overlay
+
+    def _render_overlay(self, stats: dict) -> pygame.Surface:
+        font = assets.font(18)
+        lines = [f"{'fase':<10}{'p50':>7}{'p95':>7}{'p99':>7}  ms ({stats['frames']} frames)"]
+        for name, p in stats['phases'].items():
+            lines.append(f"{name:<10}{p['p50']:7.2f}{p['p95']:7.2f}{p['p99']:7.2f}")
+        lines.append('  '.join(f"{name} {c['mean']:.0f}/{c['max']}" for name, c in stats['counters'].items()))
+        rendered = [font.render(line, True, (220, 255, 220)) for line in lines]
+        width = max(r.get_width() for r in rendered) + 12
+        height = sum(r.get_height() for r in rendered) + 12
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+        y = 6
+        for r in rendered:
+            surf.blit(r, (6, y))
+            y += r.get_height()
+        return surf
+
+    def draw(self, window: pygame.Surface) -> pygame.Rect | None:
+        """Dibuja el overlay (si está visible) en la esquina superior derecha."""
+        if not self.show_overlay:
+            return None
+        surf = self.overlay()
+        return window.blit(surf, (window.get_width() - surf.get_width() - 8, 48))
+
+    # -------- Exportar ---------
+    def _path(self, suffix: str) -> str:
+        """Ruta nueva en out_dir (no pisa exportaciones anteriores del mismo segundo)."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"frames_{time.strftime('%Y%m%d_%H%M%S')}")
+        path, n = base + suffix, 1
+        while os.path.exists(path):
+            n += 1
+            path = f"{base}_{n}{suffix}"
+        return path
+
+    def export(self) -> tuple[str, str] | None:
+        """CSV (una fila por frame de la ventana, ms y contadores) y resumen JSON. None si no hay datos."""
+        if not self.frames:
+            return None
+        times, counts = self._window()
+        csv_path = self._path('.csv')
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('n',) + PHASES + COUNTERS)
+            first = self.frames - len(times)
+            for i, (t, c) in enumerate(zip(times.tolist(), counts.tolist())):
+                writer.writerow([first + i] + [f"{v:.4f}" for v in t] + c)
+        json_path = self._path('.json')
+        with open(json_path, 'w') as f:
+            json.dump(self.stats(), f, indent=2)
+        return csv_path, json_path
+
+    # -------- cProfile ---------
+    @property
+    def capturing(self) -> bool:
+        return self._profile is not None
+
+    def capture(self, frames: int = PROFILE_CAPTURE_FRAMES) -> None:
+        """Perfila con cProfile los próximos `frames` frames (no hace nada si ya está capturando)."""
+        if self._profile is not None or frames <= 0:
+            return
+        self._profile = cProfile.Profile()
+        self._capture_left = frames
+        print(f"[Profile] Capturando {frames} frames con cProfile...")
+        self._profile.enable()
+
+    def _finish_capture(self) -> None:
+        profile, self._profile = self._profile, None
+        profile.disable()
+        path = self._path('.pstats')
+        profile.dump_stats(path)
+        print(f"[Profile] Guardado en '{path}'")
+        pstats.Stats(profile).sort_stats('cumulative').print_stats(15)
+
+    def close(self) -> None:
+        """Cierra una captura en curso (al salir antes de completar los frames)."""
+        if self._profile is not None:
+            self._capture_left = 0
+            self._finish_capture()
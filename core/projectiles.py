@@ -0,0 +1,188 @@
+"""Proyectiles del jugador y de los enemigos en arreglos preasignados.
+
+Todos los proyectiles viven en un ring buffer de capacidad fija (arreglos NumPy paralelos:
+posición, posición del tick anterior, velocidad vertical, tipo, dueño y bandera de activo).
+Disparar escribe en el siguiente slot del anillo (si sigue ocupado, se reemplaza el
+proyectil más antiguo); mover y descartar los que salen de pantalla es una sola pasada
+vectorizada, y todos se dibujan con un único Surface.blits(). No se crean objetos por
+proyectil ni se eliminan elementos de listas.
+
+Cada tipo (`kind`) es una imagen registrada con add_kind(); su máscara se cachea una vez.
+"""
+import numpy as np
+import pygame
+
+from core.assets import assets
+from core.collision import aabb_pairs
+from core.settings import TICK_DT, PROJECTILE_CAPACITY
+
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+# Márgenes fuera de pantalla a partir de los cuales un proyectil se descarta
+CULL_TOP = -40
+
+
+class ProjectileManager:
+    """Ring buffer de proyectiles con movimiento, descarte, colisiones y dibujo por lotes."""
+
+    def __init__(self, capacity: int = PROJECTILE_CAPACITY) -> None:
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_x = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.kind = np.zeros(capacity, dtype=np.int16)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        # Orden de disparo: decide qué proyectil impacta primero cuando varios tocan al mismo blanco
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self._next_seq = 0
+        self._head = 0
+        # Cantidad activa por dueño (evita recorrer los arreglos cuando no hay nada)
+        self.counts = [0, 0]
+        self.images: list[pygame.Surface] = []
+        self.masks: list[pygame.mask.Mask] = []
+        self._widths = np.zeros(0, dtype=np.int64)
+        self._heights = np.zeros(0, dtype=np.int64)
+
+    def add_kind(self, image: pygame.Surface) -> int:
+        """Registra una imagen de proyectil y retorna su tipo (la misma imagen da el mismo tipo)."""
+        for kind, registered in enumerate(self.images):
+            if registered is image:
+                return kind
+        self.images.append(image)
+        self.masks.append(assets.mask(image))
+        self._widths = np.array([img.get_width() for img in self.images], dtype=np.int64)
+        self._heights = np.array([img.get_height() for img in self.images], dtype=np.int64)
+        return len(self.images) - 1
+
+    def count(self, owner: int | None = None) -> int:
+        return sum(self.counts) if owner is None else self.counts[owner]
+
+    def __len__(self) -> int:
+        return self.count()
+
+    # -------- Altas y bajas ---------
+    def spawn(self, x: float, y: float, vy: float, kind: int, owner: int = OWNER_PLAYER) -> int:
+        """Escribe un proyectil en el siguiente slot del anillo y retorna el slot."""
+        slot = self._head
+        self._head = (slot + 1) % self.capacity
+        if self.active[slot]:
+            self.counts[self.owner[slot]] -= 1
+        self.x[slot] = self.prev_x[slot] = x
+        self.y[slot] = self.prev_y[slot] = y
+        self.vy[slot] = vy
+        self.kind[slot] = kind
+        self.owner[slot] = owner
+        self.active[slot] = True
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+        self.counts[owner] += 1
+        return slot
+
+    def kill(self, slots) -> None:
+        for slot in slots:
+            if self.active[slot]:
+                self.active[slot] = False
+                self.counts[self.owner[slot]] -= 1
+
+    def clear(self, owner: int | None = None) -> None:
+        """Desactiva todos los proyectiles (o solo los de un dueño)."""
+        if owner is None:
+            self.active[:] = False
+            self.counts = [0, 0]
+        else:
+            self.active[self.owner == owner] = False
+            self.counts[owner] = 0
+
+    # -------- Simulación ---------
+    def save_previous(self) -> None:
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+
+    def update(self, height: int, dt: float = TICK_DT) -> None:
+        """Mueve todos los proyectiles activos y descarta los que salieron de pantalla."""
+        if not (self.counts[0] or self.counts[1]):
+            return
+        active = self.active
+        self.y[active] += self.vy[active] * dt
+        gone = active & ((self.y <= CULL_TOP) | (self.y >= height))
+        if gone.any():
+            active &= ~gone
+            self.counts = [int(np.count_nonzero(active & (self.owner == o))) for o in (OWNER_PLAYER, OWNER_ENEMY)]
+
+    def slots(self, owner: int) -> np.ndarray:
+        """Slots activos de un dueño, en orden de disparo."""
+        slots = np.flatnonzero(self.active & (self.owner == owner))
+        return slots[np.argsort(self.seq[slots], kind="stable")]
+
+    def contacts(self, owner: int, boxes, mask_of) -> dict[int, list[int]]:
+        """Contactos de los proyectiles de `owner` contra un grupo de blancos, en un solo lote.
+
+        `boxes` son los rects (x, y, w, h) de los blancos y `mask_of(i)` la máscara del blanco i.
+        La fase amplia (collision.aabb_pairs) descarta los pares que no se tocan y solo se
+        comparan máscaras en los que quedan. Retorna {índice de blanco: [slots que lo tocan,
+        en orden de disparo]}.
+        """
+        if not self.counts[owner] or not len(boxes):
+            return {}
+        slots = self.slots(owner)
+        kind = self.kind[slots]
+        px = self.x[slots].astype(np.int64)
+        py = self.y[slots].astype(np.int64)
+        shots = np.stack((px, py, self._widths[kind], self._heights[kind]), axis=1)
+        boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        result: dict[int, list[int]] = {}
+        masks = self.masks
+        # Pares en orden de disparo: la lista de cada blanco queda ordenada
+        for s, t in zip(*aabb_pairs(shots, boxes)):
+            offset = (int(px[s] - boxes[t, 0]), int(py[s] - boxes[t, 1]))
+            if mask_of(t).overlap(masks[kind[s]], offset) is not None:
+                result.setdefault(int(t), []).append(int(slots[s]))
+        return result
+
+    # -------- Dibujo ---------
+    def draw(self, window: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        """Dibuja todos los proyectiles activos, interpolados, en un único blits()."""
+        if not (self.counts[0] or self.counts[1]):
+            return []
+        slots = np.flatnonzero(self.active)
+        x = self.prev_x[slots] + (self.x[slots] - self.prev_x[slots]) * alpha
+        y = self.prev_y[slots] + (self.y[slots] - self.prev_y[slots]) * alpha
+        images = self.images
+        return window.blits([(images[k], (int(px), int(py))) for k, px, py in
+                             zip(self.kind[slots].tolist(), x.tolist(), y.tolist())])
+
+    # -------- Snapshots ---------
+    def snapshot(self) -> dict:
+        """Estado del anillo para keyframes: cabeza, contador de disparos y filas activas.
+
+        Filas (slot, seq, x, y, prev_x, prev_y, vy, kind, owner). Con el anillo lleno el próximo
+        disparo pisa el slot de la cabeza, así que slots y cabeza se guardan tal cual: un seek
+        sigue igual que la partida grabada.
+        """
+        slots = np.flatnonzero(self.active)
+        return {
+            "head": self._head,
+            "next_seq": self._next_seq,
+            "rows": list(zip(slots.tolist(), self.seq[slots].tolist(), self.x[slots].tolist(),
+                             self.y[slots].tolist(), self.prev_x[slots].tolist(), self.prev_y[slots].tolist(),
+                             self.vy[slots].tolist(), self.kind[slots].tolist(), self.owner[slots].tolist())),
+        }
+
+    def restore(self, snap: dict) -> None:
+        """Vuelve al estado de un snapshot(): mismos slots, cabeza y orden de disparo."""
+        self.clear()
+        for slot, seq, x, y, prev_x, prev_y, vy, kind, owner in snap["rows"]:
+            self.x[slot], self.y[slot] = x, y
+            self.prev_x[slot], self.prev_y[slot] = prev_x, prev_y
+            self.vy[slot] = vy
+            self.kind[slot] = kind
+            self.owner[slot] = owner
+            self.seq[slot] = seq
+            self.active[slot] = True
+            self.counts[owner] += 1
+        self._head = int(snap["head"]) % self.capacity
+        self._next_seq = int(snap["next_seq"])
@@ -0,0 +1,126 @@
+"""Grabación y reproducción de partidas.
+
+Un replay guarda la semilla de la partida y un byte de entrada por tick (bits de
+core.inputs), comprimido. Cada KEYFRAME_INTERVAL ticks se guarda además un snapshot
+del estado, de modo que `seek(tick)` restaura el keyframe más cercano y solo simula
+los ticks restantes en vez de todo desde el tick 0.
+
+Formato del archivo:
+    cabecera <4sHIHIIII: MAGIC, versión, semilla, tick_rate, ticks, intervalo de keyframes,
+                         bytes de entradas comprimidas, bytes de keyframes comprimidos
+    entradas   zlib(1 byte por tick)
+    keyframes  zlib(JSON {tick: snapshot})
+
+Los replays se comparten para reproducir errores, así que cargar uno no ejecuta nada: los
+keyframes son JSON de tipos básicos. Un replay grabado con otro TICK_RATE se rechaza (con
+otro paso fijo la misma secuencia de entradas daría otra partida).
+"""
+import bisect
+import json
+import struct
+import zlib
+
+from core.settings import TICK_RATE
+from core.simulation import GameState, step
+
+MAGIC = b"SIRP"
+VERSION = 4
+KEYFRAME_INTERVAL = 600  # ~10 s de juego a 60 ticks/s
+_HEADER = struct.Struct("<4sHIHIIII")
+
+
+class Replay:
+    """Contenido de un archivo de replay: semilla, entradas por tick y keyframes."""
+
+    def __init__(self, seed: int, inputs: bytes | bytearray = b"", keyframes: dict | None = None,
+                 tick_rate: int = TICK_RATE, keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        self.seed = seed
+        self.inputs = bytearray(inputs)
+        self.keyframes: dict[int, dict] = keyframes if keyframes is not None else {}
+        self.tick_rate = tick_rate
+        self.keyframe_interval = keyframe_interval
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def save(self, path: str) -> None:
+        packed_inputs = zlib.compress(bytes(self.inputs), 9)
+        packed_keyframes = zlib.compress(json.dumps(self.keyframes, separators=(",", ":")).encode(), 6)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate, len(self.inputs),
+                                 self.keyframe_interval, len(packed_inputs), len(packed_keyframes)))
+            f.write(packed_inputs)
+            f.write(packed_keyframes)
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, tick_rate, ticks, interval, n_inputs, n_keyframes = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' no es un replay válido (versión {VERSION})")
+        if tick_rate != TICK_RATE:
+            raise ValueError(f"Replay '{path}' grabado a {tick_rate} ticks/s; el juego corre a {TICK_RATE}")
+        offset = _HEADER.size
+        inputs = zlib.decompress(data[offset:offset + n_inputs])
+        offset += n_inputs
+        # JSON guarda las claves como texto: volver a ticks enteros
+        keyframes = {int(tick): snap for tick, snap in
+                     json.loads(zlib.decompress(data[offset:offset + n_keyframes])).items()}
+        if len(inputs) != ticks:
+            raise ValueError(f"Replay '{path}' truncado: {len(inputs)} de {ticks} ticks")
+        return cls(seed, inputs, keyframes, tick_rate=tick_rate, keyframe_interval=interval)
+
+
+class ReplayRecorder:
+    """Graba las entradas de una partida en curso; llamar record() justo antes de cada step()."""
+
+    def __init__(self, state: GameState, keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        self.replay = Replay(state.seed, keyframe_interval=keyframe_interval)
+
+    def record(self, state: GameState, inputs: int) -> None:
+        tick = len(self.replay.inputs)
+        if tick % self.replay.keyframe_interval == 0:
+            # Estado tras `tick` ticks, antes de aplicar la entrada de este tick
+            self.replay.keyframes[tick] = state.snapshot()
+        self.replay.inputs.append(inputs & 0xFF)
+
+    def save(self, path: str) -> None:
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    """Reproduce un replay sin límite de velocidad, con búsqueda rápida por keyframes."""
+
+    def __init__(self, replay: Replay) -> None:
+        self.replay = replay
+        self._keyframe_ticks = sorted(replay.keyframes)
+        self.state = GameState(seed=replay.seed)
+        self.tick = 0
+        if 0 in replay.keyframes:
+            # El keyframe inicial fija vidas/nivel/récord con los que se grabó
+            self.state.restore(replay.keyframes[0])
+
+    def seek(self, tick: int) -> GameState:
+        """Deja el estado como estaba tras `tick` ticks y lo devuelve."""
+        tick = max(0, min(tick, len(self.replay)))
+        i = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        start = self._keyframe_ticks[i] if i >= 0 else 0
+        # Si el objetivo está por delante y no hay un keyframe más cercano, basta con seguir simulando
+        if tick < self.tick or start > self.tick:
+            if i >= 0:
+                self.state.restore(self.replay.keyframes[start])
+            else:
+                self.state = GameState(seed=self.replay.seed)
+            self.tick = start
+        return self.advance(tick - self.tick)
+
+    def advance(self, ticks: int | None = None) -> GameState:
+        """Simula `ticks` ticks (o hasta el final del replay si es None) lo más rápido posible."""
+        end = len(self.replay) if ticks is None else min(len(self.replay), self.tick + ticks)
+        inputs = self.replay.inputs
+        state = self.state
+        for t in range(self.tick, end):
+            step(state, inputs[t])
+        self.tick = max(self.tick, end)
+        return state
@@ -0,0 +1,189 @@
+"""Escenas y bucle principal único.
+
+Todas las pantallas (Acerca de, menú, nombre, juego, nivel completado, game over, puntajes)
+son escenas en una pila que maneja un solo SceneManager sobre una sola ventana:
+
+- la escena de arriba recibe los eventos, avanza con el tiempo real y se dibuja;
+- las transiciones son cambios de pila (push/pop/replace) dentro del mismo bucle, no
+  bucles anidados con su propio clock: los eventos que llegan durante un cambio pasan a
+  la escena nueva en vez de perderse;
+- una escena animada (timeout() == 0) corre a su `fps`; una quieta duerme en
+  pygame.event.wait hasta un evento o hasta el plazo que pida.
+"""
+import time
+
+import pygame
+
+from core import ui
+from core.assets import assets
+from core.settings import FPS
+
+
+class Scene:
+    """Pantalla manejada por SceneManager. Las subclases redefinen lo que necesiten."""
+
+    titulo: str | None = None  # título de la ventana mientras la escena está arriba
+    fps: int = FPS
+    # Assets que usará la escena, como argumentos de AssetManager.prefetch (se decodifican
+    # por adelantado mientras otra pantalla está arriba; ver MenuAcercaDe)
+    PRECARGA: dict = {}
+    manager: "SceneManager | None" = None
+
+    def enter(self) -> None:
+        """Al entrar a la pila."""
+
+    def exit(self) -> None:
+        """Al salir de la pila (también al cerrar el programa)."""
+
+    def resume(self) -> None:
+        """Al volver a quedar arriba porque se quitó la escena que la tapaba."""
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        """Avanza `dt` segundos de tiempo real."""
+
+    def draw(self, window: pygame.Surface) -> None:
+        """Dibuja y presenta (la escena decide si hace falta)."""
+
+    def timeout(self) -> int | None:
+        """Milisegundos que la escena puede dormir sin eventos (0: cada frame, None: sin plazo)."""
+        return 0
+
+
+class MessageScene(Scene):
+    """Mensaje centrado sobre negro durante `duracion` segundos (nivel completado, game over).
+
+    Al terminar se quita de la pila, o se reemplaza por `siguiente()` si se indica.
+    """
+
+    def __init__(self, texto: str, color: tuple, duracion: float, siguiente=None, titulo: str | None = None) -> None:
+        self.texto = texto
+        self.color = color
+        self.duracion = duracion
+        self.siguiente = siguiente
+        self.titulo = titulo
+        self.restante = duracion
+        self._dibujado = False
+
+    def enter(self) -> None:
+        self.restante = self.duracion
+        self._dibujado = False
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in ui.EVENTOS_EXPOSICION:
+            self._dibujado = False
+
+    def update(self, dt: float) -> None:
+        self.restante -= dt
+        if self.restante <= 0:
+            if self.siguiente is not None:
+                self.manager.replace(self.siguiente())
+            else:
+                self.manager.pop()
+
+    def draw(self, window: pygame.Surface) -> None:
+        if self._dibujado:
+            return
+        window.fill((0, 0, 0))
+        msg = assets.font(28).render(self.texto, True, self.color)
+        window.blit(msg, ((window.get_width() - msg.get_width()) // 2,
+                          (window.get_height() - msg.get_height()) // 2))
+        pygame.display.update()
+        self._dibujado = True
+
+    def timeout(self) -> int | None:
+        # Nada se mueve: dormir hasta que venza el mensaje
+        return max(1, int(self.restante * 1000))
+
+
+class SceneManager:
+    """Pila de escenas con un único bucle, un único clock y una única ventana."""
+
+    def __init__(self, window: pygame.Surface | None = None) -> None:
+        self.window = window if window is not None else ui.ventana()
+        self.clock = pygame.time.Clock()
+        self.stack: list[Scene] = []
+        self.running = False
+        self.quit_requested = False  # se cerró la ventana (no solo se vació la pila)
+
+    @property
+    def current(self) -> Scene | None:
+        return self.stack[-1] if self.stack else None
+
+    def _activate(self, scene: Scene) -> None:
+        if scene.titulo:
+            pygame.display.set_caption(scene.titulo)
+
+    def push(self, scene: Scene) -> None:
+        scene.manager = self
+        self.stack.append(scene)
+        self._activate(scene)
+        scene.enter()
+
+    def pop(self) -> Scene | None:
+        """Quita la escena de arriba; la de abajo (si hay) se reanuda."""
+        if not self.stack:
+            return None
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self._activate(self.stack[-1])
+            self.stack[-1].resume()
+        return scene
+
+    def replace(self, scene: Scene) -> None:
+        """Cambia la escena de arriba por otra (sin reanudar la de abajo entre medio)."""
+        if self.stack:
+            self.stack.pop().exit()
+        self.push(scene)
+
+    def quit(self) -> None:
+        self.quit_requested = True
+        self.running = False
+
+    def run(self, scene: Scene | None = None) -> None:
+        """Bucle principal: corre hasta que la pila se vacía o se cierra la ventana."""
+        if scene is not None:
+            self.push(scene)
+        self.running = True
+        if self.stack:
+            # Primer cuadro antes de esperar eventos (una escena quieta podría dormir sin dibujarse)
+            self.stack[-1].update(0.0)
+            if self.stack:
+                self.stack[-1].draw(self.window)
+        previous = time.perf_counter()
+        while self.running and self.stack:
+            scene = self.stack[-1]
+            timeout = scene.timeout()
+            events = pygame.event.get() if timeout == 0 else ui.esperar_eventos(timeout)
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.quit()
+                    break
+                # Siempre a la escena de arriba en este momento (puede haber cambiado)
+                if self.stack:
+                    self.stack[-1].handle_event(event)
+            if not self.running or not self.stack:
+                break
+
+            now = time.perf_counter()
+            dt = now - previous  # sin tope: cada escena acota su propio atraso
+            previous = now
+            scene = self.stack[-1]
+            scene.update(dt)
+            # Si update hizo una transición, la escena nueva se actualiza y dibuja ya
+            while self.stack and self.stack[-1] is not scene:
+                scene = self.stack[-1]
+                scene.update(0.0)
+            if not self.stack:
+                break
+            scene.draw(self.window)
+            if scene.timeout() == 0:
+                self.clock.tick(scene.fps)
+        if self.quit_requested:
+            # Cerrar todas las escenas (guardar replays, puntajes, etc.)
+            while self.stack:
+                self.stack.pop().exit()
+        self.running = False
@@ -0,0 +1,125 @@
+"""Fusión de archivos de puntajes de varias máquinas (`python -m core.score_merge`).
+
+Recorre uno o más archivos `nombre,puntaje` por memory map, en bloques, sin cargar las
+líneas en una lista ni ordenar el total:
+
+- con `--top K`, mantiene solo los K mejores jugadores en un heap acotado (core.scores.TopK),
+  con memoria O(K) sin importar cuántas líneas haya;
+- sin `--top`, deduplica el mejor puntaje de cada jugador en un dict {bytes: int} (claves en
+  bytes, sin decodificar cada línea) y escribe todos los jugadores.
+
+El resultado se escribe en el mismo formato `nombre,puntaje` (de mayor a menor), con
+reemplazo atómico.
+
+    python -m core.score_merge salida.txt maquina1.txt maquina2.txt --top 1000
+"""
+import argparse
+import mmap
+import os
+import sys
+import time
+
+from core.scores import TopK, parse_line
+
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def iter_lines(path: str, chunk_size: int = CHUNK_SIZE):
+    """Líneas (bytes, sin salto) de un archivo leído por mmap en bloques de chunk_size."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    # Cortar en el último salto de línea del bloque
+                    nl = mm.rfind(b"\n", start, end)
+                    end = nl + 1 if nl >= start else mm.find(b"\n", end) + 1 or size
+                yield from mm[start:end].splitlines()
+                start = end
+
+
+def parse_record(line: bytes) -> tuple[bytes, int] | None:
+    """(nombre, puntaje) de una línea; camino rápido para `nombre,puntaje` sin decodificar."""
+    name, sep, rest = line.partition(b",")
+    if sep:
+        name = name.strip()
+        try:
+            return (name, int(rest.split(b",", 1)[0])) if name else None
+        except ValueError:
+            return None
+    parsed = parse_line(line.decode('utf-8', 'replace'))
+    return (parsed[0].encode('utf-8'), parsed[1]) if parsed else None
+
+
+def merge(paths: list[str], top: int | None = None) -> list[tuple[bytes, int]]:
+    """Mejor puntaje por jugador de todos los archivos (solo los `top` mejores si se indica)."""
+    if top is not None:
+        best = TopK(top)
+        for path in paths:
+            for line in iter_lines(path):
+                rec = parse_record(line)
+                if rec is not None:
+                    threshold = best.threshold()
+                    if threshold is None or rec[1] > threshold:
+                        best.offer(rec[0], rec[1], rec[0].lower())
+        return best.items()
+
+    # Clave en minúsculas -> puntaje; el nombre visible se guarda solo si difiere de la clave
+    scores: dict[bytes, int] = {}
+    names: dict[bytes, bytes] = {}
+    for path in paths:
+        for line in iter_lines(path):
+            rec = parse_record(line)
+            if rec is None:
+                continue
+            name, score = rec
+            key = name.lower()
+            prev = scores.get(key)
+            if prev is None or score > prev:
+                scores[key] = score
+                if key != name:
+                    names[key] = name
+                elif prev is not None:
+                    names.pop(key, None)
+    rows = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+    return [(names.get(k, k), s) for k, s in rows]
+
+
+def write(rows: list[tuple[bytes, int]], out_path: str) -> None:
+    """Escribe `nombre,puntaje` por línea con reemplazo atómico."""
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.writelines(b"%s,%d\n" % (name, score) for name, score in rows)
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core.score_merge",
+                                     description="Fusiona archivos de puntajes (mejor puntaje por jugador)")
+    parser.add_argument("salida", help="archivo fusionado a escribir (nombre,puntaje)")
+    parser.add_argument("entradas", nargs="+", help="archivos de puntajes a fusionar")
+    parser.add_argument("--top", type=int, default=None, help="conservar solo los K mejores jugadores")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        rows = merge(args.entradas, args.top)
+    except OSError as e:
+        print(f"[Scores] No se pudo leer: {e}")
+        return 1
+    write(rows, args.salida)
+    elapsed = time.perf_counter() - inicio
+    print(f"[Scores] {len(rows)} jugadores -> '{args.salida}' en {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
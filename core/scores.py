@@ -0,0 +1,423 @@
+"""Repositorio de puntajes en SQLite.
+
+Un solo lugar para leer y guardar puntajes (antes había cinco parsers de scores.txt):
+
+- Tabla `scores` con una fila por jugador (nombre sin distinguir mayúsculas como clave
+  primaria) y un índice por puntaje: top-N, mejor puntaje de un jugador y existencia de
+  un nombre son búsquedas por índice, no recorridos del archivo.
+- Modo WAL + busy_timeout: lectores y un escritor conviven (varias máquinas pueden abrir
+  la misma base), y cada guardado es un upsert de una fila en vez de reescribir todo.
+- Los scores.txt heredados (`nombre,puntaje` por línea) se importan al abrir la base si
+  son nuevos o cambiaron desde la última importación (por mtime/tamaño).
+
+Las rutas relativas se resuelven contra PROJECT_ROOT, para que todos los lectores usen el
+mismo archivo sin importar el directorio actual.
+
+El juego no escribe en disco desde el bucle de frames: `writer()` devuelve un ScoreWriter
+que encola los guardados, actualiza su top-N en memoria al instante y persiste por lotes
+en un hilo de fondo. El texto `nombre,puntaje` se reexporta (atómico) al cerrar o con
+export(), no tras cada lote: con cientos de miles de filas sería reescribir todo por guardado.
+"""
+import atexit
+import heapq
+import os
+import sqlite3
+import threading
+import time
+
+from core.settings import PROJECT_ROOT, SCORES_DB_PATH, SCORES_TXT_PATH
+
+BUSY_TIMEOUT = 5.0  # segundos esperando un lock de otro proceso antes de fallar
+BATCH_DELAY = 0.25  # segundos que el escritor espera para juntar guardados en un lote
+RETRY_DELAY = 1.0   # segundos antes de reintentar un lote que falló
+TOP_CACHE = 10      # filas del top que el escritor mantiene en memoria
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    name_key   TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    score      INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, name_key);
+CREATE TABLE IF NOT EXISTS imports (
+    path  TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size  INTEGER NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO scores (name_key, name, score, updated_at) VALUES (?, ?, ?, ?)
+ON CONFLICT (name_key) DO UPDATE SET
+    score = excluded.score, updated_at = excluded.updated_at
+WHERE excluded.score > scores.score
+"""
+
+
+def parse_line(linea: str) -> tuple[str, int] | None:
+    """(nombre, puntaje) de una línea `nombre,puntaje` (también acepta `;` o espacios)."""
+    linea = linea.strip()
+    if not linea:
+        return None
+    sep = ',' if ',' in linea else (';' if ';' in linea else None)
+    partes = linea.split(sep) if sep else linea.split()
+    if len(partes) < 2:
+        return None
+    nombre = partes[0].strip()
+    try:
+        puntaje = int(partes[1])
+    except ValueError:
+        return None
+    return (nombre, puntaje) if nombre else None
+
+
+class TopK:
+    """Top-K por jugador (su mejor puntaje) con memoria O(K).
+
+    Un heap de mínimos acotado a K jugadores: un puntaje que no supera al peor del heap se
+    descarta sin más; si el jugador ya está, se agrega la entrada nueva y la vieja queda
+    obsoleta (se descarta al llegar a la cima). Es exacto: el umbral solo sube, así que un
+    jugador desalojado no podía estar entre los K mejores con ese puntaje.
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self._heap: list[tuple[int, str]] = []
+        self._best: dict[str, tuple[str, int]] = {}  # clave -> (nombre, puntaje) vigente en el heap
+
+    def __len__(self) -> int:
+        return len(self._best)
+
+    def _prune(self) -> None:
+        heap, best = self._heap, self._best
+        while heap and best.get(heap[0][1], (None, None))[1] != heap[0][0]:
+            heapq.heappop(heap)
+
+    def threshold(self) -> int | None:
+        """Puntaje mínimo para entrar (None mientras haya lugar)."""
+        if len(self._best) < self.k:
+            return None
+        self._prune()
+        return self._heap[0][0]
+
+    def offer(self, name: str, score: int, key: str | None = None) -> bool:
+        """Considera un puntaje; retorna True si cambió el top."""
+        if self.k <= 0:
+            return False
+        key = key if key is not None else name.lower()
+        current = self._best.get(key)
+        if current is not None:
+            if score <= current[1]:
+                return False
+        elif len(self._best) >= self.k:
+            if score <= self.threshold():
+                return False
+            _, evicted = heapq.heappop(self._heap)
+            del self._best[evicted]
+        self._best[key] = (name, score)
+        heapq.heappush(self._heap, (score, key))
+        if len(self._heap) > 4 * self.k:
+            # Demasiadas entradas obsoletas: reconstruir solo con las vigentes
+            self._heap = [(p, k) for k, (_, p) in self._best.items()]
+            heapq.heapify(self._heap)
+        return True
+
+    def items(self) -> list[tuple[str, int]]:
+        """(nombre, puntaje) de mayor a menor."""
+        return sorted(self._best.values(), key=lambda row: row[1], reverse=True)
+
+
+def _resolve(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+class ScoreRepository:
+    """Puntajes (mejor puntaje por jugador) guardados en una base SQLite."""
+
+    def __init__(self, path: str = SCORES_DB_PATH, legacy_path: str | None = SCORES_TXT_PATH) -> None:
+        self.path = _resolve(path)
+        self.legacy_path = _resolve(legacy_path) if legacy_path else None
+        # Una conexión por hilo (sqlite3 no comparte conexiones entre hilos por defecto)
+        self._local = threading.local()
+        self._ready = False
+        self._lock = threading.Lock()
+
+    # -------- Conexión ---------
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                if not self._ready:
+                    conn.executescript(_SCHEMA)
+                    self._ready = True
+                    if self.legacy_path:
+                        self._import_if_changed(conn, self.legacy_path)
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # -------- Consultas ---------
+    def top(self, n: int = 5) -> list[tuple[str, int]]:
+        """Los n mejores (nombre, puntaje), de mayor a menor."""
+        return self._conn().execute(
+            "SELECT name, score FROM scores ORDER BY score DESC, name_key LIMIT ?", (n,)).fetchall()
+
+    def best(self, name: str) -> int | None:
+        """Mejor puntaje guardado para un nombre (None si no existe)."""
+        row = self._conn().execute("SELECT score FROM scores WHERE name_key = ?", (name.strip().lower(),)).fetchone()
+        return row[0] if row else None
+
+    def exists(self, name: str) -> bool:
+        return self.best(name) is not None
+
+    def names(self) -> list[str]:
+        """Todos los nombres (en minúsculas), ordenados."""
+        return [r[0] for r in self._conn().execute("SELECT name_key FROM scores ORDER BY name_key")]
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def ranked(self, batch: int = 10000):
+        """Todos los (nombre, puntaje) de mayor a menor, en lotes de `batch` (recorre el índice, sin ordenar)."""
+        cur = self._conn().execute("SELECT name, score FROM scores ORDER BY score DESC, name_key")
+        while True:
+            rows = cur.fetchmany(batch)
+            if not rows:
+                return
+            yield rows
+
+    def stamp(self) -> tuple:
+        """Firma de la base (mtime/tamaño del archivo y de su WAL, donde caen las escrituras)."""
+        stamp = []
+        for p in (self.path, self.path + "-wal"):
+            try:
+                st = os.stat(p)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    # -------- Escritura ---------
+    def save(self, name: str, score: int) -> None:
+        """Guarda el puntaje si supera el previo del jugador (o si el jugador es nuevo)."""
+        self.save_many([(name, score)])
+
+    def save_many(self, rows) -> None:
+        """Upsert (se queda con el máximo por jugador) de varios (nombre, puntaje) en una transacción."""
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.executemany(_UPSERT, ((n.strip().lower(), n.strip(), int(p), now)
+                                       for n, p in rows if n and n.strip()))
+
+    def import_text(self, path: str) -> None:
+        """Importa un archivo `nombre,puntaje` (mejor puntaje por jugador) en una transacción."""
+        self._import(self._conn(), _resolve(path))
+
+    def _import(self, conn: sqlite3.Connection, path: str) -> None:
+        now = time.time()
+        with open(path, 'r', encoding='utf-8', errors='replace') as f, conn:
+            conn.executemany(_UPSERT, ((n.lower(), n, p, now) for n, p in filter(None, map(parse_line, f))))
+            st = os.stat(path)
+            conn.execute("INSERT OR REPLACE INTO imports (path, mtime, size) VALUES (?, ?, ?)",
+                         (path, st.st_mtime, st.st_size))
+
+    def export_text(self, path: str) -> None:
+        """Escribe todos los puntajes como `nombre,puntaje` (desc) con reemplazo atómico.
+
+        Se escribe a un temporal en el mismo directorio y se renombra con os.replace, así
+        ningún lector ve el archivo a medio escribir. El export queda registrado como ya
+        importado para no volver a leerlo al abrir la base.
+        """
+        path = _resolve(path)
+        conn = self._conn()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                rows = conn.execute("SELECT name, score FROM scores ORDER BY score DESC, name_key")
+                f.writelines(f"{n},{p}\n" for n, p in rows)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        st = os.stat(path)
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO imports (path, mtime, size) VALUES (?, ?, ?)",
+                         (path, st.st_mtime, st.st_size))
+
+    def _import_if_changed(self, conn: sqlite3.Connection, path: str) -> None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        row = conn.execute("SELECT mtime, size FROM imports WHERE path = ?", (path,)).fetchone()
+        if row and row[0] == st.st_mtime and row[1] == st.st_size:
+            return
+        try:
+            self._import(conn, path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[Scores] No se pudo importar '{path}': {e}")
+
+
+class ScoreWriter:
+    """Guardado de puntajes en segundo plano.
+
+    submit() nunca toca el disco: combina el puntaje en la cola pendiente (un valor por
+    jugador, el mayor) y en el top en memoria. Un hilo de fondo vacía la cola por lotes
+    con save_many(). close() (también registrado con atexit) espera a que se vacíe la cola
+    y, si hay `export_path` y se guardó algo, reescribe el texto una vez de forma atómica.
+    """
+
+    def __init__(self, repo: ScoreRepository, export_path: str | None = None, top_n: int = TOP_CACHE) -> None:
+        self.repo = repo
+        self.export_path = export_path
+        self.top_n = top_n
+        self._pending: dict[str, tuple[str, int]] = {}
+        self._busy = False
+        self._closed = False
+        self._dirty = False  # hay lotes guardados que el texto exportado todavía no tiene
+        self._export_lock = threading.Lock()  # un export a la vez (comparten el temporal)
+        self._cond = threading.Condition()
+        self._top: TopK | None = None
+        self._thread: threading.Thread | None = None
+
+    def top(self, n: int = 5) -> list[tuple[str, int]]:
+        """Top n en memoria (se lee de la base solo la primera vez)."""
+        with self._cond:
+            if self._top is None:
+                self._top = TopK(self.top_n)
+                for row_name, row_score in self.repo.top(self.top_n):
+                    self._top.offer(row_name, row_score)
+            return self._top.items()[:n]
+
+    def submit(self, name: str, score: int) -> None:
+        """Encola un puntaje y actualiza el top en memoria; no bloquea."""
+        name = name.strip()
+        if not name:
+            return
+        key = name.lower()
+        with self._cond:
+            prev = self._pending.get(key)
+            if prev is None or score > prev[1]:
+                self._pending[key] = (name, score)
+            if self._top is not None:
+                self._top.offer(name, score, key)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ScoreWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Espera a que la cola quede vacía y escrita; retorna False si venció el plazo."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def export(self, timeout: float | None = None) -> bool:
+        """Espera la cola y reescribe ya el texto exportado. Retorna False si no se pudo."""
+        if not self.export_path or not self.flush(timeout):
+            return False
+        with self._cond:
+            self._dirty = True
+        return self._export()
+
+    def _export(self) -> bool:
+        with self._export_lock:
+            with self._cond:
+                if not (self.export_path and self._dirty):
+                    return True
+                self._dirty = False
+            try:
+                self.repo.export_text(self.export_path)
+                return True
+            except (OSError, sqlite3.Error) as e:
+                print(f"[Scores] No se pudo exportar '{self.export_path}': {e}")
+                with self._cond:
+                    self._dirty = True
+                return False
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    break
+                if not self._closed:
+                    # Dar tiempo a que lleguen más guardados y escribirlos juntos
+                    self._cond.wait_for(lambda: self._closed, BATCH_DELAY)
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            try:
+                self.repo.save_many(batch.values())
+                with self._cond:
+                    self._dirty = True
+            except (OSError, sqlite3.Error) as e:
+                print(f"[Scores] No se pudieron guardar {len(batch)} puntajes: {e}")
+                with self._cond:
+                    if not self._closed:
+                        # Devolver el lote a la cola (sin pisar puntajes más altos llegados después)
+                        for key, row in batch.items():
+                            if key not in self._pending or row[1] > self._pending[key][1]:
+                                self._pending[key] = row
+                        self._cond.wait_for(lambda: self._closed, RETRY_DELAY)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+        # Cerrando con la cola vacía: un solo export con todo lo guardado en la sesión
+        self._export()
+
+
+_repositories: dict[str, ScoreRepository] = {}
+_writers: dict[str, ScoreWriter] = {}
+
+
+def repository(archivo: str | None = None) -> ScoreRepository:
+    """Repositorio compartido para un archivo de puntajes heredado.
+
+    `archivo` es la ruta de texto que usaban los llamadores ("scores.txt"); la base vive
+    al lado con extensión .db y ese texto se importa si existe.
+    """
+    legacy = _resolve(archivo) if archivo else SCORES_TXT_PATH
+    db_path = SCORES_DB_PATH if legacy == SCORES_TXT_PATH else os.path.splitext(legacy)[0] + ".db"
+    repo = _repositories.get(db_path)
+    if repo is None:
+        repo = _repositories[db_path] = ScoreRepository(db_path, legacy)
+    return repo
+
+
+def writer(archivo: str | None = None) -> ScoreWriter:
+    """Escritor en segundo plano compartido para el repositorio de `archivo` (ver repository()).
+
+    Al cerrar exporta el texto heredado junto a la base para las herramientas que aún lo leen.
+    """
+    repo = repository(archivo)
+    w = _writers.get(repo.path)
+    if w is None:
+        w = _writers[repo.path] = ScoreWriter(repo, export_path=repo.legacy_path)
+    return w
+
+
+@atexit.register
+def close_writers(timeout: float | None = 5.0) -> None:
+    """Vacía y detiene todos los escritores (al salir del juego o del intérprete)."""
+    for w in list(_writers.values()):
+        w.close(timeout)
@@ -12,3 +12,64 @@ ASSETS_IMG_DIR = os.path.join(ASSETS_DIR, "images")
 WIDTH = 800
 HEIGHT = 600
 FPS = 60
+
+# Simulación a paso fijo: la lógica corre a TICK_RATE ticks/s sin importar el FPS de render.
+# Velocidades en píxeles/segundo y cooldowns en segundos de simulación.
+TICK_RATE = 60
+TICK_DT = 1.0 / TICK_RATE
+# Máximo de renders consecutivos que se saltan cuando un frame se pasa de presupuesto
+MAX_FRAME_SKIP = 5
+# Tope del tiempo real acumulado por frame (evita la "espiral de la muerte" tras pausas largas)
+MAX_FRAME_TIME = 0.25
+
+# Proyectiles (jugador y enemigos) en un ring buffer de capacidad fija
+PROJECTILE_CAPACITY = 512
+ENEMY_SHOT_SPEED = 300    # píxeles/segundo hacia abajo
+ENEMY_FIRE_RATE = 0.15    # disparos/segundo de cada enemigo visible
+
+# Menús dirigidos por eventos: duermen en pygame.event.wait y solo redibujan si algo cambió
+MENU_CARET_BLINK_MS = 500  # medio periodo del cursor de texto
+MENU_POLL_MS = 100         # espera máxima mientras se carga algo en segundo plano
+
+# Render del juego por rectángulos sucios (útil en equipos con render por software)
+DIRTY_RECTS = False
+
+# Puntajes: base SQLite (fuente de verdad) y archivo de texto heredado que se importa
+SCORES_DB_PATH = os.path.join(PROJECT_ROOT, "scores.db")
+SCORES_TXT_PATH = os.path.join(PROJECT_ROOT, "scores.txt")
+
+# Audio (core.soundbank): buffer corto para poca latencia y canales reservados por grupo;
+# los canales de cada grupo son su límite de voces simultáneas
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512
+SOUND_CHANNELS = {'ui': 2, 'weapons': 4, 'explosions': 4}
+SOUND_MIN_INTERVAL = 0.05  # segundos mínimos entre dos disparos del mismo efecto
+
+# Perfil por fases (core.profiler): frames guardados, refresco del overlay y captura cProfile
+PROFILE_FRAMES = 3600
+PROFILE_OVERLAY_EVERY = 30
+PROFILE_CAPTURE_FRAMES = 300
+PROFILE_DIR = os.path.join(PROJECT_ROOT, "profiles")
+
+# Memoria (core.memtrack): muestra cada MEMTRACK_INTERVAL ticks; la tendencia descarta las
+# primeras MEMTRACK_WARMUP muestras y falla si el total crece más que el umbral
+MEMTRACK_INTERVAL = 600
+MEMTRACK_WARMUP = 3
+MEMTRACK_MAX_GROWTH_KB_MIN = 64.0
+MEMTRACK_TRACE_FRAMES = 4
+
+# Hilos que decodifican imágenes y sonidos por adelantado (AssetManager.prefetch)
+PREFETCH_WORKERS = 2
+
+# Atlas de sprites horneado con `python -m core.atlas` (se usa si existe)
+BAKED_DIR = os.path.join(ASSETS_DIR, "baked")
+BAKED_ATLAS_PATH = os.path.join(BAKED_DIR, "sprites.atlas")
+# Efectos sintetizados (core.synth) ya renderizados, por hash de sus parámetros
+SFX_CACHE_DIR = os.path.join(BAKED_DIR, "sfx")
+
+# Modo enjambre (requiere NumPy): enemigos en arreglos, cientos a miles simultáneos
+SWARM = False
+SWARM_SIZE = 1500        # máximo de enemigos en pantalla
+SWARM_WAVE = 300         # enemigos por oleada inicial
+SWARM_SPAWN_BATCH = 25   # enemigos que entran por cada spawn
+SWARM_FIRE_RATE = 0.01   # disparos/segundo de cada enemigo visible en modo enjambre
@@ -0,0 +1,402 @@
+"""Núcleo de simulación sin ventana.
+
+`GameState` guarda todo el estado jugable (jugador, enemigos, balas, nivel, puntaje)
+y `step(state, inputs)` avanza un tick de lógica de duración fija (TICK_DT) sin tocar
+el display ni el reloj. Velocidades en píxeles/segundo y cooldowns en segundos.
+La capa de presentación (Game) solo lee el estado y reacciona a los eventos devueltos.
+
+Toda la aleatoriedad sale de `state.rng` (sembrado con `seed`), así que misma semilla +
+mismas entradas por tick = misma partida; `snapshot()`/`restore()` permiten keyframes.
+
+Balas del jugador y disparos enemigos comparten un ProjectileManager (ring buffer en
+arreglos). Con `swarm=True` los enemigos viven en un EnemyArray (arreglos NumPy) en vez de una
+lista de Enemy, para oleadas de cientos a miles de invasores.
+"""
+import random
+
+from core.settings import (WIDTH, HEIGHT, TICK_DT, SWARM, SWARM_SIZE, SWARM_WAVE, SWARM_SPAWN_BATCH,
+                           SWARM_FIRE_RATE, ENEMY_FIRE_RATE, ENEMY_SHOT_SPEED)
+from core.inputs import INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE
+from core.collision import collide_any
+from core.projectiles import ProjectileManager, OWNER_PLAYER, OWNER_ENEMY
+from entities.player import Player
+from entities.enemy import Enemy
+
+# Eventos que step() devuelve para que la presentación reproduzca sonidos/mensajes
+EVENT_PLAYER_SHOT = "player_shot"
+EVENT_ENEMY_KILLED = "enemy_killed"
+EVENT_HIGHSCORE = "highscore"
+EVENT_LIFE_LOST = "life_lost"
+EVENT_LEVEL_COMPLETE = "level_complete"
+EVENT_GAME_OVER = "game_over"
+
+
+class GameState:
+    """Estado completo de una partida, independiente de pygame.display."""
+
+    def __init__(self, width: int = WIDTH, height: int = HEIGHT, lives: int = 3, nivel: int = 1,
+                 player_best: int | None = None, seed: int | None = None, swarm: bool = SWARM) -> None:
+        # Generador propio de la partida: reproducible a partir de la semilla
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.width = width
+        self.height = height
+        self.lives = lives
+        self.level = nivel
+        self.score = 0
+        self.tick = 0
+        self.game_over = False
+        # Progreso de nivel y spawner (enemigos infinitos hasta cumplir objetivo)
+        self.target_kills = 12  # Kills necesarios para terminar el nivel
+        self.kills = 0
+        self.max_enemies_on_screen = 6
+        self.spawn_cooldown = 0.5  # segundos entre spawns
+        self.spawn_counter = 0.0
+        self.enemy_speed = 60.0  # píxeles/segundo
+        self.enemy_fire_rate = SWARM_FIRE_RATE if swarm else ENEMY_FIRE_RATE  # disparos/s por enemigo
+        # Récord previo del jugador (None si no hay jugador con nombre)
+        self.player_best = player_best
+        self.highscore_reached = False
+        # core.profiler.FrameProfiler opcional: si está, step() mide sus fases
+        self.profiler = None
+
+        start_x = (self.width // 2) - 20
+        start_y = self.height - 80
+        # Proyectiles de jugador y enemigos (un tipo por imagen: bala del jugador y disparo por color)
+        self.projectiles = ProjectileManager()
+        # Instanciar jugador (Player) con velocidades en X/Y y salud inicial
+        self.player = Player(start_x, start_y, x_speed=360, y_speed=360, health=100,
+                             projectiles=self.projectiles)
+        self.shot_kinds = {c: self.projectiles.add_kind(Enemy.sprite_for(c).shot_image) for c in Enemy.COLORS}
+        # Llenar arsenal de balas al inicio del juego
+        self.player.refill_bullets()
+        # Instanciar enemigos iniciales (lista de Enemy, o arreglos en modo enjambre)
+        self.swarm = swarm
+        self.enemies = []
+        if swarm:
+            from entities.enemy_array import EnemyArray
+            self.max_enemies_on_screen = SWARM_SIZE
+            self.enemies = EnemyArray(SWARM_SIZE)
+        _new_wave(self, 6)
+
+    def snapshot(self) -> dict:
+        """Copia serializable (solo tipos básicos) del estado completo, para keyframes de replay."""
+        p = self.player
+        return {
+            "scalars": {name: getattr(self, name) for name in _SCALARS},
+            "rng": self.rng.getstate(),
+            "player": {name: getattr(p, name) for name in _PLAYER_FIELDS},
+            "projectiles": self.projectiles.snapshot(),
+            "enemies": self.enemies.snapshot() if self.swarm else
+            [(e.x, e.y, e.prev_x, e.prev_y, e.speed, e.color, e.health) for e in self.enemies],
+        }
+
+    def restore(self, snap: dict) -> None:
+        """Reemplaza el estado actual por el de un snapshot() (también uno leído de JSON)."""
+        # Solo los campos conocidos: un replay ajeno no puede pisar otros atributos
+        scalars = snap["scalars"]
+        for name in _SCALARS:
+            setattr(self, name, scalars[name])
+        version, internal, gauss_next = snap["rng"]
+        self.rng.setstate((version, tuple(internal), gauss_next))
+        p = self.player
+        fields = snap["player"]
+        for name in _PLAYER_FIELDS:
+            setattr(p, name, fields[name])
+        p.rect.topleft = (int(p.x), int(p.y))
+        self.projectiles.restore(snap["projectiles"])
+        if self.swarm:
+            if isinstance(self.enemies, list):
+                from entities.enemy_array import EnemyArray
+                self.enemies = EnemyArray(SWARM_SIZE)
+            self.enemies.restore(snap["enemies"])
+            return
+        if isinstance(self.enemies, list):
+            Enemy.release(self.enemies)
+        self.enemies = []
+        for x, y, prev_x, prev_y, speed, color, health in snap["enemies"]:
+            e = Enemy.pool.acquire(speed, x, y, color, health)
+            e.prev_x, e.prev_y = prev_x, prev_y
+            self.enemies.append(e)
+
+
+# Campos que definen el estado (lo demás se deriva de ellos)
+_SCALARS = (
+    "seed", "width", "height", "lives", "level", "score", "tick", "game_over", "target_kills",
+    "kills", "max_enemies_on_screen", "spawn_cooldown", "spawn_counter", "enemy_speed",
+    "player_best", "highscore_reached", "swarm", "enemy_fire_rate",
+)
+_PLAYER_FIELDS = (
+    "x", "y", "prev_x", "prev_y", "x_speed", "y_speed", "health", "bullet_speed", "fire_delay",
+    "cool_down", "creation_cooldown_counter", "bullet_cooldown_counter", "max_amount_bullets", "ammo",
+)
+
+
+def step(state: GameState, inputs: int, dt: float = TICK_DT) -> list[str]:
+    """Avanza un tick de lógica (dt segundos) con los bits de entrada dados y devuelve los eventos."""
+    events: list[str] = []
+    if state.game_over:
+        return events
+    state.tick += 1
+    player = state.player
+    prof = state.profiler
+    t = prof.now() if prof else 0.0
+
+    # Posiciones del tick anterior para interpolar al dibujar
+    player.save_previous()
+    if state.swarm:
+        state.enemies.save_previous()
+    else:
+        for e in state.enemies:
+            e.save_previous()
+    state.projectiles.save_previous()
+
+    # Movimiento y disparo del jugador usando su propia lógica interna
+    player.move(width=state.width, height=state.height, inputs=inputs, dt=dt)
+    player.create_bullets(dt)
+    player.cooldown(dt)
+    ammo = player.ammo
+    player.fire(inputs=inputs, dt=dt)
+    if player.ammo < ammo:
+        events.append(EVENT_PLAYER_SHOT)
+    # Mover y descartar todos los proyectiles (jugador y enemigos) en una pasada
+    state.projectiles.update(state.height, dt)
+    if prof:
+        t = prof.lap('player', t)
+
+    # Mover enemigos (descenso simple; vectorizado en modo enjambre)
+    if state.swarm:
+        state.enemies.update(dt)
+    else:
+        for e in state.enemies:
+            e.update(dt)
+    _enemy_fire(state, dt)
+    if prof:
+        t = prof.lap('enemies', t)
+
+    # Si algún enemigo toca el fondo, perder vida y reiniciar
+    if _enemy_reached_bottom(state):
+        _lose_life(state, events)
+
+    # Colisión jugador-enemigo -> perder vida y reiniciar nivel
+    if _player_hit_by_enemy(state) or _player_hit_by_shot(state):
+        _lose_life(state, events)
+
+    # Colisiones: balas del jugador contra enemigos
+    _handle_collisions(state, events)
+    if prof:
+        t = prof.lap('collisions', t)
+
+    # Spawner de enemigos continuo
+    _spawn_enemies(state, dt)
+    if prof:
+        t = prof.lap('spawn', t)
+
+    # Progresión de nivel (subir de nivel cuando cumples objetivo)
+    _progress_level(state, events)
+
+    if state.lives <= 0:
+        state.game_over = True
+        events.append(EVENT_GAME_OVER)
+    if prof:
+        prof.lap('level', t)
+    return events
+
+
+def autopilot(state: GameState) -> int:
+    """Entrada sintética para corridas headless: dispara siempre y se alinea con el enemigo más bajo."""
+    inputs = INPUT_FIRE
+    if not state.enemies:
+        return inputs
+    if state.swarm:
+        target = state.enemies.rect(state.enemies.lowest())
+    else:
+        target = max(state.enemies, key=lambda e: e.rect.bottom).rect
+    player = state.player
+    center = player.x + player.ship_img.get_width() / 2
+    if target.centerx > center + player.x_speed * TICK_DT:
+        inputs |= INPUT_RIGHT
+    elif target.centerx < center - player.x_speed * TICK_DT:
+        inputs |= INPUT_LEFT
+    return inputs
+
+
+def _lose_life(state: GameState, events: list[str]) -> None:
+    state.lives -= 1
+    events.append(EVENT_LIFE_LOST)
+    if state.lives > 0:
+        _restart_level(state)
+
+
+def _handle_collisions(state: GameState, events: list[str]) -> None:
+    projectiles = state.projectiles
+    if not projectiles.count(OWNER_PLAYER) or not state.enemies:
+        return
+    # Todos los contactos bala-enemigo del tick en un lote (AABB vectorizado + máscaras)
+    if state.swarm:
+        contacts = projectiles.contacts(OWNER_PLAYER, state.enemies.boxes(), state.enemies.mask)
+    else:
+        enemies = state.enemies
+        contacts = projectiles.contacts(OWNER_PLAYER, [e.rect for e in enemies], lambda i: enemies[i].mask)
+    if not contacts:
+        return
+    # Cada enemigo, en orden, lo mata la primera bala que lo toca y que siga disponible
+    used: set[int] = set()
+    killed: list[int] = []
+    level_target_reached = False
+    for i in sorted(contacts):
+        if level_target_reached:
+            break  # ya alcanzamos objetivo, ignorar enemigos restantes
+        bullet = next((j for j in contacts[i] if j not in used), None)
+        if bullet is None:
+            continue
+        used.add(bullet)
+        killed.append(i)
+        state.score += 100
+        events.append(EVENT_ENEMY_KILLED)
+        # Si supera su récord previo, avisar (una sola vez)
+        if (not state.highscore_reached) and state.player_best is not None \
+                and state.score > state.player_best:
+            state.highscore_reached = True
+            events.append(EVENT_HIGHSCORE)
+        if state.kills < state.target_kills:
+            state.kills += 1
+        # Si alcanzamos exactamente el objetivo, no obligar a eliminar el resto manualmente
+        if state.kills >= state.target_kills:
+            level_target_reached = True
+    projectiles.kill(used)
+    # Si se alcanzó el objetivo, limpiar completamente la lista para avanzar de nivel sin kills extra
+    if level_target_reached:
+        _clear_enemies(state)
+    elif state.swarm:
+        state.enemies.kill(killed)
+    else:
+        dead = set(killed)
+        Enemy.release([state.enemies[i] for i in killed])
+        state.enemies = [e for i, e in enumerate(state.enemies) if i not in dead]
+
+
+def _progress_level(state: GameState, events: list[str]) -> None:
+    """Si cumpliste objetivo (independiente de enemigos restantes), sube de nivel y crea nueva oleada."""
+    if state.kills < state.target_kills:
+        return
+    events.append(EVENT_LEVEL_COMPLETE)
+    # Subir nivel y ajustar parámetros
+    state.level += 1
+    state.enemy_speed *= 1.15
+    # Aumentar objetivo próximo nivel
+    state.target_kills = int(max(state.target_kills + 4, state.target_kills * 1.25))
+    state.kills = 0
+    # Aumentar arsenal de balas en +1 por nivel y recargar al máximo
+    state.player.max_amount_bullets += 1
+    state.player.refill_bullets()
+    # Nueva oleada inicial
+    _new_wave(state, min(6 + state.level, 12))
+
+
+def _new_wave(state: GameState, count: int) -> None:
+    """Reemplaza los enemigos por una oleada nueva (SWARM_WAVE enemigos en modo enjambre)."""
+    if state.swarm:
+        state.enemies.clear()
+        state.enemies.spawn(SWARM_WAVE, state.enemy_speed, rng=state.rng, width=state.width)
+    else:
+        Enemy.release(state.enemies)
+        state.enemies = Enemy.spawn(count, state.enemy_speed, rng=state.rng)
+
+
+def _clear_enemies(state: GameState) -> None:
+    if state.swarm:
+        state.enemies.clear()
+    else:
+        Enemy.release(state.enemies)
+        state.enemies = []
+
+
+def _spawn_enemies(state: GameState, dt: float = TICK_DT) -> None:
+    # Deja de spawnear solo si ya alcanzó los kills objetivos
+    if state.kills >= state.target_kills:
+        return
+    if len(state.enemies) >= state.max_enemies_on_screen:
+        return
+    if state.spawn_counter > 0:
+        state.spawn_counter -= dt
+        return
+    if state.swarm:
+        amount = min(SWARM_SPAWN_BATCH, state.max_enemies_on_screen - len(state.enemies))
+        state.enemies.spawn(amount, state.enemy_speed, rng=state.rng, width=state.width)
+    else:
+        state.enemies.append(Enemy.spawn(1, state.enemy_speed, rng=state.rng)[0])
+    state.spawn_counter = state.spawn_cooldown
+
+
+def _enemy_reached_bottom(state: GameState) -> bool:
+    """Retorna True si algún enemigo tocó el borde inferior; elimina el enemigo."""
+    if state.swarm:
+        return state.enemies.cull_bottom(state.height) > 0
+    hit = False
+    remaining = []
+    for e in state.enemies:
+        if e.rect.bottom >= state.height:
+            hit = True
+            Enemy.pool.release(e)
+            continue
+        remaining.append(e)
+    if hit:
+        state.enemies = remaining
+    return hit
+
+
+def _player_hit_by_enemy(state: GameState) -> bool:
+    """Detecta si algún enemigo colisiona con el jugador (AABB primero, máscara después)."""
+    if state.swarm:
+        return bool(state.enemies.touching(state.player.rect, state.player.mask))
+    return collide_any(state.player, state.enemies) >= 0
+
+
+def _player_hit_by_shot(state: GameState) -> bool:
+    """Detecta si algún disparo enemigo alcanzó al jugador."""
+    player = state.player
+    return bool(state.projectiles.contacts(OWNER_ENEMY, [player.rect], lambda _: player.mask))
+
+
+def _enemy_fire(state: GameState, dt: float = TICK_DT) -> None:
+    """Cada enemigo visible dispara con probabilidad enemy_fire_rate * dt por tick."""
+    if not state.enemies:
+        return
+    chance = state.enemy_fire_rate * dt
+    if state.swarm:
+        enemies = state.enemies
+        for i in enemies.shooters(chance, state.rng):
+            rect = enemies.rect(i)
+            _spawn_shot(state, rect, enemies.colors[enemies.color[i]])
+        return
+    rng = state.rng
+    for e in state.enemies:
+        if e.rect.top > 0 and rng.random() < chance:
+            _spawn_shot(state, e.rect, e.color)
+
+
+def _spawn_shot(state: GameState, rect, color: str) -> None:
+    kind = state.shot_kinds[color]
+    shot_w = state.projectiles.images[kind].get_width()
+    state.projectiles.spawn(rect.x + (rect.width - shot_w) / 2, rect.bottom - 10, ENEMY_SHOT_SPEED,
+                            kind, OWNER_ENEMY)
+
+
+def _restart_level(state: GameState) -> None:
+    """Reinicia el estado del nivel manteniendo score y vidas restantes."""
+    player = state.player
+    state.kills = 0
+    _new_wave(state, 6)
+    state.spawn_counter = 0.0
+    # Reposicionar jugador al centro inferior
+    player.x = (state.width // 2) - (player.ship_img.get_width() // 2)
+    player.y = state.height - 80
+    player.rect.topleft = (int(player.x), int(player.y))
+    player.save_previous()
+    # Limpiar balas (recámara y proyectiles en vuelo, incluidos los enemigos)
+    player.ammo = 0
+    state.projectiles.clear()
+    # Resetear cooldowns de creación/disparo
+    player.creation_cooldown_counter = 0
+    player.bullet_cooldown_counter = 0
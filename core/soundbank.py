@@ -0,0 +1,165 @@
+"""Banco de sonidos: único dueño del mixer.
+
+- init() inicia el mixer una sola vez (con buffer corto, para poca latencia) y recuerda si
+  falló: el juego sigue sin audio en vez de reintentar en cada llamada.
+- Cada grupo (ui, armas, explosiones) tiene sus propios canales reservados, que Sound.play()
+  nunca toma. La cantidad de canales es el límite de voces del grupo: si están todos
+  sonando, el efecto nuevo reemplaza al más antiguo del grupo.
+- Los efectos se cargan una sola vez con preload() al crear la escena; play() en pleno juego
+  solo elige un canal ya creado y reproduce un Sound ya decodificado (sin disco, sin esperas).
+  Los que no tienen archivo se sintetizan (core.synth).
+- Un mismo efecto no se repite antes de su intervalo mínimo: diez impactos en un frame
+  suenan una vez.
+- La música va por pygame.mixer.music (streaming, fuera de los canales de efectos).
+"""
+import time
+
+import pygame
+
+from core import synth
+from core.assets import assets
+from core.settings import MIXER_BUFFER, MIXER_FREQUENCY, SOUND_CHANNELS, SOUND_MIN_INTERVAL
+
+# Efectos conocidos: nombre -> (grupo, archivos alternativos, volumen). Si no hay archivo se
+# usa el efecto del mismo nombre de synth.SFX
+EFFECTS = {
+    'start': ('ui', (), 1.0),
+    'win': ('ui', ('ganar.mp3',), 1.0),
+    'level_up': ('ui', (), 1.0),
+    'shot': ('weapons', ('shot.wav',), 1.0),
+    'explosion': ('explosions', ('explosion.wav',), 1.0),
+    'hit': ('explosions', ('hit.wav',), 1.0),
+}
+
+
+class _Effect:
+    __slots__ = ('sound', 'group', 'min_interval', 'last')
+
+    def __init__(self, sound: pygame.mixer.Sound, group: "_Group", min_interval: float) -> None:
+        self.sound = sound
+        self.group = group
+        self.min_interval = min_interval
+        self.last = float('-inf')
+
+
+class _Group:
+    """Canales reservados de un grupo y el instante en que empezó lo que suena en cada uno."""
+    __slots__ = ('channels', 'started')
+
+    def __init__(self, channels: list[pygame.mixer.Channel]) -> None:
+        self.channels = channels
+        self.started = [0.0] * len(channels)
+
+    def pick(self) -> int:
+        """Un canal libre o, si no hay, el que lleva más tiempo sonando."""
+        oldest = 0
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+            if self.started[i] < self.started[oldest]:
+                oldest = i
+        return oldest
+
+
+class SoundBank:
+    def __init__(self, groups: dict[str, int] | None = None, min_interval: float = SOUND_MIN_INTERVAL) -> None:
+        self.group_sizes = dict(groups or SOUND_CHANNELS)
+        self.min_interval = min_interval
+        self._ok: bool | None = None  # None: todavía no se intentó iniciar el mixer
+        self._groups: dict[str, _Group] = {}
+        self._effects: dict[str, _Effect] = {}
+        self._music: str | None = None
+        self.played = 0
+        self.stolen = 0    # voces cortadas para hacer lugar (límite del grupo)
+        self.skipped = 0   # disparos descartados por el intervalo mínimo
+
+    # -------- Mixer ---------
+    def init(self) -> bool:
+        """Inicia el mixer la primera vez; si falla (p. ej. WSL sin audio) no reintenta."""
+        if self._ok is None:
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.pre_init(MIXER_FREQUENCY, -16, 2, MIXER_BUFFER)
+                    pygame.mixer.init()
+                self._reserve()
+                self._ok = True
+            except Exception as e:
+                print(f"[Audio] Mixer no disponible: {e}")
+                self._ok = False
+        return bool(self._ok and pygame.mixer.get_init())
+
+    def _reserve(self) -> None:
+        total = sum(self.group_sizes.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        # Los primeros `total` canales quedan fuera de la selección automática de Sound.play()
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for name, size in self.group_sizes.items():
+            self._groups[name] = _Group([pygame.mixer.Channel(first + i) for i in range(size)])
+            first += size
+
+    # -------- Efectos ---------
+    def preload(self, effects: dict | None = None) -> int:
+        """Carga los efectos (fuera del bucle de juego). Retorna cuántos quedaron disponibles."""
+        if not self.init():
+            return 0
+        for name, (group, files, volume) in (effects or EFFECTS).items():
+            if name in self._effects:
+                continue
+            sound = assets.sound(*files) if files else None
+            if sound is None:
+                sound = synth.sound(name)
+            if sound is None:
+                continue
+            sound.set_volume(volume)
+            self._effects[name] = _Effect(sound, self._groups[group], self.min_interval)
+        return len(self._effects)
+
+    def play(self, name: str) -> bool:
+        """Reproduce un efecto precargado. No carga ni bloquea: si no está, no suena."""
+        effect = self._effects.get(name)
+        if effect is None:
+            return False
+        now = time.monotonic()
+        if now - effect.last < effect.min_interval:
+            self.skipped += 1
+            return False
+        effect.last = now
+        group = effect.group
+        i = group.pick()
+        channel = group.channels[i]
+        if channel.get_busy():
+            self.stolen += 1
+        channel.play(effect.sound)
+        group.started[i] = now
+        self.played += 1
+        return True
+
+    def stop(self) -> None:
+        """Corta todos los efectos (la música sigue)."""
+        for group in self._groups.values():
+            for channel in group.channels:
+                channel.stop()
+
+    # -------- Música ---------
+    def play_music(self, name: str, volume: float | None = None) -> None:
+        """Música de fondo en loop; no reinicia la pista si ya es la que suena."""
+        if not self.init():
+            return
+        if name == self._music and pygame.mixer.music.get_busy():
+            return
+        path = assets.path(name)
+        if not path:
+            return
+        try:
+            pygame.mixer.music.load(path)
+            if volume is not None:
+                pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1)  # loop infinito
+            self._music = name
+        except Exception as e:
+            print(f"No se pudo reproducir música: {e}")
+
+
+# Instancia compartida; el mixer se inicia en el primer uso, no al importar
+sounds = SoundBank()
@@ -0,0 +1,144 @@
+"""Benchmark de arranque (`python -m core.startup_bench`).
+
+Mide, cada vez en un proceso nuevo (sin módulos ya importados ni cachés calientes de pygame):
+
+- el tiempo de importar cada módulo del juego, y si el import dejó algo inicializado
+  (pygame, ventana, fuentes, mixer, hilos): importar no debe tener efectos secundarios;
+- el tiempo hasta el primer cuadro: importar main, crear la ventana y la pila de escenas
+  como lo hace main.py, y actualizar y presentar la primera escena.
+
+Se reporta la mediana de `--runs` repeticiones. Sin DISPLAY (o con `--dummy`) usa los
+drivers dummy de SDL. Retorna 1 si algún import tuvo efectos secundarios.
+
+    python -m core.startup_bench --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from core.settings import PROJECT_ROOT
+
+# Módulos que importa el juego al arrancar, de las hojas hacia main
+MODULES = [
+    "core.assets",
+    "core.scores",
+    "core.scenes",
+    "entities.enemy",
+    "entities.bullet",
+    "entities.player",
+    "core.menu_acerca_de",
+    "core.menu_puntajes",
+    "core.menu_principal",
+    "game",
+    "main",
+]
+
+
+def _side_effects() -> list[str]:
+    """Subsistemas o recursos que quedaron activos en este proceso."""
+    import threading
+    found = []
+    if "pygame" in sys.modules:
+        import pygame
+        if pygame.get_init():
+            found.append("pygame.init")
+        if pygame.display.get_init():
+            found.append("display")
+        if pygame.display.get_surface() is not None:
+            found.append("ventana")
+        if pygame.font.get_init():
+            found.append("font")
+        if pygame.mixer.get_init():
+            found.append("mixer")
+    if threading.active_count() > 1:
+        found.append(f"hilos={threading.active_count() - 1}")
+    return found
+
+
+def _child_import(module: str) -> dict:
+    import importlib
+    inicio = time.perf_counter()
+    importlib.import_module(module)
+    return {"ms": (time.perf_counter() - inicio) * 1000, "efectos": _side_effects()}
+
+
+def _child_frame() -> dict:
+    inicio = time.perf_counter()
+    import main
+    importado = time.perf_counter()
+    manager = main.build_manager()
+    creado = time.perf_counter()
+    # Lo mismo que hace SceneManager.run() antes de esperar el primer evento
+    escena = manager.current
+    escena.update(0.0)
+    manager.current.draw(manager.window)
+    fin = time.perf_counter()
+    manager.stack.clear()
+    return {"import_ms": (importado - inicio) * 1000, "build_ms": (creado - importado) * 1000,
+            "frame_ms": (fin - creado) * 1000, "total_ms": (fin - inicio) * 1000,
+            "escena": type(escena).__name__}
+
+
+def _spawn(args: list[str], env: dict) -> dict:
+    out = subprocess.run([sys.executable, "-m", "core.startup_bench", *args], cwd=PROJECT_ROOT,
+                         env=env, capture_output=True, text=True, check=True)
+    # La última línea es el resultado (antes puede haber prints del juego)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _env(dummy: bool) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (PROJECT_ROOT, env.get("PYTHONPATH")) if p)
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    if dummy:
+        env["SDL_VIDEODRIVER"] = "dummy"
+        env["SDL_AUDIODRIVER"] = "dummy"
+    return env
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core.startup_bench",
+                                     description="Tiempo de import y hasta el primer cuadro")
+    parser.add_argument("--runs", type=int, default=5, help="repeticiones por medición (se reporta la mediana)")
+    parser.add_argument("--dummy", action="store_true", help="drivers dummy de SDL (sin ventana real ni audio)")
+    parser.add_argument("--child-import", metavar="MODULO", help=argparse.SUPPRESS)
+    parser.add_argument("--child-frame", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child_import:
+        print(json.dumps(_child_import(args.child_import)))
+        return 0
+    if args.child_frame:
+        print(json.dumps(_child_frame()))
+        return 0
+
+    env = _env(args.dummy or not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+                                   or sys.platform in ("win32", "darwin")))
+    runs = max(1, args.runs)
+    con_efectos = 0
+    print(f"[Startup] import por módulo (mediana de {runs}, proceso nuevo cada vez)")
+    for module in MODULES:
+        medidas = [_spawn(["--child-import", module], env) for _ in range(runs)]
+        efectos = sorted({e for m in medidas for e in m["efectos"]})
+        con_efectos += bool(efectos)
+        nota = f"  EFECTOS: {', '.join(efectos)}" if efectos else ""
+        print(f"  {module:<22} {statistics.median(m['ms'] for m in medidas):8.1f} ms{nota}")
+
+    medidas = [_spawn(["--child-frame"], env) for _ in range(runs)]
+    mediana = {k: statistics.median(m[k] for m in medidas)
+               for k in ("import_ms", "build_ms", "frame_ms", "total_ms")}
+    print(f"[Startup] primer cuadro ({medidas[0]['escena']}): {mediana['total_ms']:.1f} ms "
+          f"(import {mediana['import_ms']:.1f} + ventana y escenas {mediana['build_ms']:.1f} "
+          f"+ update/draw {mediana['frame_ms']:.1f})")
+    if con_efectos:
+        print(f"[Startup] {con_efectos} módulo(s) inicializan algo al importarse")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
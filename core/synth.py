@@ -0,0 +1,160 @@
+"""Efectos de sonido sintetizados (sin archivos de audio).
+
+Cada efecto es un diccionario de parámetros (forma de onda, barrido de frecuencia, ruido,
+envolvente) que se renderiza de una vez como arreglo NumPy y pasa directo a
+pygame.sndarray.make_sound, sin escribir ni leer un WAV.
+
+Los buffers renderizados se guardan por hash de (parámetros, frecuencia de muestreo) en
+memoria y en BAKED_DIR/sfx/*.npy: desde el segundo arranque, un efecto listo cuesta un
+np.load. Cambiar un parámetro cambia el hash, así que no hay caché que invalidar.
+
+Parámetros (todos opcionales salvo `duration`):
+    wave       'sine', 'square', 'saw', 'triangle' o 'noise'
+    freq       Hz al inicio; `freq_end` para un barrido exponencial hasta el final
+    duration   segundos
+    notes      [[freq, duración], ...] en vez de freq/duration: notas seguidas (jingles)
+    noise      mezcla de ruido blanco (0..1); `lowpass` lo suaviza (media de N muestras)
+    attack     segundos de subida lineal; `decay` constante de caída exponencial
+    volume     ganancia final (0..1)
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pygame
+
+from core.settings import SFX_CACHE_DIR
+
+# Subir si cambia render(): los buffers en disco de la versión anterior dejan de usarse
+VERSION = 1
+
+# Efectos del juego (core.soundbank los usa cuando no hay archivo de audio)
+SFX = {
+    'start': {'wave': 'sine', 'freq': 440.0, 'duration': 0.35, 'attack': 0.01, 'decay': 0.25, 'volume': 0.5},
+    'shot': {'wave': 'square', 'freq': 1400.0, 'freq_end': 300.0, 'duration': 0.14, 'decay': 0.06,
+             'volume': 0.25},
+    'explosion': {'wave': 'noise', 'duration': 0.5, 'lowpass': 12, 'decay': 0.15, 'volume': 0.8},
+    'hit': {'wave': 'square', 'freq': 180.0, 'freq_end': 50.0, 'duration': 0.4, 'noise': 0.5, 'lowpass': 4,
+            'decay': 0.12, 'volume': 0.7},
+    'level_up': {'wave': 'square', 'notes': [[523.25, 0.08], [659.25, 0.08], [783.99, 0.08], [1046.5, 0.2]],
+                 'decay': 0.1, 'volume': 0.3},
+}
+
+# Formato del mixer (pygame.mixer.get_init()[1]) -> dtype de las muestras
+_DTYPES = {-16: np.int16, 16: np.uint16, -8: np.int8, 8: np.uint8, -32: np.float32, 32: np.float32}
+# Fundido final para que el corte no haga clic
+_FADE_OUT = 0.005
+
+_buffers: dict[str, np.ndarray] = {}
+
+
+def key(spec: dict, rate: int) -> str:
+    """Hash estable de los parámetros y la frecuencia de muestreo."""
+    text = json.dumps({'spec': spec, 'rate': rate, 'version': VERSION}, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def render(spec: dict, rate: int) -> np.ndarray:
+    """Renderiza un efecto: float32 mono en [-1, 1]."""
+    notes = spec.get('notes')
+    if notes:
+        single = {k: v for k, v in spec.items() if k != 'notes'}
+        return np.concatenate([render({**single, 'freq': f, 'duration': d}, rate) for f, d in notes])
+
+    duration = spec['duration']
+    n = max(1, int(rate * duration))
+    t = np.arange(n) / rate
+    wave = spec.get('wave', 'sine')
+    f0 = spec.get('freq', 440.0)
+    f1 = spec.get('freq_end', f0)
+    freq = f0 * (f1 / f0) ** (t / duration) if f1 != f0 else np.full(n, f0)
+    # Fase acumulada (en ciclos) para que el barrido no tenga saltos
+    phase = np.cumsum(freq) / rate
+    frac = phase % 1.0
+    if wave == 'sine':
+        y = np.sin(2 * np.pi * phase)
+    elif wave == 'square':
+        y = np.where(frac < 0.5, 1.0, -1.0)
+    elif wave == 'saw':
+        y = 2.0 * frac - 1.0
+    elif wave == 'triangle':
+        y = 4.0 * np.abs(frac - 0.5) - 1.0
+    elif wave == 'noise':
+        y = np.zeros(n)
+    else:
+        raise ValueError(f"Forma de onda desconocida: {wave}")
+
+    noise = 1.0 if wave == 'noise' else spec.get('noise', 0.0)
+    if noise:
+        # Semilla derivada de los parámetros: el mismo efecto suena siempre igual
+        rng = np.random.default_rng(int(key(spec, rate), 16))
+        nz = rng.uniform(-1.0, 1.0, n)
+        width = int(spec.get('lowpass', 1))
+        if width > 1:
+            # Media móvil por sumas acumuladas (pasa bajos simple, sin bucle por muestra)
+            c = np.cumsum(np.concatenate((np.zeros(width), nz)))
+            nz = (c[width:] - c[:-width]) / width
+            nz /= max(1e-9, np.abs(nz).max())
+        y = y * (1.0 - noise) + nz * noise
+
+    env = np.ones(n)
+    attack = spec.get('attack', 0.002)
+    if attack > 0:
+        env = np.minimum(env, t / attack)
+    decay = spec.get('decay')
+    if decay:
+        env *= np.exp(-t / decay)
+    env = np.minimum(env, (duration - t) / _FADE_OUT)
+    return (y * np.clip(env, 0.0, 1.0) * spec.get('volume', 1.0)).astype(np.float32)
+
+
+def buffer(spec: dict, rate: int) -> np.ndarray:
+    """Buffer renderizado del efecto (memoria, luego disco, y si no, se renderiza y guarda)."""
+    k = key(spec, rate)
+    buf = _buffers.get(k)
+    if buf is not None:
+        return buf
+    path = os.path.join(SFX_CACHE_DIR, f"{k}.npy")
+    try:
+        buf = np.load(path)
+    except (OSError, ValueError, EOFError):
+        # Sin caché, o un archivo vacío/truncado (EOFError): se renderiza y se reescribe
+        buf = render(spec, rate)
+        try:
+            os.makedirs(SFX_CACHE_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                np.save(f, buf)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[Synth] No se pudo guardar en caché '{path}': {e}")
+    _buffers[k] = buf
+    return buf
+
+
+def make_sound(spec: dict) -> pygame.mixer.Sound | None:
+    """Sound en el formato del mixer actual (None si el mixer no está iniciado o no se soporta)."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    rate, size, channels = init
+    dtype = _DTYPES.get(size)
+    if dtype is None:
+        return None
+    buf = buffer(spec, rate)
+    if dtype is np.float32:
+        samples = buf
+    else:
+        info = np.iinfo(dtype)
+        mid = (int(info.max) + int(info.min) + 1) / 2  # 0 para signed, el centro para unsigned
+        samples = (buf * (info.max - mid) + mid).astype(dtype)
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+
+
+def sound(name: str) -> pygame.mixer.Sound | None:
+    """Sound de un efecto de SFX por nombre."""
+    spec = SFX.get(name)
+    return make_sound(spec) if spec is not None else None
@@ -0,0 +1,81 @@
+"""Utilidades compartidas de los menús.
+
+Los menús no redibujan a 60 FPS: componen una vez su capa estática (fondo, logo, títulos)
+y duermen en pygame.event.wait hasta que llega un evento o vence un plazo (el parpadeo del
+cursor, una carga en curso). Solo se vuelve a dibujar y presentar si algo cambió.
+
+Importar este módulo no inicializa nada: la ventana, las fuentes y el audio se levantan la
+primera vez que se piden (ventana(), assets.font(), sounds.init()).
+"""
+import time
+
+import pygame
+
+from core.soundbank import sounds
+from core.settings import WIDTH, HEIGHT, MENU_CARET_BLINK_MS
+
+# Eventos que obligan a volver a presentar la ventana aunque no haya cambiado nada
+EVENTOS_EXPOSICION = {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN}
+
+
+def ventana(size: tuple[int, int] = (WIDTH, HEIGHT)) -> pygame.Surface:
+    """La ventana del programa: se crea una sola vez (todas las pantallas la comparten)."""
+    surf = pygame.display.get_surface()
+    if surf is not None and surf.get_size() == tuple(size):
+        return surf
+    if not pygame.display.get_init():
+        pygame.display.init()
+    return pygame.display.set_mode(size)
+
+
+def reproducir_musica(nombre: str, volumen: float | None = None) -> None:
+    """Música de fondo en loop; no reinicia la pista si ya es la que suena."""
+    sounds.play_music(nombre, volumen)
+
+
+def esperar_eventos(timeout_ms: int | None = None) -> list[pygame.event.Event]:
+    """Bloquea hasta el próximo evento (o hasta `timeout_ms`) y retorna todos los pendientes.
+
+    Sin timeout el proceso duerme hasta que haya entrada: un menú quieto no usa CPU.
+    """
+    if timeout_ms is None:
+        event = pygame.event.wait()
+    else:
+        event = pygame.event.wait(max(1, int(timeout_ms)))
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+
+def capa(ventana: pygame.Surface) -> pygame.Surface:
+    """Superficie opaca del tamaño de la ventana y en su formato de píxel (blit directo)."""
+    surf = pygame.Surface(ventana.get_size())
+    return surf.convert() if pygame.display.get_surface() is not None else surf
+
+
+def _ms() -> int:
+    # Reloj propio: pygame.time.get_ticks() vale 0 si no se llamó pygame.init()
+    return int(time.monotonic() * 1000)
+
+
+def cursor_visible() -> bool:
+    """Fase actual del parpadeo del cursor de texto."""
+    return (_ms() // MENU_CARET_BLINK_MS) % 2 == 0
+
+
+def hasta_parpadeo() -> int:
+    """Milisegundos hasta el próximo cambio del cursor de texto."""
+    return MENU_CARET_BLINK_MS - _ms() % MENU_CARET_BLINK_MS
+
+
+def resaltar(color: tuple, cantidad: int = 40) -> tuple:
+    """Color más claro, para botones bajo el mouse."""
+    return tuple(min(255, c + cantidad) for c in color)
+
+
+def boton_bajo(pos: tuple[int, int], rects: list[pygame.Rect]) -> int | None:
+    """Índice del botón que contiene `pos` (o None)."""
+    for i, rect in enumerate(rects):
+        if rect.collidepoint(pos):
+            return i
+    return None
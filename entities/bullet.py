@@ -1,29 +1,61 @@
 import pygame
 
+from core.assets import assets
+from core.settings import TICK_DT
+
+
 class Bullet:
-    def __init__(self, x: float, y: float, image: pygame.Surface, speed: int = -10) -> None:
+    """Bala suelta como objeto (el juego usa core.projectiles; esta clase queda para usos puntuales).
+
+    Con __slots__ y reset() para poder reciclarse con core.pool.ObjectPool.
+    """
+
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'image', 'speed', 'rect')
+
+    def __init__(self, x: float, y: float, image: pygame.Surface, speed: int = -600) -> None:
+        self.reset(x, y, image, speed)
+
+    def reset(self, x: float, y: float, image: pygame.Surface, speed: int = -600) -> None:
+        # speed en píxeles/segundo de simulación
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.image = image
         self.speed = speed
-        self.rect = self.image.get_rect(topleft=(int(self.x), int(self.y)))
+        try:
+            self.rect.update(int(x), int(y), *image.get_size())
+        except AttributeError:
+            self.rect = self.image.get_rect(topleft=(int(self.x), int(self.y)))
 
-    def move(self, dy: int | float = None) -> None:
+    def move(self, dy: int | float = None, dt: float = TICK_DT) -> None:
+        """Desplaza dy píxeles (por defecto, lo que recorre en dt segundos)."""
         if dy is None:
-            dy = self.speed
+            dy = self.speed * dt
         self.y += dy
         self.rect.topleft = (int(self.x), int(self.y))
 
-    def draw(self, window: pygame.Surface) -> None:
-        window.blit(self.image, (int(self.x), int(self.y)))
+    def save_previous(self) -> None:
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def draw(self, window: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return window.blit(self.image, (int(x), int(y)))
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        # Máscara cacheada por superficie: todas las balas con la misma imagen la comparten
+        return assets.mask(self.image)
 
     def collision(self, target) -> bool:
         # Usa mask overlap si disponible; si no, rects
         if hasattr(target, 'mask') and hasattr(target, 'rect'):
-            # Crear mask de bala en caliente
-            bullet_mask = pygame.mask.from_surface(self.image)
+            if not self.rect.colliderect(target.rect):
+                return False
             offset = (int(target.rect.x - self.rect.x), int(target.rect.y - self.rect.y))
-            overlap = bullet_mask.overlap(target.mask, offset)
+            overlap = self.mask.overlap(target.mask, offset)
             return overlap is not None
         # Fallback a rects
         return self.rect.colliderect(getattr(target, 'rect', pygame.Rect(target.x, target.y, 1, 1)))
@@ -1,146 +1,196 @@
-import os
 import random
 import pygame
 
-from core.settings import ASSETS_IMG_DIR, WIDTH, PROJECT_ROOT
+from core.assets import assets
+from core.pool import ObjectPool
+from core.settings import WIDTH, TICK_DT
 from entities.ship import Ship
 
 
-def _load_or_placeholder(path: str | None, size=None, color=(200, 50, 50)) -> pygame.Surface:
-    """Carga imagen; evita convert_alpha antes de que el display esté inicializado.
+# Tamaño de los rectángulos de reemplazo cuando falta una imagen
+PLACEHOLDER_SIZE = (40, 24)
 
-    Si la imagen existe pero aún no hay display (import temprano), se devuelve la superficie cruda.
-    Después, al dibujar, pygame usará esa superficie sin problemas; para optimizar se podría convertir
-    tras crear la ventana.
+# Nombres heredados de las superficies por color (ver __getattr__ al final del módulo)
+_LEGACY_IMAGES = {
+    'ENEMY_BLUE_IMAGE': ('blue', 'image'), 'ENEMY_GREEN_IMAGE': ('green', 'image'),
+    'ENEMY_PURPLE_IMAGE': ('purple', 'image'), 'SHOT_BLUE_IMAGE': ('blue', 'shot_image'),
+    'SHOT_GREEN_IMAGE': ('green', 'shot_image'), 'SHOT_PURPLE_IMAGE': ('purple', 'shot_image'),
+}
+
+
+class EnemySprite:
+    """Datos compartidos (flyweight) de un color de enemigo.
+
+    Imagen, máscara, tamaño e imagen de disparo se calculan una sola vez por color y
+    todas las instancias de ese color apuntan al mismo objeto.
     """
-    if path and os.path.exists(path):
-        img = pygame.image.load(path)  # no convert_alpha aún si no hay display
-        if pygame.display.get_init():
-            img = img.convert_alpha()
-        if size is not None:
-            img = pygame.transform.smoothscale(img, size)
-        return img
-    w, h = size if size else (40, 24)
-    surf = pygame.Surface((w, h), pygame.SRCALPHA)
-    surf.fill(color)
-    return surf
-
-
-# Directorio de imágenes: ahora priorizamos directamente images/ (según tu carpeta actual)
-IMAGES_DIR = os.path.join(PROJECT_ROOT, 'images')
-IMG_DIR = os.path.join(IMAGES_DIR, 'img')  # aún soportado como fallback
-
-def first_existing(paths):
-    for p in paths:
-        if p and os.path.exists(p):
-            return p
-    return None
-
-# Cargar superficies (prioridad absoluta a images/ raíz con nombres explícitos)
-ENEMY_BLUE_IMAGE = _load_or_placeholder(first_existing([
-    os.path.join(IMAGES_DIR, 'enemy_blue_image.png'),
-    os.path.join(IMG_DIR, 'enemy_blue_image.png'),
-    os.path.join(ASSETS_IMG_DIR, 'enemy_blue.png'),
-]), size=None, color=(80, 80, 255))
-ENEMY_GREEN_IMAGE = _load_or_placeholder(first_existing([
-    os.path.join(IMAGES_DIR, 'enemy_green_image.png'),
-    os.path.join(IMG_DIR, 'enemy_green_image.png'),
-    os.path.join(ASSETS_IMG_DIR, 'enemy_green.png'),
-]), size=None, color=(60, 200, 60))
-ENEMY_PURPLE_IMAGE = _load_or_placeholder(first_existing([
-    os.path.join(IMAGES_DIR, 'enemy_purple_image.png'),
-    os.path.join(IMG_DIR, 'enemy_purple_image.png'),
-    os.path.join(ASSETS_IMG_DIR, 'enemy_purple.png'),
-]), size=None, color=(160, 80, 200))
-SHOT_BLUE_IMAGE = _load_or_placeholder(first_existing([
-    os.path.join(IMAGES_DIR, 'shot_blue.png'),
-    os.path.join(IMG_DIR, 'shot_blue.png'),
-    os.path.join(ASSETS_IMG_DIR, 'shot_blue.png'),
-]), size=None, color=(80, 160, 255))
-SHOT_GREEN_IMAGE = _load_or_placeholder(first_existing([
-    os.path.join(IMAGES_DIR, 'shot_green.png'),
-    os.path.join(IMG_DIR, 'shot_green.png'),
-    os.path.join(ASSETS_IMG_DIR, 'shot_green.png'),
-]), size=None, color=(80, 255, 120))
-SHOT_PURPLE_IMAGE = _load_or_placeholder(first_existing([
-    os.path.join(IMAGES_DIR, 'shot_purple.png'),
-    os.path.join(IMG_DIR, 'shot_purple.png'),
-    os.path.join(ASSETS_IMG_DIR, 'shot_purple.png'),
-]), size=None, color=(200, 120, 255))
+
+    @classmethod
+    def load(cls, color: str, ship: tuple, shot: tuple) -> "EnemySprite":
+        """Carga desde el registro central ((nombres, color de reemplazo) de nave y de disparo)."""
+        (ship_names, ship_fill), (shot_names, shot_fill) = ship, shot
+        return cls(color,
+                   assets.image(*ship_names, placeholder=(PLACEHOLDER_SIZE, ship_fill)),
+                   assets.image(*shot_names, placeholder=(PLACEHOLDER_SIZE, shot_fill)))
+
+    def __init__(self, color: str, image: pygame.Surface, shot_image: pygame.Surface) -> None:
+        self.color = color
+        self.image = image
+        self.shot_image = shot_image
+        self.mask = assets.mask(image)
+        self.width, self.height = image.get_size()
 
 
 class Enemy(Ship):
     """Representa un enemigo que hereda de Ship.
 
     - Constructor define posición, color, salud y velocidad.
-    - Usa un mapeo COLOR para asignar imágenes de nave/disparo por color.
+    - Usa un mapeo COLOR para asignar imágenes de nave/disparo por color; imagen, máscara y
+      tamaño se comparten por color vía un catálogo de EnemySprite (ver sprite_for()).
     - Incluye utilidades para movimiento y creación de múltiples enemigos.
+    - Las instancias se reciclan con Enemy.pool (spawn() adquiere, release() devuelve).
     """
 
+    __slots__ = ('sprite',)
+
+    # Por color: (nombres de archivo, color de reemplazo) de la nave y del disparo. Las
+    # imágenes se cargan la primera vez que se pide cada color, no al importar el módulo
     COLOR = {
-        'blue': (ENEMY_BLUE_IMAGE, SHOT_BLUE_IMAGE),
-        'green': (ENEMY_GREEN_IMAGE, SHOT_GREEN_IMAGE),
-        'purple': (ENEMY_PURPLE_IMAGE, SHOT_PURPLE_IMAGE),
+        'blue': ((('enemy_blue_image.png', 'enemy_blue.png'), (80, 80, 255)), (('shot_blue.png',), (80, 160, 255))),
+        'green': ((('enemy_green_image.png', 'enemy_green.png'), (60, 200, 60)), (('shot_green.png',), (80, 255, 120))),
+        'purple': ((('enemy_purple_image.png', 'enemy_purple.png'), (160, 80, 200)), (('shot_purple.png',), (200, 120, 255))),
     }
+    COLORS = tuple(COLOR)
 
-    def __init__(self, speed: int, x: int = 50, y: int = 50, color: str = 'blue', health: int = 100) -> None:
-        # Inicializar posición/estado base (Ship maneja x, y, health, speed y rect)
-        super().__init__(x, y, health=health, image_path=None, speed=speed, bullet_image_path=None)
-        color = (color or 'blue').lower()
-        ship_img, bullet_img = self.COLOR.get(color, self.COLOR['blue'])
-        self.ship_img = ship_img
-        self.bullet_img = bullet_img
-        self.mask = pygame.mask.from_surface(self.ship_img)
+    # Catálogo color -> EnemySprite, armado la primera vez que se pide cada color
+    _sprites: dict[str, EnemySprite] = {}
+
+    @classmethod
+    def sprite_for(cls, color: str) -> EnemySprite:
+        """Sprite compartido de un color (colores inválidos caen a azul)."""
+        sprite = cls._sprites.get(color)
+        if sprite is None:
+            color = (color or 'blue').lower()
+            if color not in cls.COLOR:
+                color = 'blue'
+            sprite = cls._sprites.get(color)
+            if sprite is None:
+                sprite = cls._sprites[color] = EnemySprite.load(color, *cls.COLOR[color])
+        return sprite
+
+    def __init__(self, speed: float, x: int = 50, y: int = 50, color: str = 'blue', health: int = 100) -> None:
+        # Sin Ship.__init__: solo estado por instancia; imagen/máscara salen del sprite compartido
+        self.reset(speed, x, y, color, health)
+
+    def reset(self, speed: float, x: int = 50, y: int = 50, color: str = 'blue', health: int = 100) -> None:
+        """(Re)inicializa la instancia; lo usa el pool para reciclarla sin crear otra."""
+        self.sprite = sprite = self.sprite_for(color)
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.health = health
         self.speed = speed
-        self.rect = self.ship_img.get_rect(topleft=(self.x, self.y))
+        try:
+            self.rect.update(x, y, sprite.width, sprite.height)
+        except AttributeError:
+            self.rect = pygame.Rect(x, y, sprite.width, sprite.height)
+
+    @property
+    def color(self) -> str:
+        return self.sprite.color
+
+    @property
+    def ship_img(self) -> pygame.Surface:
+        return self.sprite.image
+
+    @property
+    def bullet_img(self) -> pygame.Surface:
+        return self.sprite.shot_image
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        return self.sprite.mask
 
-    def update(self) -> None:
+    def get_width(self) -> int:
+        return self.sprite.width
+
+    def get_height(self) -> int:
+        return self.sprite.height
+
+    @classmethod
+    def spawn(cls, amount: int, speed: float, rng: random.Random | None = None) -> list["Enemy"]:
+        """Crea 'amount' enemigos con x aleatoria y y fuera de pantalla (-1000,-100).
+
+        Solo sortea posición y color; imagen, máscara y tamaño vienen del catálogo compartido
+        y las instancias salen del pool. `rng` permite usar el generador sembrado de la
+        partida (reproducible); por defecto `random`.
+        """
+        rng = rng or random
+        x_max = WIDTH - cls.sprite_for('blue').width - 20
+        colors = cls.COLORS
+        acquire = cls.pool.acquire
+        return [acquire(speed, rng.randrange(20, x_max), rng.randrange(-1000, -100), rng.choice(colors))
+                for _ in range(amount)]
+
+    @classmethod
+    def release(cls, enemies) -> None:
+        """Devuelve al pool enemigos que ya no están en juego."""
+        cls.pool.release_all(enemies)
+
+    def update(self, dt: float = TICK_DT) -> None:
         """Movimiento hacia abajo simple (Space Invaders clásico para este nivel)."""
-        self.move()
+        self.move(dt)
 
     def increase_speed(self, delta: int = 1) -> None:
         self.speed = max(0, self.speed + delta)
 
-    def move(self) -> None:  # type: ignore[override]
-        """Movimiento vertical hacia abajo, como en tu ejemplo."""
-        super().move(0, self.speed)
+    def move(self, dt: float = TICK_DT) -> None:  # type: ignore[override]
+        """Movimiento vertical hacia abajo (speed en píxeles/segundo), como en tu ejemplo."""
+        super().move(0, self.speed * dt)
 
     @classmethod
-    def create_enemies(cls, count: int, y: int = 50, speed: int = 2, colors=None, width: int = None, padding: int = 16):
-        """(Modo fila) Conservado por compatibilidad: crea una fila horizontal en y fija."""
+    def create_enemies(cls, count: int, y: int = 50, speed: float = 120, colors=None, width: int = None, padding: int = 16,
+                       rng: random.Random | None = None):
+        """(Modo fila) Conservado por compatibilidad: crea una fila horizontal en y fija (del pool)."""
+        rng = rng or random
         if width is None:
             width = WIDTH
         if not colors:
             colors = ['blue', 'green', 'purple']
 
         enemies = []
-        ship_w = ENEMY_BLUE_IMAGE.get_width()
+        acquire = cls.pool.acquire
+        ship_w = cls.sprite_for('blue').width
         total_w = count * ship_w + (count - 1) * padding
         start_x = max(10, (width - total_w) // 2)
         for i in range(count):
             x = start_x + i * (ship_w + padding)
-            color = random.choice(colors)
-            enemies.append(cls(speed=speed, x=x, y=y, color=color))
+            color = rng.choice(colors)
+            enemies.append(acquire(speed, x, y, color))
         return enemies
 
     @classmethod
-    def create(cls, count: int, y: int = 50, speed: int = 2, colors=None, width: int = None, padding: int = 16):
+    def create(cls, count: int, y: int = 50, speed: float = 120, colors=None, width: int = None, padding: int = 16):
         """Alias simple (fila)."""
         return cls.create_enemies(count=count, y=y, speed=speed, colors=colors, width=width, padding=padding)
 
     # -------- API estilo ejemplo del usuario ---------
-    def create(self, amount: int):  # instance method
-        """Crea 'amount' enemigos con x aleatoria y y fuera de pantalla (-1000,-100)."""
-        enemies = []
-        for _ in range(amount):
-            enemy = Enemy(
-                x=random.randrange(20, WIDTH - ENEMY_BLUE_IMAGE.get_width() - 20),
-                y=random.randrange(-1000, -100),
-                color=random.choice(['blue', 'green', 'purple']),
-                speed=self.speed,
-            )
-            enemies.append(enemy)
-        return enemies
+    def create(self, amount: int, rng: random.Random | None = None):  # instance method
+        """Crea 'amount' enemigos con la velocidad de este (ver spawn())."""
+        return type(self).spawn(amount, self.speed, rng=rng)
 
     def increase_speed(self):  # override multiplicativo como el ejemplo
         self.speed *= 1.02
+
+
+# Pool compartido de instancias de Enemy (oleadas y spawns reciclan en vez de asignar)
+Enemy.pool = ObjectPool(Enemy, max_size=256)
+
+
+def __getattr__(name: str):
+    """ENEMY_*_IMAGE / SHOT_*_IMAGE se resuelven (y cargan) recién al pedirlos."""
+    if name in _LEGACY_IMAGES:
+        color, attr = _LEGACY_IMAGES[name]
+        return getattr(Enemy.sprite_for(color), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
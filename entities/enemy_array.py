@@ -0,0 +1,191 @@
+"""Almacén de enemigos en arreglos NumPy (estructura de arreglos) para el modo enjambre.
+
+En vez de una lista de objetos Enemy, cada atributo es un arreglo: x, y, posición del tick
+anterior, velocidad, índice de color y bandera de vivo. Movimiento, detección de fondo,
+descarte y compactación son operaciones vectorizadas sobre los `count` primeros elementos;
+imagen, máscara y tamaño se toman del catálogo compartido de Enemy por índice de color.
+
+Requiere NumPy; la simulación solo importa este módulo si se pide el modo enjambre.
+"""
+import random
+
+import numpy as np
+import pygame
+
+from core.settings import WIDTH, TICK_DT
+from entities.enemy import Enemy
+
+
+class EnemyArray:
+    """Enemigos como arreglos paralelos; el índice i describe al mismo enemigo en todos."""
+
+    def __init__(self, capacity: int = 256, colors: tuple[str, ...] = Enemy.COLORS) -> None:
+        self.colors = tuple(colors)
+        self.sprites = [Enemy.sprite_for(c) for c in self.colors]
+        self._widths = np.array([s.width for s in self.sprites], dtype=np.int64)
+        self._heights = np.array([s.height for s in self.sprites], dtype=np.int64)
+        self.count = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        old = getattr(self, "x", None)
+        fields = {
+            "x": np.float64, "y": np.float64, "prev_x": np.float64, "prev_y": np.float64,
+            "speed": np.float64, "color": np.int8, "alive": np.bool_,
+        }
+        for name, dtype in fields.items():
+            arr = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                arr[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    # -------- Altas y bajas ---------
+    def spawn(self, amount: int, speed: float, rng: random.Random | None = None, width: int = WIDTH) -> None:
+        """Agrega 'amount' enemigos con x aleatoria y y fuera de pantalla (-1000,-100).
+
+        El generador NumPy se siembra desde `rng` (el de la partida), así que la oleada es
+        reproducible igual que con Enemy.spawn.
+        """
+        if amount <= 0:
+            return
+        gen = np.random.default_rng((rng or random).randrange(2 ** 32))
+        start, end = self.count, self.count + amount
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+        self.x[start:end] = gen.integers(20, width - self.sprites[0].width - 20, amount)
+        self.y[start:end] = gen.integers(-1000, -100, amount)
+        self.prev_x[start:end] = self.x[start:end]
+        self.prev_y[start:end] = self.y[start:end]
+        self.speed[start:end] = speed
+        self.color[start:end] = gen.integers(0, len(self.sprites), amount)
+        self.alive[start:end] = True
+        self.count = end
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def kill(self, indices) -> None:
+        """Marca como muertos los índices dados y compacta."""
+        self.alive[np.asarray(list(indices), dtype=np.int64)] = False
+        self.compact()
+
+    def compact(self) -> None:
+        """Elimina los muertos conservando el orden de los vivos."""
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+        k = len(keep)
+        for arr in (self.x, self.y, self.prev_x, self.prev_y, self.speed, self.color):
+            arr[:k] = arr[keep]
+        self.alive[:k] = True
+        self.count = k
+
+    # -------- Simulación ---------
+    def save_previous(self) -> None:
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def update(self, dt: float = TICK_DT) -> None:
+        """Descenso de todos los enemigos (speed en píxeles/segundo) en una sola operación."""
+        n = self.count
+        self.y[:n] += self.speed[:n] * dt
+
+    def _rects(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Rects enteros (x, y, w, h) como en pygame.Rect (truncando la posición)."""
+        n = self.count
+        color = self.color[:n]
+        return (self.x[:n].astype(np.int64), self.y[:n].astype(np.int64),
+                self._widths[color], self._heights[color])
+
+    def cull_bottom(self, height: int) -> int:
+        """Descarta los enemigos que tocaron el borde inferior; retorna cuántos."""
+        _, y, _, h = self._rects()
+        reached = (y + h) >= height
+        hits = int(np.count_nonzero(reached))
+        if hits:
+            self.alive[:self.count][reached] = False
+            self.compact()
+        return hits
+
+    def touching(self, rect: pygame.Rect, mask: pygame.mask.Mask | None = None) -> list[int]:
+        """Índices (en orden) de los enemigos que tocan `rect`: AABB vectorizado y luego máscara."""
+        if not self.count:
+            return []
+        x, y, w, h = self._rects()
+        candidates = np.flatnonzero((x < rect.right) & (x + w > rect.left) & (y < rect.bottom) & (y + h > rect.top))
+        if mask is None:
+            return candidates.tolist()
+        color = self.color
+        return [int(i) for i in candidates
+                if mask.overlap(self.sprites[color[i]].mask, (int(x[i]) - rect.x, int(y[i]) - rect.y)) is not None]
+
+    def boxes(self) -> np.ndarray:
+        """Rects (x, y, w, h) de todos los enemigos como arreglo (count, 4)."""
+        return np.stack(self._rects(), axis=1)
+
+    def mask(self, i: int) -> pygame.mask.Mask:
+        return self.sprites[self.color[i]].mask
+
+    def shooters(self, chance: float, rng: random.Random | None = None) -> list[int]:
+        """Índices de los enemigos visibles que disparan este tick (probabilidad `chance` cada uno)."""
+        if not self.count:
+            return []
+        gen = np.random.default_rng((rng or random).randrange(2 ** 32))
+        n = self.count
+        fire = (self.y[:n] > 0) & (gen.random(n) < chance)
+        return np.flatnonzero(fire).tolist()
+
+    def lowest(self) -> int:
+        """Índice del enemigo con el borde inferior más bajo (-1 si no hay)."""
+        if not self.count:
+            return -1
+        _, y, _, h = self._rects()
+        return int(np.argmax(y + h))
+
+    def rect(self, i: int) -> pygame.Rect:
+        sprite = self.sprites[self.color[i]]
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), sprite.width, sprite.height)
+
+    # -------- Dibujo ---------
+    def draw(self, window: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        """Dibuja solo los enemigos visibles, interpolados, en un único blits()."""
+        n = self.count
+        if not n:
+            return []
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        color = self.color[:n]
+        visible = np.flatnonzero((y + self._heights[color] > 0) & (y < window.get_height()))
+        if not len(visible):
+            return []
+        images = [s.image for s in self.sprites]
+        return window.blits([(images[c], (px, py)) for c, px, py in
+                             zip(color[visible].tolist(), x[visible].tolist(), y[visible].tolist())])
+
+    # -------- Snapshots ---------
+    def snapshot(self) -> list[tuple]:
+        """Filas (x, y, prev_x, prev_y, speed, color) de tipos básicos, para keyframes."""
+        n = self.count
+        names = [self.colors[c] for c in self.color[:n].tolist()]
+        return list(zip(self.x[:n].tolist(), self.y[:n].tolist(), self.prev_x[:n].tolist(),
+                        self.prev_y[:n].tolist(), self.speed[:n].tolist(), names))
+
+    def restore(self, rows: list[tuple]) -> None:
+        self.count = 0
+        if len(rows) > self.capacity:
+            self._allocate(len(rows))
+        index = {c: i for i, c in enumerate(self.colors)}
+        for i, (x, y, prev_x, prev_y, speed, color) in enumerate(rows):
+            self.x[i], self.y[i], self.prev_x[i], self.prev_y[i], self.speed[i] = x, y, prev_x, prev_y, speed
+            self.color[i] = index.get(color, 0)
+            self.alive[i] = True
+        self.count = len(rows)
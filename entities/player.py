@@ -1,113 +1,114 @@
-import os
 import pygame
 
-from core.settings import PROJECT_ROOT, ASSETS_IMG_DIR, WIDTH, HEIGHT
+from core.assets import assets
+from core.settings import WIDTH, HEIGHT, TICK_DT
+from core.inputs import INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE, read_keyboard
+from core.projectiles import ProjectileManager, OWNER_PLAYER
 from entities.ship import Ship
-from entities.bullet import Bullet
-
-
-def first_existing(paths):
-    for p in paths:
-        if p and os.path.exists(p):
-            return p
-    return None
 
 
 class Player(Ship):
-    def __init__(self, x: int, y: int, x_speed: float, y_speed: float, health: int = 100) -> None:
-        # Cargar imágenes del jugador y bala
-        images_dir = os.path.join(PROJECT_ROOT, 'images')
-        player_img_path = first_existing([
-            os.path.join(images_dir, 'img', 'player_image.png'),
-            os.path.join(images_dir, 'player_image.png'),
-            os.path.join(ASSETS_IMG_DIR, 'ship.png'),
-        ])
-        bullet_img_path = first_existing([
-            os.path.join(images_dir, 'img', 'bullet_image.png'),
-            os.path.join(images_dir, 'bullet_image.png'),
-            os.path.join(ASSETS_IMG_DIR, 'bullet.png'),
-        ])
+    __slots__ = (
+        'x_speed', 'y_speed', 'bullet_speed', 'fire_delay', 'max_health', 'mask', 'projectiles',
+        'bullet_kind', 'creation_cooldown_counter', 'max_amount_bullets', 'ammo',
+    )
+
+    def __init__(self, x: int, y: int, x_speed: float, y_speed: float, health: int = 100,
+                 projectiles: ProjectileManager | None = None) -> None:
+        # Rutas de imágenes del jugador y bala desde el registro central
+        player_img_path = assets.path('player_image.png', 'ship.png')
+        bullet_img_path = assets.path('bullet_image.png', 'bullet.png')
         super().__init__(x, y, health=health, image_path=player_img_path, speed=int(max(x_speed, y_speed)), bullet_image_path=bullet_img_path)
         
-        # Velocidades específicas
+        # Velocidades específicas (píxeles/segundo)
         self.x_speed = x_speed
         self.y_speed = y_speed
 
-        # Parámetros de disparo
-        self.bullet_speed = -10
+        # Parámetros de disparo (velocidad en píxeles/segundo, tiempos en segundos)
+        self.bullet_speed = -600
+        self.fire_delay = 20 * TICK_DT
         self.max_health = health
-        self.mask = pygame.mask.from_surface(self.ship_img)
+        self.mask = assets.mask(self.ship_img)
+        if self.bullet_img is None:
+            # Placeholder único: una superficie (y una máscara cacheada) para todas las balas
+            self.bullet_img = pygame.Surface((8, 16), pygame.SRCALPHA)
+            self.bullet_img.fill((255, 255, 0))
+        # Balas en vuelo: slots del gestor de proyectiles (compartido con los enemigos en la partida)
+        self.projectiles = projectiles if projectiles is not None else ProjectileManager()
+        self.bullet_kind = self.projectiles.add_kind(self.bullet_img)
         self.creation_cooldown_counter = 0
         self.max_amount_bullets = 4
-        self.bullets = []
-        self.fired_bullets = []
+        # Balas listas en la "recámara" (solo un contador; la bala existe al dispararse)
+        self.ammo = 0
         self.bullet_cooldown_counter = 0
 
-    def move(self, width: int = WIDTH, height: int = HEIGHT) -> None:
-        keys = pygame.key.get_pressed()
-        if (keys[pygame.K_UP] or keys[pygame.K_w]) and (self.y > 0):
-            self.y -= self.y_speed
-        elif (keys[pygame.K_DOWN] or keys[pygame.K_s]) and (self.y < height - self.ship_img.get_height() - 60):
-            self.y += self.y_speed
-        if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and (self.x < width - self.ship_img.get_width()):
-            self.x += self.x_speed
-        elif (keys[pygame.K_LEFT] or keys[pygame.K_a]) and (self.x > 0):
-            self.x -= self.x_speed
+    def move(self, width: int = WIDTH, height: int = HEIGHT, inputs: int | None = None,
+             dt: float = TICK_DT) -> None:
+        """Mueve la nave dt segundos según los bits de entrada (si no se dan, lee el teclado)."""
+        if inputs is None:
+            inputs = read_keyboard()
+        if (inputs & INPUT_UP) and (self.y > 0):
+            self.y -= self.y_speed * dt
+        elif (inputs & INPUT_DOWN) and (self.y < height - self.ship_img.get_height() - 60):
+            self.y += self.y_speed * dt
+        if (inputs & INPUT_RIGHT) and (self.x < width - self.ship_img.get_width()):
+            self.x += self.x_speed * dt
+        elif (inputs & INPUT_LEFT) and (self.x > 0):
+            self.x -= self.x_speed * dt
         self.rect.topleft = (int(self.x), int(self.y))
 
     def increase_speed(self) -> None:
-        if self.x_speed < 10:
-            self.x_speed += 1.25
-            self.y_speed += 1.25
-        elif self.x_speed >= 10:
-            self.x_speed = 10
-            self.y_speed = 8
-        if self.cool_down > 25:
-            self.cool_down = int(self.cool_down * 0.9)
+        if self.x_speed < 600:
+            self.x_speed += 75
+            self.y_speed += 75
+        elif self.x_speed >= 600:
+            self.x_speed = 600
+            self.y_speed = 480
+        if self.cool_down > 25 * TICK_DT:
+            self.cool_down = self.cool_down * 0.9
 
-    def create_bullets(self) -> None:
-        if (len(self.bullets) < self.max_amount_bullets) and (self.creation_cooldown_counter == 0):
-            img = self.bullet_img or pygame.Surface((8, 16), pygame.SRCALPHA)
-            if self.bullet_img is None:
-                img.fill((255, 255, 0))
-            bullet = Bullet(self.x, self.y, img, speed=self.bullet_speed)
-            self.bullets.append(bullet)
-            self.creation_cooldown_counter = 1
+    def create_bullets(self, dt: float = TICK_DT) -> None:
+        if (self.ammo < self.max_amount_bullets) and (self.creation_cooldown_counter == 0):
+            self.ammo += 1
+            self.creation_cooldown_counter = dt
+
+    def refill_bullets(self) -> None:
+        """Descarta las balas en vuelo y llena la recámara hasta max_amount_bullets."""
+        self.projectiles.clear(OWNER_PLAYER)
+        self.ammo = self.max_amount_bullets
+        self.creation_cooldown_counter = 0
+        self.bullet_cooldown_counter = 0
 
-    def cooldown(self) -> None:
-        if self.bullet_cooldown_counter >= 20:
+    def cooldown(self, dt: float = TICK_DT) -> None:
+        """Avanza los cooldowns dt segundos (un contador > 0 indica cooldown activo)."""
+        if self.bullet_cooldown_counter >= self.fire_delay:
             self.bullet_cooldown_counter = 0
         elif self.bullet_cooldown_counter > 0:
-            self.bullet_cooldown_counter += 1
+            self.bullet_cooldown_counter += dt
 
         if self.creation_cooldown_counter >= self.cool_down:
             self.creation_cooldown_counter = 0
         elif self.creation_cooldown_counter > 0:
-            self.creation_cooldown_counter += 1
+            self.creation_cooldown_counter += dt
 
-    def fire(self, window: pygame.Surface | None = None) -> None:
+    def fire(self, window: pygame.Surface | None = None, inputs: int | None = None,
+             dt: float = TICK_DT) -> None:
         """Gestiona el disparo (sin dibujar)."""
-        keys = pygame.key.get_pressed()
-        if (keys[pygame.K_SPACE]) and (len(self.bullets) > 0) and (self.bullet_cooldown_counter == 0):
+        if inputs is None:
+            inputs = read_keyboard()
+        if (inputs & INPUT_FIRE) and (self.ammo > 0) and (self.bullet_cooldown_counter == 0):
             # Centrar bala en la nave
-            last = self.bullets[-1]
-            last.x = self.x + (self.ship_img.get_width() - (last.image.get_width())) / 2
-            last.y = self.y + 10
-            last.rect.topleft = (int(last.x), int(last.y))
-            self.fired_bullets.append(self.bullets.pop())
-            self.bullet_cooldown_counter = 1
-            self.creation_cooldown_counter = 1
+            x = self.x + (self.ship_img.get_width() - self.bullet_img.get_width()) / 2
+            self.projectiles.spawn(x, self.y + 10, self.bullet_speed, self.bullet_kind, OWNER_PLAYER)
+            self.ammo -= 1
+            self.bullet_cooldown_counter = dt
+            self.creation_cooldown_counter = dt
 
-    def update_bullets(self) -> None:
-        """Actualiza posición de las balas disparadas y limpia las fuera de pantalla."""
-        for b in self.fired_bullets:
-            b.move(self.bullet_speed)
-        self.fired_bullets = [b for b in self.fired_bullets if b.y > -40]
+    def update_bullets(self, height: int = HEIGHT, dt: float = TICK_DT) -> None:
+        """Mueve las balas en vuelo y descarta las que salen de pantalla (una pasada vectorizada)."""
+        self.projectiles.update(height, dt)
 
     def hit(self, enemy) -> bool:
-        if not self.fired_bullets:
-            return False
-        # Checa colisión con la última bala disparada
-        b = self.fired_bullets[-1]
-        self.creation_cooldown_counter = int(self.cool_down * 0.8)
-        return b.collision(enemy)
+        """True si alguna bala en vuelo toca al enemigo."""
+        self.creation_cooldown_counter = self.cool_down * 0.8
+        return bool(self.projectiles.contacts(OWNER_PLAYER, [enemy.rect], lambda _: enemy.mask))
@@ -1,6 +1,9 @@
 import os
 import pygame
 
+from core.assets import assets
+
+
 class Ship:
     """Nave del jugador.
 
@@ -16,9 +19,18 @@ class Ship:
       - ship_img, bullet_img
       - bullet_cooldown_counter
       - bullets, fired_bullets
-      - cool_down (frames)
+      - cool_down (segundos de simulación)
+      - prev_x, prev_y (posición del tick anterior, para interpolar al dibujar)
+
+    Usa __slots__ (sin __dict__ por instancia); las subclases que agregan atributos
+    declaran los suyos.
     """
 
+    __slots__ = (
+        'x', 'y', 'prev_x', 'prev_y', 'health', 'speed', 'ship_img', 'bullet_img', 'rect',
+        'bullet_cooldown_counter', 'bullets', 'fired_bullets', 'cool_down',
+    )
+
     def __init__(
         self,
         x: int,
@@ -31,19 +43,21 @@ class Ship:
         # Posición y estado
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.health = health
         self.speed = speed
 
         # Imágenes (nave y bala)
         if image_path and os.path.exists(image_path):
-            self.ship_img = pygame.image.load(image_path).convert_alpha()
+            self.ship_img = assets.load(image_path)
         else:
             # placeholder
             self.ship_img = pygame.Surface((40, 24), pygame.SRCALPHA)
             self.ship_img.fill((0, 200, 255))
 
         if bullet_image_path and os.path.exists(bullet_image_path):
-            self.bullet_img = pygame.image.load(bullet_image_path).convert_alpha()
+            self.bullet_img = assets.load(bullet_image_path)
         else:
             self.bullet_img = None
 
@@ -54,10 +68,18 @@ class Ship:
         self.bullet_cooldown_counter = 0
         self.bullets = []
         self.fired_bullets = []
-        self.cool_down = 120
+        self.cool_down = 2.0
+
+    def save_previous(self) -> None:
+        """Guarda la posición actual como la del tick anterior (antes de simular)."""
+        self.prev_x = self.x
+        self.prev_y = self.y
 
-    def draw(self, window: pygame.Surface) -> None:
-        window.blit(self.ship_img, (self.x, self.y))
+    def draw(self, window: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
+        """Dibuja interpolando entre el tick anterior y el actual (alpha en [0, 1]); retorna el rect dibujado."""
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return window.blit(self.ship_img, (x, y))
 
     def move(self, dx: int, dy: int) -> None:
         self.x += dx
@@ -1,33 +1,158 @@
+import argparse
+import sys
+import time
 import pygame
-from game import Game
-from core.menu_principal import MenuPrincipal
-from core.menu_acerca_de import MenuAcercaDe
+
+
+def run_headless(frames: int, seed: int | None = None, record_path: str | None = None,
+                 swarm: bool = False, profile: bool = False, memtrack: bool = False,
+                 mem_limit: float | None = None) -> int:
+    """Corre la simulación sin ventana ni límite de FPS y reporta el rendimiento."""
+    from core.simulation import GameState, step, autopilot
+    from core.replay import ReplayRecorder
+    from core.profiler import FrameProfiler
+    from core.memtrack import MemoryTracker
+
+    state = GameState(seed=seed, swarm=swarm)
+    profiler = FrameProfiler() if profile else None
+    state.profiler = profiler
+    tracker = None
+    if memtrack:
+        tracker = MemoryTracker() if mem_limit is None else MemoryTracker(max_growth_kb_min=mem_limit)
+        tracker.start()
+    recorder = ReplayRecorder(state) if record_path else None
+    partidas = 1
+    simulados = 0
+    inicio = time.perf_counter()
+    for _ in range(frames):
+        simulados += 1
+        if profiler:
+            profiler.begin_frame()
+        inputs = autopilot(state)
+        if recorder:
+            recorder.record(state, inputs)
+        step(state, inputs)
+        if tracker:
+            tracker.advance()
+        if state.game_over:
+            if recorder:
+                break  # un replay cubre una sola partida
+            # Reiniciar partida para seguir midiendo durante todos los frames pedidos
+            state = GameState(seed=state.rng.randrange(2 ** 32), swarm=swarm)
+            state.profiler = profiler
+            partidas += 1
+    elapsed = time.perf_counter() - inicio
+    fps = simulados / elapsed if elapsed > 0 else float("inf")
+    print(f"[Headless] {simulados} frames en {elapsed:.3f}s ({fps:.0f} frames/s)")
+    print(f"[Headless] partidas={partidas} nivel={state.level} score={state.score} vidas={state.lives}")
+    if recorder:
+        recorder.save(record_path)
+        print(f"[Replay] {len(recorder.replay)} ticks guardados en '{record_path}' (semilla {state.seed})")
+    if profiler:
+        profiler.begin_frame()
+        for name, p in profiler.stats()['phases'].items():
+            if p['p99'] > 0:
+                print(f"[Profile] {name:<10} p50 {p['p50']:.3f}  p95 {p['p95']:.3f}  p99 {p['p99']:.3f} ms")
+        paths = profiler.export()
+        if paths:
+            print(f"[Profile] Tiempos por fase en '{paths[0]}' y '{paths[1]}'")
+    if tracker and not tracker.finish():
+        return 1
+    return 0
+
+
+def run_replay(path: str, seek: int | None = None) -> None:
+    """Reproduce un replay sin límite de velocidad (o salta directo al tick `seek`)."""
+    from core.replay import Replay, ReplayPlayer
+
+    player = ReplayPlayer(Replay.load(path))
+    inicio = time.perf_counter()
+    state = player.seek(seek) if seek is not None else player.advance()
+    elapsed = time.perf_counter() - inicio
+    print(f"[Replay] tick {player.tick}/{len(player.replay)} en {elapsed:.3f}s (semilla {state.seed})")
+    print(f"[Replay] nivel={state.level} score={state.score} vidas={state.lives} kills={state.kills}")
+
+
+def build_manager(seed: int | None = None, record_path: str | None = None,
+                  dirty_rects: bool = False, swarm: bool = False, profile: bool = False, memtrack=None):
+    """Ventana y pila inicial de escenas, listas para SceneManager.run()."""
+    from game import Game
+    from core import ui
+    from core.scenes import SceneManager
+    from core.menu_principal import MenuPrincipal
+    from core.menu_acerca_de import MenuAcercaDe
+    from core.menu_puntajes import MenuPuntajes
+
+    # La única ventana de la sesión (fuentes y audio se inician al primer uso)
+    manager = SceneManager(ui.ventana())
+
+    def iniciar_juego(nombre: str) -> Game:
+        # Tras elegir nombre válido, iniciar el juego principal con ese nombre
+        return Game(player_name=nombre, seed=seed, record_path=record_path,
+                    dirty_rects=dirty_rects, swarm=swarm, profile=profile, memtrack=memtrack)
+
+    # Pila inicial: el menú principal y, encima, Acerca de (al volver queda el menú).
+    # Desde el menú: nombre -> juego -> nivel completado / game over -> puntajes -> menú
+    manager.push(MenuPrincipal(iniciar_juego, "scores.txt"))
+    manager.push(MenuAcercaDe(precargar=(MenuPrincipal, Game, MenuPuntajes)))
+    return manager
 
 
 def main():
-    # Inicializar Pygame antes de usar el menú de puntajes
-    if not pygame.get_init():
-        pygame.init()
-        try:
-            pygame.font.init()
-        except Exception:
-            pass
-
-    # Menú Acerca de (opcional al inicio)
-    acerca = MenuAcercaDe()
-    acerca.ejecutar()
-
-    # Menú principal: retorna nombre si elige "Nuevo Juego"
-    menu = MenuPrincipal()
-    nombre = menu.run("scores.txt")
-    if not nombre:
-        pygame.quit()
+    parser = argparse.ArgumentParser(description="Space Invaders")
+    parser.add_argument("--headless", action="store_true",
+                        help="simula sin ventana ni límite de FPS (para CI)")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="frames a simular en modo headless")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="semilla de la partida (reproducible)")
+    parser.add_argument("--record", metavar="ARCHIVO", default=None,
+                        help="graba las entradas por tick en un replay")
+    parser.add_argument("--replay", metavar="ARCHIVO", default=None,
+                        help="reproduce un replay sin límite de velocidad")
+    parser.add_argument("--seek", type=int, default=None,
+                        help="con --replay: salta al tick indicado usando keyframes")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="redibuja y presenta solo las zonas que cambian en cada frame")
+    parser.add_argument("--swarm", action="store_true",
+                        help="modo enjambre: cientos de enemigos en arreglos NumPy")
+    parser.add_argument("--memtrack", action="store_true",
+                        help="muestrea la memoria por subsistema (tracemalloc) e informa la tendencia; "
+                             "con --headless, sale con código 1 si crece sobre el umbral")
+    parser.add_argument("--mem-limit", type=float, default=None, metavar="KB_MIN",
+                        help="umbral de crecimiento de memoria en KB por minuto de juego (con --memtrack)")
+    parser.add_argument("--profile", action="store_true",
+                        help="mide cada fase del frame (F3: overlay, F4: cProfile) y exporta CSV/JSON al salir")
+    args = parser.parse_args()
+
+    from core.settings import DIRTY_RECTS, SWARM
+
+    if args.replay:
+        run_replay(args.replay, args.seek)
         return
+    if args.headless:
+        return run_headless(args.frames, seed=args.seed, record_path=args.record, swarm=args.swarm or SWARM,
+                            profile=args.profile, memtrack=args.memtrack, mem_limit=args.mem_limit)
+
+    from core import scores
+    from core.memtrack import MemoryTracker
+
+    # Un solo tracker para toda la sesión (todas las partidas); se traza desde antes de crear la ventana
+    tracker = None
+    if args.memtrack:
+        tracker = MemoryTracker() if args.mem_limit is None else MemoryTracker(max_growth_kb_min=args.mem_limit)
+        tracker.start()
+    manager = build_manager(seed=args.seed, record_path=args.record,
+                            dirty_rects=args.dirty_rects or DIRTY_RECTS, swarm=args.swarm or SWARM,
+                            profile=args.profile, memtrack=tracker)
+    manager.run()
+    if tracker:
+        tracker.finish()
 
-    # Tras elegir nombre válido, iniciar el juego principal con ese nombre
-    game = Game(player_name=nombre)
-    game.run()
+    # Esperar a que se escriban los puntajes encolados antes de salir
+    scores.close_writers()
+    pygame.quit()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
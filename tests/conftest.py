@@ -0,0 +1,21 @@
+"""Configuración común: sin ventana ni audio reales y con la raíz del proyecto importable."""
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repositorio de puntajes en una base temporal, sin texto heredado que importar."""
+    from core.scores import ScoreRepository
+
+    repo = ScoreRepository(str(tmp_path / "scores.db"), legacy_path=None)
+    yield repo
+    repo.close()
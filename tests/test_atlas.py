@@ -0,0 +1,69 @@
+"""Atlas horneado: qué entra, máscaras iguales a las calculadas y caída al archivo si cambió."""
+import os
+import shutil
+
+import pygame
+import pytest
+
+from core import atlas
+from core.assets import AssetManager
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return AssetManager(use_atlas=False).files(*atlas.IMAGE_EXTENSIONS)
+
+
+@pytest.fixture
+def baked(tmp_path, sources):
+    path = str(tmp_path / "sprites.atlas")
+    formats = atlas.bake(sources, path)
+    sprite_atlas = atlas.SpriteAtlas(path)
+    yield path, formats, sprite_atlas
+    sprite_atlas.close()
+
+
+def test_large_opaque_images_stay_out(baked, sources):
+    path, formats, sprite_atlas = baked
+    for name, source in sources.items():
+        w, h = pygame.image.load(source).get_size()
+        if name not in formats:
+            assert w * h > atlas.MAX_OPAQUE_PIXELS and name not in sprite_atlas
+    assert "background.png" not in sprite_atlas
+    # Solo sprites chicos: el atlas no debe pesar más que unos KB por sprite
+    pixels = sum(r.w * r.h for r, *_ in sprite_atlas.entries.values())
+    assert os.path.getsize(path) < 2 * pixels * 4 + 16 * 1024
+
+
+def test_masks_match_from_surface(baked, sources):
+    _, formats, sprite_atlas = baked
+    assert formats
+    for name in formats:
+        expected = pygame.mask.from_surface(pygame.image.load(sources[name]))
+        mask = sprite_atlas.mask(name)
+        assert mask.get_size() == expected.get_size()
+        assert mask.count() == expected.count() == mask.overlap_area(expected, (0, 0)), name
+
+
+def test_pack_does_not_overlap():
+    sizes = {f"s{i}": (8 + i * 7 % 60, 5 + i * 13 % 70) for i in range(40)}
+    width, height, positions = atlas._pack(sizes)
+    rects = [pygame.Rect(positions[n], sizes[n]) for n in sizes]
+    assert all(0 <= r.left and r.right <= width and r.bottom <= height for r in rects)
+    assert not any(a.colliderect(b) for i, a in enumerate(rects) for b in rects[i + 1:])
+
+
+def test_edited_source_is_not_fresh(tmp_path, sources):
+    name = "nave.png"
+    copy = tmp_path / name
+    shutil.copy(sources[name], copy)
+    path = str(tmp_path / "sprites.atlas")
+    atlas.bake({name: str(copy)}, path)
+    sprite_atlas = atlas.SpriteAtlas(path)
+    try:
+        assert sprite_atlas.fresh(name, str(copy))
+        st = os.stat(copy)
+        os.utime(copy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert not sprite_atlas.fresh(name, str(copy))
+    finally:
+        sprite_atlas.close()
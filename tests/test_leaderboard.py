@@ -0,0 +1,115 @@
+"""Tabla de posiciones: rank/rows contra el orden de la base recorrido de forma ingenua."""
+import random
+import threading
+
+from core.leaderboard import Leaderboard
+
+
+def _players(n: int = 3000, seed: int = 9) -> dict[str, int]:
+    """Jugadores con muchos empates de puntaje y nombres en mayúsculas/minúsculas mezcladas."""
+    rng = random.Random(seed)
+    players = {}
+    for i in range(n):
+        name = f"{rng.choice(['ana', 'Bruno', 'CARLA', 'dani'])}{i}"
+        players[name] = rng.randrange(200)
+    return players
+
+
+def _loaded(repo, players) -> Leaderboard:
+    repo.save_many(players.items())
+    board = Leaderboard(repo)
+    board.refresh(wait=True)
+    return board
+
+
+def _reference(players) -> list[tuple[str, int]]:
+    # Mismo orden que la base: puntaje descendente, desempate por nombre en minúsculas
+    return sorted(players.items(), key=lambda row: (-row[1], row[0].lower()))
+
+
+def test_rank_matches_sorted_order(repo):
+    players = _players()
+    board = _loaded(repo, players)
+    assert len(board) == len(players)
+    for pos, (name, score) in enumerate(_reference(players), start=1):
+        assert board.rank(name, score) == pos
+        assert board.rank(f" {name.upper()} ", score) == pos
+
+
+def test_rank_of_unknown_player_or_score(repo):
+    players = _players(500)
+    board = _loaded(repo, players)
+    name, score = next(iter(players.items()))
+    assert board.rank("nadie", score) is None
+    assert board.rank(name, score + 1000) is None
+    assert board.rank(name, -1) is None
+    assert Leaderboard(repo).rank(name, score) is None  # sin cargar
+
+
+def test_rank_for_score(repo):
+    players = _players(1000)
+    board = _loaded(repo, players)
+    scores = list(players.values())
+    for score in (-5, 0, 1, 57, 100, 199, 200, 10 ** 6):
+        assert board.rank_for_score(score) == sum(p > score for p in scores) + 1
+
+
+def test_rows_slices(repo):
+    players = _players(700)
+    board = _loaded(repo, players)
+    expected = [(pos, n, p) for pos, (n, p) in enumerate(_reference(players), start=1)]
+    for start, count in ((0, 10), (95, 10), (690, 10), (700, 5), (-3, 4)):
+        assert board.rows(start, count) == expected[max(0, start):max(0, start) + count]
+
+
+def test_reload_only_after_change(repo):
+    board = _loaded(repo, {"Ana": 10, "Bruno": 20})
+    assert board.rank("ana", 10) == 2
+    version = board.version
+    board.refresh(wait=True)  # sin cambios: no recarga
+    assert board.version == version
+    repo.save("Carla", 30)
+    board.refresh(wait=True)
+    assert board.version == version + 1
+    assert board.rank("carla", 30) == 1 and board.rank("ana", 10) == 3
+
+
+def test_prepare_runs_on_loader_thread(repo):
+    board = _loaded(repo, {"Ana": 10})
+    version = board.version
+    threads = []
+
+    def prepare():
+        threads.append(threading.current_thread())
+        repo.save("Bruno", 20)
+
+    board.refresh(wait=True, prepare=prepare)
+    assert threads and threads[0] is not threading.main_thread()
+    assert board.version == version + 1
+    assert board.rank("bruno", 20) == 1
+
+
+def test_prepare_requested_during_load_still_runs(repo):
+    board = _loaded(repo, {"Ana": 10})
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def first():
+        calls.append(("first", threading.current_thread()))
+        started.set()
+        assert release.wait(5)
+
+    def second():
+        calls.append(("second", threading.current_thread()))
+        repo.save("Bruno", 20)
+
+    board.refresh(prepare=first)
+    assert started.wait(5)
+    board.refresh(prepare=second)  # la primera carga sigue bloqueada
+    assert board.loading
+    release.set()
+    board.refresh(wait=True)
+    assert [name for name, _ in calls] == ["first", "second"]
+    assert all(t is not threading.main_thread() for _, t in calls)
+    assert not board.loading
+    assert board.rank("bruno", 20) == 1
@@ -0,0 +1,74 @@
+"""Índice de nombres: prefijos, disponibilidad y sugerencias contra una base temporal."""
+import random
+
+from core.name_index import NameIndex
+
+
+def _index(repo, names) -> NameIndex:
+    repo.save_many((n, i) for i, n in enumerate(names))
+    index = NameIndex(repo)
+    index.refresh()
+    return index
+
+
+def test_with_prefix_matches_linear_scan(repo):
+    rng = random.Random(3)
+    names = {"".join(rng.choice("abcz") for _ in range(rng.randint(1, 6))) for _ in range(2000)}
+    index = _index(repo, names)
+    ordered = sorted(names)
+    for prefix in ("a", "ab", "abc", "zz", "b", "cab", "zzzzzzz", "q"):
+        for limit in (1, 5, 50):
+            expected = [n for n in ordered if n.startswith(prefix)][:limit]
+            assert index.with_prefix(prefix, limit) == expected, (prefix, limit)
+
+
+def test_with_prefix_ignores_case_and_blanks(repo):
+    index = _index(repo, ["Ana", "anabel", "ANDRES", "bruno"])
+    assert index.with_prefix("AN") == ["ana", "anabel", "andres"]
+    assert index.with_prefix("  ana ") == ["ana", "anabel"]
+    assert index.with_prefix("") == []
+    assert index.with_prefix("   ") == []
+
+
+def test_contains_and_add(repo):
+    index = _index(repo, ["Ana", "Bruno"])
+    assert "ana" in index and " BRUNO " in index
+    assert "carla" not in index
+    index.add("Carla")
+    index.add("carla")
+    assert "CARLA" in index and len(index) == 3
+    assert index.with_prefix("c") == ["carla"]
+
+
+def test_suggest_skips_taken_variants(repo):
+    index = _index(repo, ["Ana", "ana2", "ANA3"])
+    assert index.suggest("Ana") == "Ana4"
+    assert index.suggest("  Bruno ") == "Bruno2"
+    assert index.suggest("   ") is None
+
+
+def test_suggest_respects_max_len(repo):
+    long_name = "x" * 20
+    index = _index(repo, [long_name] + ["x" * 19 + str(n) for n in range(2, 10)])
+    suggestion = index.suggest(long_name)
+    assert suggestion == "x" * 18 + "10"
+    assert len(suggestion) <= 20 and suggestion not in index
+
+
+def test_refresh_reloads_only_when_database_changed(repo):
+    index = _index(repo, ["Ana"])
+    assert index.refresh() is False
+    repo.save("Bruno", 10)
+    assert index.refresh() is True
+    assert "bruno" in index
+
+
+def test_added_name_survives_reload_until_saved(repo):
+    index = _index(repo, ["Ana"])
+    index.add("Bruno")
+    repo.save("Carla", 5)  # la base cambia, pero Bruno todavía no se guardó
+    assert index.refresh() is True
+    assert "bruno" in index and "carla" in index
+    repo.save("Bruno", 7)
+    assert index.refresh() is True
+    assert index.with_prefix("b") == ["bruno"] and len(index) == 3
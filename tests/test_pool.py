@@ -0,0 +1,42 @@
+"""Pool de objetos: reutiliza instancias, respeta el tope y rechaza liberar dos veces."""
+import pytest
+
+from core.pool import ObjectPool
+
+
+class Item:
+    __slots__ = ('value',)
+
+    def reset(self, value: int = 0) -> None:
+        self.value = value
+
+
+def test_reuses_released_instances():
+    pool = ObjectPool(Item, max_size=4)
+    a, b = pool.acquire(1), pool.acquire(2)
+    pool.release_all([a, b])
+    again = {id(pool.acquire(3)), id(pool.acquire(4))}
+    assert again == {id(a), id(b)} and pool.created == 2
+    assert pool.acquire(5).value == 5 and pool.created == 3
+
+
+def test_respects_max_size():
+    pool = ObjectPool(Item, max_size=2)
+    pool.release_all([pool.acquire() for _ in range(5)])
+    assert len(pool) == 2
+    pool.prefill(10)
+    assert len(pool) == 2
+
+
+@pytest.mark.skipif(not __debug__, reason="la verificación es solo con asserts activos")
+def test_double_release_is_rejected():
+    pool = ObjectPool(Item)
+    a, b = pool.acquire(), pool.acquire()
+    pool.release(a)
+    with pytest.raises(AssertionError):
+        pool.release(a)
+    with pytest.raises(AssertionError):
+        pool.release_all([b, a])
+    with pytest.raises(AssertionError):
+        pool.release_all([b, b])
+    assert len(pool) == 1
@@ -0,0 +1,29 @@
+"""Anillo de proyectiles: un snapshot restaurado sigue pisando los mismos slots que el original."""
+import json
+import random
+
+from core.projectiles import OWNER_ENEMY, OWNER_PLAYER, ProjectileManager
+
+
+def _fire(manager: ProjectileManager, rng: random.Random, n: int) -> list[int]:
+    return [manager.spawn(rng.uniform(0, 800), rng.uniform(0, 600), rng.uniform(-400, 400), 0,
+                          rng.choice((OWNER_PLAYER, OWNER_ENEMY))) for _ in range(n)]
+
+
+def test_restore_keeps_ring_head_and_sequence():
+    rng = random.Random(4)
+    original = ProjectileManager(capacity=16)
+    _fire(original, rng, 37)  # da la vuelta al anillo: la cabeza no está en 0
+    original.kill([3, 9])
+    snap = json.loads(json.dumps(original.snapshot()))
+
+    restored = ProjectileManager(capacity=16)
+    _fire(restored, random.Random(99), 5)
+    restored.restore(snap)
+    assert restored.snapshot() == original.snapshot()
+    assert restored.counts == original.counts
+
+    # Mismos disparos después del restore: mismos slots pisados y mismo estado
+    assert _fire(restored, random.Random(1), 20) == _fire(original, random.Random(1), 20)
+    assert restored.snapshot() == original.snapshot()
+    assert restored.counts == original.counts
@@ -0,0 +1,74 @@
+"""Determinismo de replays: grabar, guardar, cargar y buscar reproduce el mismo estado."""
+import json
+import zlib
+
+import pytest
+
+from core import replay as replay_mod
+from core.replay import Replay, ReplayPlayer, ReplayRecorder
+from core.simulation import GameState, autopilot, step
+
+TICKS = 2500
+CHECKPOINTS = (0, 1, 599, 600, 601, 1234, 1800, TICKS)
+
+
+def _plain(snap: dict) -> dict:
+    """Snapshot con los tipos que deja JSON (tuplas -> listas) para comparar."""
+    return json.loads(json.dumps(snap))
+
+
+def _record(tmp_path, seed: int = 7, swarm: bool = False, interval: int = 600):
+    """Juega con el autopiloto grabando; retorna la ruta del replay y snapshots por tick."""
+    state = GameState(seed=seed, swarm=swarm)
+    recorder = ReplayRecorder(state, keyframe_interval=interval)
+    expected = {0: _plain(state.snapshot())}
+    for tick in range(1, TICKS + 1):
+        inputs = autopilot(state)
+        recorder.record(state, inputs)
+        step(state, inputs)
+        if tick in CHECKPOINTS:
+            expected[tick] = _plain(state.snapshot())
+    path = tmp_path / "partida.rep"
+    recorder.save(str(path))
+    return path, expected
+
+
+@pytest.mark.parametrize("swarm", [False, True])
+def test_seek_matches_recorded_state(tmp_path, swarm):
+    path, expected = _record(tmp_path, swarm=swarm)
+    player = ReplayPlayer(Replay.load(str(path)))
+    # Hacia adelante, hacia atrás y de nuevo adelante: cada búsqueda da el estado grabado
+    for tick in (*CHECKPOINTS, 1234, 1, TICKS, 600):
+        assert _plain(player.seek(tick).snapshot()) == expected[tick], f"tick {tick}"
+
+
+def test_full_playback_matches_recording(tmp_path):
+    path, expected = _record(tmp_path, seed=123)
+    player = ReplayPlayer(Replay.load(str(path)))
+    assert _plain(player.advance().snapshot()) == expected[TICKS]
+    assert player.tick == TICKS
+
+
+def test_keyframes_survive_save_and_load(tmp_path):
+    path, _ = _record(tmp_path, interval=500)
+    loaded = Replay.load(str(path))
+    assert sorted(loaded.keyframes) == list(range(0, TICKS, 500))
+    assert len(loaded) == TICKS
+
+
+def test_rejects_other_tick_rate(tmp_path):
+    path, _ = _record(tmp_path)
+    data = bytearray(path.read_bytes())
+    header = list(replay_mod._HEADER.unpack_from(data))
+    header[3] = replay_mod.TICK_RATE * 2
+    replay_mod._HEADER.pack_into(data, 0, *header)
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="ticks/s"):
+        Replay.load(str(path))
+
+
+def test_rejects_truncated_file(tmp_path):
+    path, _ = _record(tmp_path)
+    path.write_bytes(path.read_bytes()[:replay_mod._HEADER.size + 10])
+    with pytest.raises((ValueError, zlib.error)):
+        Replay.load(str(path))
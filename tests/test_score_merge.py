@@ -0,0 +1,99 @@
+"""Fusión de puntajes: top-K y deduplicación contra una referencia ingenua (todo en memoria)."""
+import random
+
+import pytest
+
+from core import score_merge
+from core.scores import TopK, parse_line
+
+NAMES = [f"Jugador{i}" for i in range(300)]
+
+
+def _reference(paths) -> list[tuple[bytes, int]]:
+    """Mejor puntaje por jugador leyendo todo, con parse_line y un sort completo."""
+    best: dict[str, tuple[str, int]] = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                rec = parse_line(line)
+                if rec is None:
+                    continue
+                key = rec[0].lower()
+                if key not in best or rec[1] > best[key][1]:
+                    best[key] = rec
+    rows = sorted(best.values(), key=lambda row: row[1], reverse=True)
+    return [(n.encode('utf-8'), p) for n, p in rows]
+
+
+def _write_files(tmp_path, n_files: int = 3, lines: int = 4000, seed: int = 5):
+    """Archivos con jugadores repetidos (en mayúsculas/minúsculas variadas) y líneas inválidas.
+
+    Los puntajes son todos distintos, así el orden del resultado no depende de empates.
+    """
+    rng = random.Random(seed)
+    scores = iter(rng.sample(range(10 ** 7), n_files * lines))
+    paths = []
+    for i in range(n_files):
+        out = []
+        for _ in range(lines):
+            name = rng.choice(NAMES)
+            name = name.upper() if rng.random() < 0.2 else name
+            sep = rng.choice([",", ",", ",", ";", " "])
+            out.append(f"{name}{sep}{next(scores)}\n")
+            if rng.random() < 0.02:
+                out.append(rng.choice(["\n", "sin puntaje\n", ",15\n", "nombre,abc\n"]))
+        path = tmp_path / f"maquina{i}.txt"
+        path.write_text("".join(out), encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+
+def test_dedupe_matches_reference(tmp_path):
+    paths = _write_files(tmp_path)
+    assert score_merge.merge(paths) == _reference(paths)
+
+
+@pytest.mark.parametrize("top", [1, 10, 299, 300, 1000])
+def test_top_matches_reference(tmp_path, top):
+    paths = _write_files(tmp_path)
+    assert score_merge.merge(paths, top=top) == _reference(paths)[:top]
+
+
+def test_small_chunks_do_not_split_lines(tmp_path):
+    paths = _write_files(tmp_path, n_files=1)
+    data = open(paths[0], 'rb').read().splitlines()
+    for chunk_size in (1, 7, 64, 4096):
+        assert list(score_merge.iter_lines(paths[0], chunk_size)) == data
+    assert score_merge.merge(paths) == _reference(paths)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "vacio.txt"
+    path.write_bytes(b"")
+    assert score_merge.merge([str(path)]) == []
+    assert score_merge.merge([str(path)], top=5) == []
+
+
+def test_topk_with_ties_keeps_best_scores():
+    rng = random.Random(11)
+    offers = [(rng.choice(NAMES), rng.randrange(50)) for _ in range(5000)]
+    best: dict[str, int] = {}
+    for name, score in offers:
+        best[name.lower()] = max(score, best.get(name.lower(), score))
+    for k in (0, 1, 5, 40):
+        top = TopK(k)
+        for name, score in offers:
+            top.offer(name, score)
+        items = top.items()
+        # Con empates el jugador elegido puede variar, pero no los puntajes ni su mejor marca
+        assert [p for _, p in items] == sorted(best.values(), reverse=True)[:k]
+        assert all(best[n.lower()] == p for n, p in items)
+
+
+def test_write_round_trip(tmp_path):
+    paths = _write_files(tmp_path)
+    rows = score_merge.merge(paths, top=50)
+    out = tmp_path / "salida.txt"
+    score_merge.write(rows, str(out))
+    assert _reference([str(out)]) == rows
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []